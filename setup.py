@@ -23,7 +23,14 @@ setup(
         "wcdeetlist/parser/islands/heroic_race",
         "wcdeetlist/parser/items",
         "wcdeetlist/parser/items/dragon",
+        "wcdeetlist/storage",
         "wcdeetlist/tools"
     ],
     install_requires=["requests", "bs4", "pydantic"],
+    extras_require={
+        "columnar": ["pyarrow"],
+        "matchup": ["numpy"],
+        "records": ["msgspec"],
+        "simulation": ["numpy"]
+    },
 )
\ No newline at end of file
@@ -0,0 +1,33 @@
+import json
+import os
+
+import pytest
+
+from wcdeetlist.tools.benchmark import load_fixture_corpus
+
+FIXTURES_DIRECTORY = os.path.join(os.path.dirname(os.path.abspath(__file__)), "fixtures")
+CORPUS_DIRECTORY = os.path.join(FIXTURES_DIRECTORY, "corpus")
+
+@pytest.fixture
+def read_fixture():
+    def read(file_name: str) -> str:
+        with open(os.path.join(FIXTURES_DIRECTORY, file_name), "r", encoding="utf-8") as fixture_file:
+            return fixture_file.read()
+
+    return read
+
+@pytest.fixture
+def read_golden():
+    def read(name: str):
+        with open(os.path.join(FIXTURES_DIRECTORY, "golden", f"{name}.json"), "r", encoding="utf-8") as golden_file:
+            return json.load(golden_file)
+
+    return read
+
+@pytest.fixture
+def corpus_directory() -> str:
+    return CORPUS_DIRECTORY
+
+@pytest.fixture
+def corpus(corpus_directory: str) -> dict:
+    return load_fixture_corpus(corpus_directory)
@@ -0,0 +1,35 @@
+import json
+
+from wcdeetlist.tools.benchmark import benchmark_parsers, compare_to_baseline, save_baseline
+
+def test_benchmark_parsers_against_baseline(corpus_directory: str, tmp_path) -> None:
+    results = benchmark_parsers(corpus_directory)
+
+    assert set(results) >= { "AllDragonsParser", "NewDragonsParser", "HeroicRaceParser", "DragonPageParser" }
+
+    for result in results.values():
+        assert result["pages"] > 0
+        assert result["pages_per_second"] > 0
+        assert 0 < result["p50_ms"] <= result["p99_ms"]
+        assert result["peak_memory_bytes"] > 0
+
+    baseline_path = tmp_path / "baseline.json"
+    save_baseline(results, str(baseline_path))
+
+    assert compare_to_baseline(results, str(baseline_path)) == []
+
+    # Um baseline bem mais rápido e econômico faz todas as métricas acusarem regressão
+    baseline = json.loads(baseline_path.read_text(encoding="utf-8"))
+
+    for result in baseline.values():
+        result["pages_per_second"] *= 10
+        result["p50_ms"] /= 10
+        result["p99_ms"] /= 10
+        result["peak_memory_bytes"] /= 10
+
+    baseline_path.write_text(json.dumps(baseline), encoding="utf-8")
+
+    regressions = compare_to_baseline(results, str(baseline_path))
+
+    assert len(regressions) == len(results) * 4
+    assert any(regression.startswith("DragonPageParser: pages_per_second") for regression in regressions)
@@ -0,0 +1,48 @@
+import pytest
+
+pa = pytest.importorskip("pyarrow")
+
+from wcdeetlist.tools.columnar import (
+    CATALOG_TABLES,
+    dragons_to_arrow,
+    export_dragons_arrow,
+    export_dragons_parquet,
+    read_dragons_arrow,
+    read_dragons_parquet
+)
+
+@pytest.fixture
+def dragons(read_golden) -> list:
+    return read_golden("dragon_pages")
+
+def test_dragons_to_arrow(dragons: list) -> None:
+    tables = dragons_to_arrow(dragons)
+
+    assert tables["dragons"].column("name").to_pylist() == [ dragon["name"] for dragon in dragons ]
+    assert tables["dragons"].schema.field("rarity").type == pa.dictionary(pa.int8(), pa.string())
+    assert tables["attacks"].num_rows == sum(len(attacks) for dragon in dragons for attacks in dragon["attacks"].values())
+    assert tables["weaknesses"].column("element").to_pylist() == [ element for dragon in dragons for element in dragon["weaknesses"] ]
+
+@pytest.mark.parametrize("export, read", [
+    (export_dragons_parquet, read_dragons_parquet),
+    (export_dragons_arrow, read_dragons_arrow)
+])
+def test_round_trip(dragons: list, tmp_path, export, read) -> None:
+    expected = dragons_to_arrow(dragons)
+
+    export(dragons, str(tmp_path))
+    tables = read(str(tmp_path))
+
+    assert set(tables) == set(CATALOG_TABLES)
+
+    for table_name in CATALOG_TABLES:
+        assert tables[table_name].equals(expected[table_name])
+
+def test_arrow_read_is_zero_copy(dragons: list, tmp_path) -> None:
+    export_dragons_arrow(dragons * 100, str(tmp_path))
+
+    allocated_before = pa.total_allocated_bytes()
+    tables = read_dragons_arrow(str(tmp_path))
+
+    assert tables["attacks"].num_rows > 0
+    assert pa.total_allocated_bytes() == allocated_before
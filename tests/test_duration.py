@@ -0,0 +1,49 @@
+import pytest
+
+from wcdeetlist.parser.duration import parse_duration, parse_labeled_duration
+from wcdeetlist.tools import benchmark
+
+@pytest.mark.parametrize("raw_duration, seconds", [
+    ("2hr 30min", 2 * 3600 + 30 * 60),
+    ("1 day 4 hrs", 86400 + 4 * 3600),
+    ("12 Hours", 12 * 3600),
+    ("3 days", 3 * 86400),
+    ("60 minutes", 3600),
+    ("Instant", 0),
+    ("No minimum", 0)
+])
+def test_parse_duration(raw_duration: str, seconds: int) -> None:
+    assert parse_duration(raw_duration) == seconds
+
+@pytest.mark.parametrize("raw_duration, seconds", [
+    ("Breed Time: 2 days (48 Hours)", 48 * 3600),
+    ("Hatch Time: 2hr 30min", 2 * 3600 + 30 * 60),
+    ("Summon Time: Instant", 0)
+])
+def test_parse_labeled_duration(raw_duration: str, seconds: int) -> None:
+    assert parse_labeled_duration(raw_duration) == seconds
+
+@pytest.mark.parametrize("raw_duration", [ "soon", "3 fortnights", "" ])
+def test_parse_duration_rejects_invalid(raw_duration: str) -> None:
+    with pytest.raises(ValueError):
+        parse_duration(raw_duration)
+
+# O strptime com "%d" e sem ano avisa desde o Python 3.13; é o código antigo, de propósito
+@pytest.mark.filterwarnings("ignore::DeprecationWarning")
+@pytest.mark.parametrize("legacy_parse, parse, samples", [
+    (benchmark.legacy_pool_time_to_seconds, parse_duration, benchmark.LEGACY_POOL_TIME_SAMPLES),
+    (benchmark.legacy_breed_time, parse_labeled_duration, benchmark.LEGACY_BREED_TIME_SAMPLES),
+    (benchmark.legacy_attack_training_time, parse_duration, benchmark.LEGACY_TRAINING_TIME_SAMPLES)
+])
+def test_legacy_baseline_agrees(legacy_parse, parse, samples: tuple) -> None:
+    # O benchmark só compara velocidades se os dois lados dão o mesmo resultado
+    for raw_duration in samples:
+        assert legacy_parse(raw_duration) == parse(raw_duration)
+
+@pytest.mark.filterwarnings("ignore::DeprecationWarning")
+def test_benchmark_durations() -> None:
+    results = benchmark.benchmark_durations(iterations=100)
+
+    for name in ("pool_time", "breed_time", "attack_training_time"):
+        assert set(results[name]) == { "strptime_per_second", "uncached_per_second", "cached_per_second" }
+        assert all(value > 0 for value in results[name].values())
@@ -0,0 +1,122 @@
+import pytest
+
+from wcdeetlist.crawler import RequestError
+from wcdeetlist.parser import HeroicDragonsParser
+from wcdeetlist.tools import core
+
+RACE_PAGE_URLS = [
+    "https://deetlist.com/dragoncity/dragon/hero0",
+    "https://deetlist.com/dragoncity/dragon/Hero_1",
+    "https://deetlist.com/dragoncity/dragon/Other"
+]
+
+def test_iter_all(read_fixture) -> None:
+    dragons = HeroicDragonsParser(read_fixture("heroic_report.html")).get_all()
+
+    assert dragons == [
+        {
+            "rarity": "H",
+            "name": "Hero0",
+            "page_url": "https://deetlist.com/dragoncity/dragon/Hero0",
+            "elements": [ "flame", "dark" ],
+            "category": 9,
+            "book_id": 501,
+            "strengths": [ "sea", "nature" ],
+            "weaknesses": [ "terra" ],
+            "is_breedable": False,
+            "image_url": "https://deetlist.com/dragoncity/img/dragons/hero0.png"
+        },
+        {
+            "rarity": "H",
+            "name": "Hero 1",
+            "page_url": "https://deetlist.com/dragoncity/dragon/Hero%201",
+            "elements": [ "light" ],
+            "category": 9,
+            "book_id": 502,
+            "strengths": [ "dark" ],
+            "weaknesses": [ "chaos" ],
+            "is_breedable": False,
+            "image_url": "https://deetlist.com/dragoncity/img/dragons/hero1.png"
+        },
+        {
+            "rarity": "H",
+            "name": "Sem link",
+            "elements": [ "flame" ],
+            "category": 9,
+            "book_id": None,
+            "strengths": [],
+            "weaknesses": [],
+            "is_breedable": True
+        }
+    ]
+
+def test_get_fields(read_fixture) -> None:
+    parser = HeroicDragonsParser(read_fixture("heroic_report.html"))
+
+    assert parser.get_fields() == [ "book_id", "category", "elements", "is_breedable", "name", "rarity", "strengths", "weaknesses" ]
+
+@pytest.fixture
+def heroic_race(monkeypatch: pytest.MonkeyPatch, read_fixture) -> dict:
+    state = { "report_html": read_fixture("heroic_report.html"), "report_requests": 0, "fetched": [] }
+
+    class FakeHeroicDragonsCrawler:
+        def get_html(self) -> str:
+            state["report_requests"] += 1
+
+            if state["report_html"] is None:
+                raise RequestError("all_heroic.php", 503)
+
+            return state["report_html"]
+
+    def get_dragons_full_data(page_urls, max_workers=1, parse_workers=None, use_memo=True) -> list:
+        state["fetched"].extend(page_urls)
+        return [ { field: f"page:{field}" for field in core.DRAGON_FIELDS } for _ in page_urls ]
+
+    monkeypatch.setattr(core, "HeroicDragonsCrawler", FakeHeroicDragonsCrawler)
+    monkeypatch.setattr(core, "get_dragons_full_data", get_dragons_full_data)
+    monkeypatch.setattr(core, "get_heroic_race_data", lambda: { "duration": 100, "dragon_page_urls": list(RACE_PAGE_URLS), "laps": [] })
+
+    return state
+
+def test_default_fields_come_from_the_report(heroic_race: dict) -> None:
+    data = core.get_heroic_race_full_data()
+
+    assert heroic_race["report_requests"] == 1
+
+    # Só o dragão que não está no relatório é buscado página a página
+    assert heroic_race["fetched"] == [ RACE_PAGE_URLS[2] ]
+    assert "dragon_page_urls" not in data
+    assert data["duration"] == 100
+
+    hero0, hero1, other = data["dragons"]
+
+    assert list(hero0) == [ "name", "rarity", "elements", "image_url", "strengths", "weaknesses", "book_id", "category", "is_breedable" ]
+    assert hero0["book_id"] == 501
+    assert hero1["name"] == "Hero 1"
+    assert other["name"] == "page:name"
+
+def test_fields_missing_from_the_report_fall_back_to_pages(heroic_race: dict) -> None:
+    data = core.get_heroic_race_full_data(fields=("name", "book_id", "attacks"))
+
+    assert heroic_race["fetched"] == RACE_PAGE_URLS
+    assert data["dragons"][0] == { "name": "page:name", "book_id": "page:book_id", "attacks": "page:attacks" }
+
+def test_covered_fields_skip_pages(heroic_race: dict) -> None:
+    data = core.get_heroic_race_full_data(fields=("name", "elements"))
+
+    assert heroic_race["fetched"] == [ RACE_PAGE_URLS[2] ]
+    assert data["dragons"][0] == { "name": "Hero0", "elements": [ "flame", "dark" ] }
+
+def test_unavailable_report_fetches_every_page(heroic_race: dict) -> None:
+    heroic_race["report_html"] = None
+
+    data = core.get_heroic_race_full_data()
+
+    assert heroic_race["fetched"] == RACE_PAGE_URLS
+    assert list(data["dragons"][0]) == list(core.DRAGON_FIELDS)
+
+def test_use_report_false_skips_the_report(heroic_race: dict) -> None:
+    core.get_heroic_race_full_data(use_report=False, fields=("name",))
+
+    assert heroic_race["report_requests"] == 0
+    assert heroic_race["fetched"] == RACE_PAGE_URLS
@@ -0,0 +1,100 @@
+import warnings
+
+import pytest
+
+np = pytest.importorskip("numpy")
+
+from wcdeetlist.tools.heroic_simulation import HeroicRaceModel, simulate_heroic_race
+
+def make_mission(goal_items: int, pool_size: int, per_item: int, item_drop_chance: str) -> dict:
+    return {
+        "type": "collect",
+        "name": "Collect Food",
+        "goal_items": goal_items,
+        "pool_size": pool_size,
+        "pool_time": { "per_item": per_item, "total": None },
+        "item_drop_chance": item_drop_chance
+    }
+
+def make_race(laps: list, duration: int = 10 ** 9) -> dict:
+    return {
+        "duration": duration,
+        "laps": [
+            { "number": lap_number, "nodes": [ { "number": node_number, "missions": missions } for node_number, missions in enumerate(nodes, 1) ] }
+            for lap_number, nodes in enumerate(laps, 1)
+        ]
+    }
+
+@pytest.mark.parametrize("quantile_bits", [ 8, 16, 20 ])
+@pytest.mark.parametrize("goal_items, pool_size, per_item, drop_chance", [
+    (10, 0, 60, 0.25),
+    (10, 5, 60, 0.25),
+    (3, 0, 10, 0.9)
+])
+def test_mean_matches_negative_binomial(quantile_bits: int, goal_items: int, pool_size: int, per_item: int, drop_chance: float) -> None:
+    model = HeroicRaceModel(make_race([ [ [ make_mission(goal_items, pool_size, per_item, f"{drop_chance * 100:g}%") ] ] ]), quantile_bits=quantile_bits)
+    event_times = model.simulate(200_000, seed=1)["event_times"]
+
+    # Com pool_size <= goal_items, o tempo é (goal_items + falhas - pool_size) * per_item
+    expected_mean = (goal_items / drop_chance - pool_size) * per_item
+    expected_deviation = np.sqrt(goal_items * (1 - drop_chance)) / drop_chance * per_item
+
+    assert event_times.mean() == pytest.approx(expected_mean, rel=0.01)
+    assert event_times.std() == pytest.approx(expected_deviation, rel=0.05)
+
+def test_full_drop_chance_is_deterministic() -> None:
+    with warnings.catch_warnings():
+        warnings.simplefilter("error")
+
+        model = HeroicRaceModel(make_race([ [ [ make_mission(10, 3, 60, "100%"), make_mission(2, 5, 60, "100%") ] ] ]))
+        result = model.simulate(1000, seed=1)
+
+    assert np.all(model.time_tables[0] == 7 * 60)
+    assert np.all(model.time_tables[1] == 0)
+    assert np.all(result["event_times"] == 7 * 60)
+
+@pytest.mark.parametrize("item_drop_chance", [ "0%", "150%" ])
+def test_invalid_drop_chance_is_rejected(item_drop_chance: str) -> None:
+    with pytest.raises(ValueError):
+        HeroicRaceModel(make_race([ [ [ make_mission(10, 0, 60, item_drop_chance) ] ] ]))
+
+@pytest.mark.parametrize("laps", [ [], [ [ [] ] ] ])
+def test_empty_event(laps: list) -> None:
+    summary = simulate_heroic_race(make_race(laps, duration=100), trials=1000, seed=1)
+
+    assert summary["trials"] == 1000
+    assert summary["nodes"] == []
+    assert summary["laps"] == []
+    assert summary["event"]["mean"] == 0
+    assert summary["event"]["completion_chance"] == 1
+
+def test_node_completion_modes() -> None:
+    race = make_race([ [ [ make_mission(10, 0, 60, "100%"), make_mission(2, 0, 60, "100%") ] ] ])
+
+    assert HeroicRaceModel(race, "all").simulate(10)["event_times"].tolist() == [ 600 ] * 10
+    assert HeroicRaceModel(race, "any").simulate(10)["event_times"].tolist() == [ 120 ] * 10
+
+def test_laps_add_up_their_nodes() -> None:
+    model = HeroicRaceModel(make_race([
+        [ [ make_mission(10, 0, 60, "50%") ], [ make_mission(5, 0, 30, "25%") ] ],
+        [ [ make_mission(4, 0, 10, "100%") ] ]
+    ]))
+    result = model.simulate(5000, seed=3)
+
+    assert model.laps == [ 1, 2 ]
+    assert np.allclose(result["lap_times"][0], result["node_times"][0] + result["node_times"][1])
+    assert np.all(result["lap_times"][1] == 40)
+    assert np.allclose(result["event_times"], result["lap_times"].sum(axis=0))
+
+def test_simulate_sharded() -> None:
+    model = HeroicRaceModel(make_race([ [ [ make_mission(10, 0, 60, "25%") ] ] ]))
+
+    sharded = model.simulate_sharded(100_001, workers=2, seed=5)
+
+    assert sharded["node_times"].shape == (1, 100_001)
+    assert sharded["lap_times"].shape == (1, 100_001)
+    assert sharded["event_times"].shape == (100_001,)
+    assert sharded["event_times"].mean() == pytest.approx(2400, rel=0.02)
+
+    # A mesma semente gera as mesmas sementes por processo e o mesmo resultado
+    assert np.array_equal(model.simulate_sharded(100_001, workers=2, seed=5)["event_times"], sharded["event_times"])
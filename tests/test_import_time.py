@@ -0,0 +1,37 @@
+import subprocess
+import json
+import sys
+import os
+
+import pytest
+
+from wcdeetlist.tools.benchmark import check_import_budgets
+
+ROOT_DIRECTORY = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+def test_import_budgets(monkeypatch: pytest.MonkeyPatch) -> None:
+    # Os imports medidos rodam em interpretadores novos, que precisam achar o pacote
+    monkeypatch.chdir(ROOT_DIRECTORY)
+
+    assert check_import_budgets() == []
+
+def test_import_is_lazy() -> None:
+    # Um interpretador novo, para que nada importado pelos outros testes conte
+    code = (
+        "import sys, json, wcdeetlist, wcdeetlist.crawler, wcdeetlist.parser, wcdeetlist.tools, wcdeetlist.fetcher; "
+        "print(json.dumps(sorted(name for name in ('bs4', 'requests', 'numpy', 'pydantic') if name in sys.modules)))"
+    )
+    result = subprocess.run([ sys.executable, "-c", code ], cwd=ROOT_DIRECTORY, capture_output=True, text=True, check=True)
+
+    assert json.loads(result.stdout) == []
+
+def test_lazy_attributes() -> None:
+    import wcdeetlist
+    from wcdeetlist import crawler
+
+    assert "crawler" in dir(wcdeetlist)
+    assert "HttpTransport" in dir(crawler)
+    assert crawler.HttpTransport is crawler.transport.HttpTransport
+
+    with pytest.raises(AttributeError, match="no attribute 'Missing'"):
+        crawler.Missing
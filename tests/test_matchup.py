@@ -0,0 +1,99 @@
+import random
+
+import pytest
+
+pytest.importorskip("numpy")
+
+from wcdeetlist.tools.benchmark import benchmark_matchups, get_synthetic_dragons
+from wcdeetlist.tools.matchup import ELEMENT_BITS, ELEMENT_NAMES, ElementIndex, get_element_mask
+
+@pytest.fixture
+def dragons() -> list[dict]:
+    return get_synthetic_dragons(300, seed=7)
+
+@pytest.fixture
+def index(dragons: list[dict]) -> ElementIndex:
+    return ElementIndex(dragons)
+
+def get_score(dragon: dict, team: list[dict]) -> int:
+    return sum(
+        len(set(dragon["strengths"]) & set(enemy["elements"])) - len(set(dragon["weaknesses"]) & set(enemy["elements"]))
+        for enemy in team
+    )
+
+def test_element_mask() -> None:
+    assert sorted(ELEMENT_BITS.values()) == [ 1 << i for i in range(len(ELEMENT_NAMES)) ]
+    assert get_element_mask([]) == 0
+    assert get_element_mask([ "sea", "flame" ]) == ELEMENT_BITS["sea"] | ELEMENT_BITS["flame"]
+    assert get_element_mask([ "flame", "flame" ]) == ELEMENT_BITS["flame"]
+
+    # Abreviações desconhecidas são ignoradas
+    assert get_element_mask([ "flame", "xx" ]) == ELEMENT_BITS["flame"]
+
+def test_index_matrices(index: ElementIndex, dragons: list[dict]) -> None:
+    for i, dragon in enumerate(dragons):
+        assert int(index.element_masks[i]) == get_element_mask(dragon["elements"])
+        assert [ ELEMENT_NAMES[j] for j in index.elements_matrix[i].nonzero()[0] ] == [
+            element for element in ELEMENT_NAMES if element in dragon["elements"]
+        ]
+        assert index.strengths_matrix[i].sum() == len(dragon["strengths"])
+        assert index.weaknesses_matrix[i].sum() == len(dragon["weaknesses"])
+
+def test_find_matches_scan(index: ElementIndex, dragons: list[dict]) -> None:
+    rng = random.Random(1)
+    queries = [
+        {
+            "elements": rng.sample(ELEMENT_NAMES, rng.randint(0, 2)),
+            "strengths": rng.sample(ELEMENT_NAMES, rng.randint(0, 2)),
+            "weaknesses": rng.sample(ELEMENT_NAMES, rng.randint(0, 1)),
+            "not_weaknesses": rng.sample(ELEMENT_NAMES, rng.randint(0, 3))
+        }
+        for _ in range(50)
+    ]
+
+    results = index.find_many(queries)
+
+    for query, positions in zip(queries, results):
+        expected = [
+            dragon["name"]
+            for dragon in dragons
+            if set(query["elements"]) <= set(dragon["elements"])
+            and set(query["strengths"]) <= set(dragon["strengths"])
+            and set(query["weaknesses"]) <= set(dragon["weaknesses"])
+            and set(dragon["weaknesses"]).isdisjoint(query["not_weaknesses"])
+        ]
+
+        assert index.names[positions].tolist() == expected
+        assert index.find(**query) == expected
+
+def test_best_counters_match_scan(index: ElementIndex, dragons: list[dict]) -> None:
+    rng = random.Random(2)
+    teams = [ rng.sample(dragons, rng.randint(1, 4)) for _ in range(20) ]
+
+    many = index.get_best_counters_many([ [ dragon["name"] for dragon in team ] for team in teams ], limit=15)
+
+    for team, counters in zip(teams, many):
+        scores = [ get_score(dragon, team) for dragon in dragons ]
+
+        # Empates ficam na ordem do catálogo, como no argsort estável
+        best = sorted(range(len(dragons)), key=lambda i: -scores[i])[:15]
+        expected = [ (dragons[i]["name"], scores[i]) for i in best ]
+
+        assert index.get_best_counters([ dragon["name"] for dragon in team ], limit=15) == expected
+        assert counters == expected
+
+def test_matchup_matrix(index: ElementIndex, dragons: list[dict]) -> None:
+    matrix = index.get_matchup_matrix()
+
+    assert matrix.shape == (len(dragons), len(dragons))
+
+    for i, j in [ (0, 0), (0, 1), (17, 250), (299, 3) ]:
+        assert matrix[i, j] == get_score(dragons[i], [ dragons[j] ])
+
+def test_benchmark_matchups() -> None:
+    result = benchmark_matchups(dragons=500, queries=20, teams=5)
+
+    assert result["dragons"] == 500
+    assert result["queries_per_second"] > 0
+    assert result["scan_queries_per_second"] > 0
+    assert result["teams_per_second"] > 0
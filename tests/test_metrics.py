@@ -0,0 +1,79 @@
+import pytest
+
+from wcdeetlist.metrics import Metrics
+
+def get_metrics() -> Metrics:
+    metrics = Metrics(enabled=True)
+    metrics.increment("http_requests", status=200)
+    metrics.increment("http_requests", status=503)
+    metrics.increment("http_requests", status="timeout")
+    metrics.increment("cache", result="hit")
+    metrics.observe("http_request", 0.5, host="deetlist.com")
+    metrics.observe("http_request", 0.25, host="example.com")
+    metrics.observe("http_request", 0.75, host="deetlist.com")
+    metrics.observe("parse", 0.125, parser='Dragon"Page')
+
+    return metrics
+
+def get_families(text: str) -> list:
+    families = []
+
+    for line in text.splitlines():
+        if line.startswith("# TYPE "):
+            _, _, name, type_ = line.split(" ")
+            families.append((name, type_, []))
+        else:
+            families[-1][2].append(line.split("{")[0].split(" ")[0])
+
+    return families
+
+def test_prometheus_families_are_contiguous() -> None:
+    families = get_families(get_metrics().to_prometheus())
+    names = [name for name, _, _ in families]
+
+    assert len(names) == len(set(names))
+    assert ("wcdeetlist_http_request_seconds", "summary") in [(name, type_) for name, type_, _ in families]
+
+    for name, type_, samples in families:
+        assert samples
+
+        if type_ == "summary":
+            assert set(samples) == {f"{name}_count", f"{name}_sum"}
+        else:
+            assert set(samples) == {name}
+
+def test_prometheus_max_follows_summary() -> None:
+    families = get_families(get_metrics().to_prometheus())
+    names = [name for name, _, _ in families]
+    summary = names.index("wcdeetlist_http_request_seconds")
+
+    assert names[summary + 1] == "wcdeetlist_http_request_seconds_max"
+    assert families[summary + 1][1] == "gauge"
+    assert len(families[summary + 1][2]) == 2
+
+def test_prometheus_output_parses() -> None:
+    parser = pytest.importorskip("prometheus_client.parser")
+    families = {family.name: family for family in parser.text_string_to_metric_families(get_metrics().to_prometheus())}
+
+    assert families["wcdeetlist_http_requests"].type == "counter"
+    assert {sample.labels["status"] for sample in families["wcdeetlist_http_requests"].samples} == {"200", "503", "timeout"}
+
+    summary = families["wcdeetlist_http_request_seconds"]
+    maximum = families["wcdeetlist_http_request_seconds_max"]
+
+    assert summary.type == "summary"
+    assert maximum.type == "gauge"
+    assert {(sample.name, sample.labels["host"]): sample.value for sample in summary.samples} == {
+        ("wcdeetlist_http_request_seconds_count", "deetlist.com"): 2,
+        ("wcdeetlist_http_request_seconds_sum", "deetlist.com"): 1.25,
+        ("wcdeetlist_http_request_seconds_count", "example.com"): 1,
+        ("wcdeetlist_http_request_seconds_sum", "example.com"): 0.25,
+    }
+    assert {sample.labels["host"]: sample.value for sample in maximum.samples} == {"deetlist.com": 0.75, "example.com": 0.25}
+    assert families["wcdeetlist_parse_seconds"].samples[0].labels["parser"] == 'Dragon"Page'
+
+def test_disabled_metrics_export_nothing() -> None:
+    metrics = Metrics()
+    metrics.increment("http_requests", status=200)
+
+    assert metrics.to_prometheus() == "\n"
@@ -0,0 +1,90 @@
+import importlib.util
+
+import pytest
+
+from wcdeetlist.parser import (
+    AllDragonsParser,
+    AllDragonsFeedParser,
+    NewDragonsParser,
+    NewDragonsFeedParser,
+    HeroicRaceParser,
+    DragonPageParser
+)
+
+# O lxml é opcional; sem ele os casos desse backend são pulados
+BACKENDS = [
+    "html.parser",
+    pytest.param("lxml", marks=pytest.mark.skipif(importlib.util.find_spec("lxml") is None, reason="lxml não instalado"))
+]
+
+@pytest.mark.parametrize("backend", BACKENDS)
+@pytest.mark.parametrize("restricted", [ False, True ])
+def test_all_dragons(corpus: dict, read_golden, backend: str, restricted: bool) -> None:
+    parser = AllDragonsParser(corpus["all_dragons"][0], backend, restricted)
+    expected = read_golden("all_dragons")
+
+    assert parser.get_all() == expected
+    assert parser.get_names() == [ dragon["name"] for dragon in expected ]
+    assert parser.get_page_urls() == [ dragon["page_url"] for dragon in expected ]
+    assert parser.get_img_urls() == [ dragon["img_url"] for dragon in expected ]
+
+@pytest.mark.parametrize("chunk_size", [ None, 1, 97 ])
+def test_all_dragons_feed(corpus: dict, read_golden, chunk_size: int) -> None:
+    html = corpus["all_dragons"][0]
+    chunks = [ html ] if chunk_size is None else [ html[i:i + chunk_size] for i in range(0, len(html), chunk_size) ]
+
+    assert list(AllDragonsFeedParser().iter_feed(chunks)) == read_golden("all_dragons")
+
+@pytest.mark.parametrize("backend", BACKENDS)
+@pytest.mark.parametrize("restricted", [ False, True ])
+def test_new_dragons(corpus: dict, read_golden, backend: str, restricted: bool) -> None:
+    parser = NewDragonsParser(corpus["new_dragons"][0], backend, restricted)
+    expected = read_golden("new_dragons")
+
+    assert parser.get_all() == expected
+    assert [ dragon.to_dict() for dragon in parser.get_all(as_record=True) ] == expected
+
+@pytest.mark.parametrize("chunk_size", [ None, 1, 97 ])
+def test_new_dragons_feed(corpus: dict, read_golden, chunk_size: int) -> None:
+    html = corpus["new_dragons"][0]
+    chunks = [ html ] if chunk_size is None else [ html[i:i + chunk_size] for i in range(0, len(html), chunk_size) ]
+
+    assert list(NewDragonsFeedParser().iter_feed(chunks)) == read_golden("new_dragons")
+    assert [ dragon.to_dict() for dragon in NewDragonsFeedParser(as_record=True).iter_feed(chunks) ] == read_golden("new_dragons")
+
+@pytest.mark.parametrize("backend", BACKENDS)
+def test_heroic_race(corpus: dict, read_golden, backend: str) -> None:
+    parser = HeroicRaceParser(corpus["heroic_race"][0], backend)
+    expected = read_golden("heroic_race")
+
+    assert parser.get_all() == expected
+    assert parser.get_all(as_record=True).to_dict() == expected
+
+@pytest.mark.parametrize("backend", BACKENDS)
+def test_dragon_pages(corpus: dict, read_golden, backend: str) -> None:
+    expected = read_golden("dragon_pages")
+
+    assert [ DragonPageParser(html, backend).get_all() for html in corpus["dragon_pages"] ] == expected
+    assert [ DragonPageParser(html, backend).get_all(as_record=True).to_dict() for html in corpus["dragon_pages"] ] == expected
+
+@pytest.mark.parametrize("backend", BACKENDS)
+def test_dragon_page_without_elements(corpus: dict, backend: str) -> None:
+    html = corpus["dragon_pages"][0].replace('id="typ_hull"', 'id="typ_hull_removido"')
+
+    assert DragonPageParser(html, backend).get_elements() == []
+
+@pytest.mark.parametrize("backend", BACKENDS)
+def test_dragon_page_missing_id(corpus: dict, backend: str) -> None:
+    html = corpus["dragon_pages"][0].replace('id="dc"', 'id="dc_removido"')
+
+    with pytest.raises(Exception, match="#dc não encontrado"):
+        DragonPageParser(html, backend).get_category()
+
+def test_dragon_page_prices() -> None:
+    parser = DragonPageParser(
+        '<div id="bp"><span class="dt">1500 Gems</span></div>'
+        '<div id="sp"><span class="dt">250 Gold</span></div>'
+    )
+
+    assert parser.get_buy_price() == { "type": "gems", "price": 1500 }
+    assert parser.get_sell_price() == { "type": "gold", "price": 250 }
@@ -0,0 +1,76 @@
+import pytest
+
+pytest.importorskip("pyfilter")
+
+from wcdeetlist.fetcher import LocalizationStore
+from wcdeetlist.parser import HeroicRaceParser
+from wcdeetlist.tools.benchmark import benchmark_translation, iter_record_texts, write_synthetic_localization
+from wcdeetlist.tools.translation import RecordTranslator
+
+@pytest.fixture
+def heroic_race(corpus: dict) -> dict:
+    return HeroicRaceParser(corpus["heroic_race"][0]).get_all()
+
+@pytest.fixture
+def translator(heroic_race: dict, tmp_path) -> RecordTranslator:
+    texts = [ *iter_record_texts(heroic_race), "Flame", "Fire Storm" ]
+    write_synthetic_localization(texts, [ "pt", "es" ], str(tmp_path))
+
+    return RecordTranslator([ "pt", "es" ], cache_directory=str(tmp_path))
+
+def test_translate_text(translator: RecordTranslator) -> None:
+    assert translator.translate_text("Fire Storm", "pt") == "Fire Storm (pt)"
+    assert translator.translate_text("Fire Storm", "es") == "Fire Storm (es)"
+
+    # Os elementos vêm em minúsculas do parser
+    assert translator.translate_text("flame", "pt") == "Flame (pt)"
+
+def test_unknown_text_falls_back_to_source(translator: RecordTranslator) -> None:
+    assert translator.translate_text("Texto que não existe", "pt") == "Texto que não existe"
+    assert translator.translate_text("", "pt") == ""
+    assert translator.translate_text(None, "pt") is None
+
+def test_memo_hit_skips_store(translator: RecordTranslator, monkeypatch: pytest.MonkeyPatch) -> None:
+    assert translator.translate_text("Fire Storm", "pt") == "Fire Storm (pt)"
+
+    lookups = []
+    original_get = LocalizationStore.get
+
+    def get(self, key, default=None):
+        lookups.append(key)
+        return original_get(self, key, default)
+
+    monkeypatch.setattr(LocalizationStore, "get", get)
+
+    assert translator.translate_text("Fire Storm", "pt") == "Fire Storm (pt)"
+    assert lookups == []
+
+    # Outro idioma é outra entrada do memo, mas reaproveita a chave já resolvida
+    assert translator.translate_text("Fire Storm", "es") == "Fire Storm (es)"
+    assert len(lookups) == 1
+
+def test_translate_heroic_race(translator: RecordTranslator, heroic_race: dict) -> None:
+    translated = next(translator.iter_translated([ heroic_race ]))
+
+    assert set(translated) == { "pt", "es" }
+
+    for language, translated_race in translated.items():
+        assert translated_race["duration"] == heroic_race["duration"]
+        assert len(translated_race["laps"]) == len(heroic_race["laps"])
+
+        for lap, translated_lap in zip(heroic_race["laps"], translated_race["laps"]):
+            for node, translated_node in zip(lap["nodes"], translated_lap["nodes"]):
+                for mission, translated_mission in zip(node["missions"], translated_node["missions"]):
+                    assert translated_mission == { **mission, "name": f"{mission['name']} ({language})" }
+
+    # O registro original não é alterado
+    assert not heroic_race["laps"][0]["nodes"][0]["missions"][0]["name"].endswith(")")
+
+def test_benchmark_translation(corpus_directory: str) -> None:
+    result = benchmark_translation(corpus_directory, languages=("pt", "es"), copies=2, repeat=1)
+
+    assert result["records"] > 0
+    assert result["languages"] == 2
+    assert result["strings"] > 0
+    assert result["cold_records_per_second"] > 0
+    assert result["warm_records_per_second"] > 0
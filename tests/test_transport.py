@@ -0,0 +1,89 @@
+import io
+
+import pytest
+import requests
+from requests.adapters import BaseAdapter
+from requests.structures import CaseInsensitiveDict
+
+from wcdeetlist.crawler.archive import ResponseArchive
+from wcdeetlist.crawler.transport import HttpTransport
+
+URL = "https://deetlist.com/dragoncity/all-dragons"
+BODY = ("<p>Dragão</p>\n" * 20_000).encode("utf-8")
+
+class BytesAdapter(BaseAdapter):
+    # Responde qualquer url com o mesmo corpo, lido aos poucos de um BytesIO
+    def __init__(self, body: bytes) -> None:
+        super().__init__()
+        self.body = body
+        self.raws = []
+
+    def send(self, request, **kwargs) -> requests.Response:
+        response = requests.Response()
+        response.status_code = 200
+        response.headers = CaseInsensitiveDict({ "Content-Type": "text/html; charset=utf-8" })
+        response.encoding = "utf-8"
+        response.raw = io.BytesIO(self.body)
+        response.url = request.url
+        response.request = request
+
+        self.raws.append(response.raw)
+
+        return response
+
+    def close(self) -> None:
+        pass
+
+@pytest.fixture
+def adapter() -> BytesAdapter:
+    return BytesAdapter(BODY)
+
+@pytest.fixture
+def archive(tmp_path) -> ResponseArchive:
+    return ResponseArchive(str(tmp_path / "archive"))
+
+def get_transport(adapter: BytesAdapter, archive: ResponseArchive) -> HttpTransport:
+    transport = HttpTransport(archive=archive)
+    transport.session.mount("https://", adapter)
+
+    return transport
+
+def test_record_keeps_streaming(adapter: BytesAdapter, archive: ResponseArchive) -> None:
+    texts = get_transport(adapter, archive).iter_text(URL, chunk_size=1024)
+
+    first_text = next(texts)
+
+    # O primeiro pedaço chega antes de o corpo inteiro ser lido
+    assert 0 < adapter.raws[0].tell() < len(BODY)
+    assert archive.load(URL) is None
+
+    text = first_text + "".join(texts)
+
+    assert text == BODY.decode("utf-8")
+    assert archive.load(URL)["content"] == BODY
+
+    replay_transport = HttpTransport(archive=archive, archive_mode="replay")
+
+    assert "".join(replay_transport.iter_text(URL)) == text
+
+def test_partial_stream_is_not_recorded(adapter: BytesAdapter, archive: ResponseArchive) -> None:
+    texts = get_transport(adapter, archive).iter_text(URL, chunk_size=1024)
+
+    next(texts)
+    texts.close()
+
+    assert archive.load(URL) is None
+
+def test_record_without_stream(adapter: BytesAdapter, archive: ResponseArchive) -> None:
+    transport = get_transport(adapter, archive)
+
+    assert transport.get_text(URL) == BODY.decode("utf-8")
+    assert archive.load(URL)["content"] == BODY
+
+def test_record_stream_content(adapter: BytesAdapter, archive: ResponseArchive) -> None:
+    response = get_transport(adapter, archive).request(URL, stream=True)
+
+    with response:
+        assert response.content == BODY
+
+    assert archive.load(URL)["content"] == BODY
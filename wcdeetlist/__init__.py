@@ -1 +1,17 @@
-from . import crawler, parser
\ No newline at end of file
+from ._lazy import lazy_module
+
+# Subpacotes importados sob demanda: "import wcdeetlist" não carrega requests,
+# bs4 ou pydantic até que algum deles seja acessado
+_LAZY_SUBMODULES = (
+    "config",
+    "crawler",
+    "fetcher",
+    "metrics",
+    "parser",
+    "storage",
+    "tools"
+)
+
+__all__ = list(_LAZY_SUBMODULES)
+
+__getattr__, __dir__ = lazy_module(__name__, dict.fromkeys(_LAZY_SUBMODULES))
@@ -0,0 +1,31 @@
+from typing import Callable, Union
+import importlib
+import sys
+
+def lazy_module(name: str, exports: dict[str, Union[str, None]]) -> tuple[Callable, Callable]:
+    # Monta o __getattr__/__dir__ (PEP 562) de um pacote cujos nomes públicos só
+    # importam o submódulo no primeiro acesso. Cada nome aponta para o submódulo
+    # relativo que o define; None quer dizer que o nome é o próprio submódulo
+    module_globals = vars(sys.modules[name])
+
+    def __getattr__(attribute: str):
+        if attribute not in exports:
+            raise AttributeError(f"module {name!r} has no attribute {attribute!r}")
+
+        module_name = exports[attribute]
+
+        if module_name is None:
+            value = importlib.import_module(f".{attribute}", name)
+
+        else:
+            value = getattr(importlib.import_module(module_name, name), attribute)
+
+        # Os próximos acessos encontram o valor direto, sem passar por aqui
+        module_globals[attribute] = value
+
+        return value
+
+    def __dir__() -> list[str]:
+        return sorted(set(module_globals) | set(exports))
+
+    return __getattr__, __dir__
@@ -1,3 +1,5 @@
+import os
+
 MINUTES_PER_HOUR = 60
 HORS_PER_DAY = 24
 SECONDS_PER_MINUTE = 60
@@ -13,10 +15,31 @@ DEETLIST_URLS = {
     "DRAGONS": {
         "NEW": "https://deetlist.com/dragoncity/new-dragons/",
         "ALL": "https://deetlist.com/dragoncity/all-dragons/",
-        "HEROIC": "https://deetlist.com/dragoncity/dragons/report/all_heroic.php"
+        "HEROIC": "https://deetlist.com/dragoncity/dragons/report/all_heroic.php",
+        "PAGE": "https://deetlist.com/dragoncity/dragon/"
     }
 }
 
+# Tempo (em segundos) que uma resposta guardada em cache continua válida
+# antes de ser revalidada, seguindo a mesma estrutura de DEETLIST_URLS
+DEETLIST_CACHE_TTLS = {
+    "ISLANDS": {
+        "MAZE": SECONDS_PER_HOUR,
+        "HEROIC_RACE": SECONDS_PER_HOUR
+    },
+    "DRAGONS": {
+        "NEW": SECONDS_PER_HOUR,
+        "ALL": SECONDS_PER_DAY,
+        "HEROIC": SECONDS_PER_DAY,
+        "PAGE": SECONDS_PER_DAY * 7
+    }
+}
+
+DEFAULT_CACHE_TTL = SECONDS_PER_HOUR
+LOCALIZATION_CACHE_TTL = SECONDS_PER_DAY
+
+DEFAULT_CACHE_DIRECTORY = os.path.join(os.path.expanduser("~"), ".cache", "wcdeetlist")
+
 DC_LOCALIZATION_ENDPOINT = "https://sp-translations.socialpointgames.com/deploy/dc/android/prod/dc_android_{}_prod_wetd46pWuR8J5CmS.json"
 
 DRAGON_ELEMENTS = {
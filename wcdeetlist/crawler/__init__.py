@@ -1,6 +1,23 @@
-from .islands.heroic_race import HeroicRaceCrawler
-from .items import (
-    DragonPageCrawler,
-    AllDragonsCrawler,
-    NewDragonsCrawler
-)
\ No newline at end of file
+from .._lazy import lazy_module
+
+# Os nomes públicos só importam o submódulo (e requests/bs4 junto) no primeiro acesso
+_LAZY_ATTRIBUTES = {
+    "HeroicRaceCrawler": ".islands.heroic_race",
+    "DragonPageCrawler": ".items",
+    "AllDragonsCrawler": ".items",
+    "NewDragonsCrawler": ".items",
+    "HeroicDragonsCrawler": ".items",
+    "HttpTransport": ".transport",
+    "RequestError": ".transport",
+    "get_default_transport": ".transport",
+    "set_default_transport": ".transport",
+    "HostLimiter": ".scheduler",
+    "PolitenessScheduler": ".scheduler",
+    "DiskCache": ".cache",
+    "ResponseArchive": ".archive",
+    "ArchiveMissError": ".archive"
+}
+
+__all__ = list(_LAZY_ATTRIBUTES)
+
+__getattr__, __dir__ = lazy_module(__name__, _LAZY_ATTRIBUTES)
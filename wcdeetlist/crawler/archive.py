@@ -0,0 +1,78 @@
+from typing import Union
+import threading
+import hashlib
+import json
+import gzip
+import os
+
+ARCHIVED_HEADERS = ("Content-Type", "ETag", "Last-Modified")
+
+class ArchiveMissError(Exception):
+    def __init__(self, url: str) -> None:
+        self.url = url
+
+        super().__init__(f"Nenhuma resposta gravada no arquivo para a url\n> URL: {url}")
+
+class ResponseArchive:
+    __index_file_name = "index.ndjson"
+
+    def __init__(self, directory: str) -> None:
+        self.directory = directory
+        self.__lock = threading.Lock()
+
+        os.makedirs(directory, exist_ok=True)
+
+        self.__keys = {}
+
+        index_path = os.path.join(directory, self.__index_file_name)
+
+        if os.path.exists(index_path):
+            with open(index_path, "r", encoding="utf-8") as index_file:
+                for line in index_file:
+                    if line.strip():
+                        index_entry = json.loads(line)
+                        self.__keys[index_entry["url"]] = index_entry["key"]
+
+    def __get_path(self, key: str) -> str:
+        return os.path.join(self.directory, f"{key}.json.gz")
+
+    def get_urls(self) -> list[str]:
+        with self.__lock:
+            return list(self.__keys)
+
+    def save(self, url: str, status_code: int, headers: dict, content: bytes) -> None:
+        key = hashlib.sha256(url.encode("utf-8")).hexdigest()
+
+        entry = {
+            "url": url,
+            "status_code": status_code,
+            "headers": { name: headers[name] for name in ARCHIVED_HEADERS if name in headers },
+            "content": content.decode("latin-1")
+        }
+
+        with self.__lock:
+            with gzip.open(f"{self.__get_path(key)}.tmp", "wt", encoding="utf-8") as entry_file:
+                json.dump(entry, entry_file)
+
+            os.replace(f"{self.__get_path(key)}.tmp", self.__get_path(key))
+
+            if url not in self.__keys:
+                self.__keys[url] = key
+
+                with open(os.path.join(self.directory, self.__index_file_name), "a", encoding="utf-8") as index_file:
+                    index_file.write(json.dumps({ "url": url, "key": key }) + "\n")
+
+    def load(self, url: str) -> Union[dict, None]:
+        with self.__lock:
+            key = self.__keys.get(url)
+
+        if key is None:
+            return None
+
+        with gzip.open(self.__get_path(key), "rt", encoding="utf-8") as entry_file:
+            entry = json.load(entry_file)
+
+        # O corpo é guardado como latin-1 para que qualquer sequência de bytes caiba no json
+        entry["content"] = entry["content"].encode("latin-1")
+
+        return entry
@@ -0,0 +1,165 @@
+from typing import Union
+import threading
+import hashlib
+import json
+import gzip
+import time
+import os
+
+from ..config import DEETLIST_URLS, DEETLIST_CACHE_TTLS, DEFAULT_CACHE_TTL
+
+def get_url_ttls() -> list[tuple[str, int]]:
+    url_ttls = []
+
+    for group_name, urls in DEETLIST_URLS.items():
+        for url_name, url in urls.items():
+            ttl = DEETLIST_CACHE_TTLS.get(group_name, {}).get(url_name, DEFAULT_CACHE_TTL)
+            url_ttls.append((url, ttl))
+
+    # Prefixos mais longos primeiro, para que a url mais específica ganhe
+    url_ttls.sort(key=lambda url_ttl: len(url_ttl[0]), reverse=True)
+
+    return url_ttls
+
+class DiskCache:
+    def __init__(
+        self,
+        directory: str,
+        max_size: int = 256 * 1024 * 1024,
+        default_ttl: int = DEFAULT_CACHE_TTL
+    ) -> None:
+        self.directory = directory
+        self.max_size = max_size
+        self.default_ttl = default_ttl
+
+        self.__url_ttls = get_url_ttls()
+        self.__lock = threading.Lock()
+
+        os.makedirs(directory, exist_ok=True)
+
+        self.__size = sum(size for _, _, size in self.__list_bodies())
+
+    def __get_paths(self, url: str) -> tuple[str, str]:
+        key = hashlib.sha256(url.encode("utf-8")).hexdigest()
+
+        body_path = os.path.join(self.directory, f"{key}.gz")
+        meta_path = os.path.join(self.directory, f"{key}.json")
+
+        return body_path, meta_path
+
+    def __list_bodies(self) -> list[tuple[str, float, int]]:
+        bodies = []
+
+        for entry in os.scandir(self.directory):
+            if entry.name.endswith(".gz"):
+                stat = entry.stat()
+                bodies.append((entry.path, stat.st_mtime, stat.st_size))
+
+        return bodies
+
+    def get_ttl(self, url: str) -> int:
+        for prefix, ttl in self.__url_ttls:
+            if url.startswith(prefix):
+                return ttl
+
+        return self.default_ttl
+
+    def get(self, url: str) -> Union[dict, None]:
+        body_path, meta_path = self.__get_paths(url)
+
+        try:
+            with open(meta_path, "r", encoding="utf-8") as meta_file:
+                entry = json.load(meta_file)
+
+            with gzip.open(body_path, "rb") as body_file:
+                entry["content"] = body_file.read()
+
+        except (OSError, ValueError):
+            return None
+
+        # A data de modificação do arquivo marca o último acesso, usada na remoção LRU
+        try:
+            os.utime(body_path)
+
+        except OSError:
+            pass
+
+        return entry
+
+    def is_fresh(self, url: str, entry: dict) -> bool:
+        return time.time() - entry["stored_at"] < self.get_ttl(url)
+
+    def set(
+        self,
+        url: str,
+        content: bytes,
+        encoding: Union[str, None] = None,
+        etag: Union[str, None] = None,
+        last_modified: Union[str, None] = None
+    ) -> None:
+        body_path, meta_path = self.__get_paths(url)
+
+        meta = {
+            "url": url,
+            "encoding": encoding,
+            "etag": etag,
+            "last_modified": last_modified,
+            "stored_at": time.time()
+        }
+
+        with self.__lock:
+            old_size = os.path.getsize(body_path) if os.path.exists(body_path) else 0
+
+            with gzip.open(f"{body_path}.tmp", "wb") as body_file:
+                body_file.write(content)
+
+            with open(f"{meta_path}.tmp", "w", encoding="utf-8") as meta_file:
+                json.dump(meta, meta_file)
+
+            os.replace(f"{body_path}.tmp", body_path)
+            os.replace(f"{meta_path}.tmp", meta_path)
+
+            self.__size += os.path.getsize(body_path) - old_size
+
+            if self.__size > self.max_size:
+                self.__evict()
+
+    def revalidate(self, url: str, entry: dict) -> None:
+        _, meta_path = self.__get_paths(url)
+
+        meta = { key: value for key, value in entry.items() if key != "content" }
+        meta["stored_at"] = time.time()
+
+        with self.__lock:
+            with open(f"{meta_path}.tmp", "w", encoding="utf-8") as meta_file:
+                json.dump(meta, meta_file)
+
+            os.replace(f"{meta_path}.tmp", meta_path)
+
+        entry["stored_at"] = meta["stored_at"]
+
+    def __evict(self) -> None:
+        bodies = sorted(self.__list_bodies(), key=lambda body: body[1])
+
+        for body_path, _, size in bodies:
+            if self.__size <= self.max_size:
+                break
+
+            meta_path = body_path.removesuffix(".gz") + ".json"
+
+            for path in (body_path, meta_path):
+                try:
+                    os.remove(path)
+
+                except FileNotFoundError:
+                    pass
+
+            self.__size -= size
+
+    def clear(self) -> None:
+        with self.__lock:
+            for entry in os.scandir(self.directory):
+                if entry.name.endswith((".gz", ".json")):
+                    os.remove(entry.path)
+
+            self.__size = 0
@@ -1,24 +1,33 @@
-from typing import Union
-import requests
+from typing import Iterator, Union
+
+from .transport import HttpTransport, get_default_transport
+from ..metrics import metrics
 
 class WebCrawler:
     def __init__(
         self,
         url: str,
+        transport: Union[HttpTransport, None] = None
     ) -> None:
         self.url = url
+        self.transport = transport
 
     def __request_html(self) -> Union[str, None]:
-        response = requests.get(url=self.url)
+        transport = self.transport or get_default_transport()
 
-        status_code = response.status_code
+        with metrics.time("page_fetch"):
+            html = transport.get_text(self.url)
 
-        if status_code == 200:
-            return response.text
+        metrics.increment("pages_fetched")
 
-        else: 
-            raise Exception(f"Ocorreu um erro ao fazer a requisição\n> STATUS_CODE: {status_code}")
+        return html
 
     def get_html(self) -> str:
         return self.__request_html()
 
+    def iter_html(self, chunk_size: int = 64 * 1024) -> Iterator[str]:
+        transport = self.transport or get_default_transport()
+
+        yield from transport.iter_text(self.url, chunk_size)
+
+        metrics.increment("pages_fetched")
@@ -1,9 +1,13 @@
+from typing import Union
+
 from ..crawler import WebCrawler
+from ..transport import HttpTransport
 
 class HeroicRaceCrawler(WebCrawler):
     __url = "https://deetlist.com/dragoncity/events/race/"
 
     def __init__(
         self,
+        transport: Union[HttpTransport, None] = None
     ) -> None:
-        super().__init__(self.__url)
+        super().__init__(self.__url, transport)
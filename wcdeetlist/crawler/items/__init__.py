@@ -1,5 +1,6 @@
 from .dragon import (
     DragonPageCrawler,
     AllDragonsCrawler,
-    NewDragonsCrawler
+    NewDragonsCrawler,
+    HeroicDragonsCrawler
 )
\ No newline at end of file
@@ -1,3 +1,4 @@
 from .dragon_page import DragonPageCrawler
 from .all_dragons import AllDragonsCrawler
-from .new_dragons import NewDragonsCrawler
\ No newline at end of file
+from .new_dragons import NewDragonsCrawler
+from .heroic_dragons import HeroicDragonsCrawler
\ No newline at end of file
@@ -1,7 +1,10 @@
+from typing import Union
+
 from ...crawler import WebCrawler
+from ...transport import HttpTransport
 
 class AllDragonsCrawler(WebCrawler):
     __url = "https://deetlist.com/dragoncity/all-dragons/"
 
-    def __init__(self):
-        super().__init__(self.__url)
+    def __init__(self, transport: Union[HttpTransport, None] = None):
+        super().__init__(self.__url, transport)
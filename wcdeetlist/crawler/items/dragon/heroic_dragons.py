@@ -0,0 +1,10 @@
+from typing import Union
+
+from ...crawler import WebCrawler
+from ...transport import HttpTransport
+
+class HeroicDragonsCrawler(WebCrawler):
+    __url = "https://deetlist.com/dragoncity/dragons/report/all_heroic.php"
+
+    def __init__(self, transport: Union[HttpTransport, None] = None):
+        super().__init__(self.__url, transport)
@@ -0,0 +1,148 @@
+from email.utils import parsedate_to_datetime
+from urllib.parse import urlsplit
+from typing import Union
+import threading
+import time
+
+THROTTLE_STATUS_CODES = (429, 500, 502, 503, 504)
+
+def parse_retry_after(retry_after: Union[str, None]) -> Union[float, None]:
+    # O Retry-After pode vir em segundos ("120") ou como data HTTP
+    if not retry_after:
+        return None
+
+    retry_after = retry_after.strip()
+
+    if retry_after.isdigit():
+        return float(retry_after)
+
+    try:
+        retry_at = parsedate_to_datetime(retry_after)
+
+    except (TypeError, ValueError):
+        return None
+
+    return max(0.0, retry_at.timestamp() - time.time())
+
+class HostLimiter:
+    def __init__(
+        self,
+        rate: float = 5.0,
+        burst: Union[float, None] = None,
+        initial_concurrency: float = 2.0,
+        min_concurrency: float = 1.0,
+        max_concurrency: float = 32.0,
+        additive_increase: float = 1.0,
+        multiplicative_decrease: float = 0.5,
+        latency_tolerance: float = 2.0,
+        latency_slack: float = 0.05
+    ) -> None:
+        self.rate = rate
+        self.burst = burst or max(1.0, rate)
+        self.tokens = self.burst
+        self.updated_at = time.monotonic()
+
+        self.concurrency = initial_concurrency
+        self.min_concurrency = min_concurrency
+        self.max_concurrency = max_concurrency
+        self.additive_increase = additive_increase
+        self.multiplicative_decrease = multiplicative_decrease
+
+        self.latency_tolerance = latency_tolerance
+        self.latency_slack = latency_slack
+        self.min_latency = None
+
+        self.in_flight = 0
+        self.paused_until = 0.0
+
+        self.__condition = threading.Condition()
+
+    def __refill(self, now: float) -> None:
+        self.tokens = min(self.burst, self.tokens + (now - self.updated_at) * self.rate)
+        self.updated_at = now
+
+    def acquire(self) -> None:
+        with self.__condition:
+            while True:
+                now = time.monotonic()
+
+                if self.paused_until > now:
+                    self.__condition.wait(self.paused_until - now)
+                    continue
+
+                if self.in_flight >= int(self.concurrency):
+                    self.__condition.wait()
+                    continue
+
+                self.__refill(now)
+
+                if self.tokens < 1:
+                    self.__condition.wait((1 - self.tokens) / self.rate)
+                    continue
+
+                self.tokens -= 1
+                self.in_flight += 1
+
+                return
+
+    def release(
+        self,
+        status_code: Union[int, None],
+        latency: float,
+        retry_after: Union[float, None] = None
+    ) -> None:
+        with self.__condition:
+            self.in_flight -= 1
+
+            is_throttled = status_code is None or status_code in THROTTLE_STATUS_CODES
+
+            if not is_throttled:
+                self.min_latency = latency if self.min_latency is None else min(self.min_latency, latency)
+
+            is_slow = (
+                self.min_latency is not None
+                and latency > self.min_latency * self.latency_tolerance + self.latency_slack
+            )
+
+            # AIMD: cresce devagar enquanto o host responde bem e corta pela
+            # metade ao primeiro sinal de sobrecarga (erro, 429 ou latência alta)
+            if is_throttled or is_slow:
+                self.concurrency = max(self.min_concurrency, self.concurrency * self.multiplicative_decrease)
+
+            else:
+                self.concurrency = min(self.max_concurrency, self.concurrency + self.additive_increase / self.concurrency)
+
+            if retry_after is not None:
+                self.paused_until = max(self.paused_until, time.monotonic() + retry_after)
+
+            self.__condition.notify_all()
+
+class PolitenessScheduler:
+    def __init__(self, **limiter_options) -> None:
+        self.limiter_options = limiter_options
+
+        self.__limiters = {}
+        self.__lock = threading.Lock()
+
+    def get_limiter(self, url: str) -> HostLimiter:
+        host = urlsplit(url).netloc
+
+        with self.__lock:
+            limiter = self.__limiters.get(host)
+
+            if limiter is None:
+                limiter = HostLimiter(**self.limiter_options)
+                self.__limiters[host] = limiter
+
+            return limiter
+
+    def get_stats(self) -> dict:
+        with self.__lock:
+            return {
+                host: {
+                    "concurrency": limiter.concurrency,
+                    "in_flight": limiter.in_flight,
+                    "min_latency": limiter.min_latency
+                }
+                for host, limiter in self.__limiters.items()
+            }
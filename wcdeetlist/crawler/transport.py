@@ -0,0 +1,347 @@
+from typing import Iterator, Union
+from collections import deque
+import threading
+import codecs
+import random
+import time
+
+from requests.adapters import HTTPAdapter
+import requests
+
+from .archive import ResponseArchive, ArchiveMissError
+from .cache import DiskCache
+from ..metrics import metrics
+from .scheduler import PolitenessScheduler, parse_retry_after
+
+# O urllib3 decodifica br com o brotlicffi ou, sem ele, com o brotli; o
+# cabeçalho só anuncia br quando um dos dois está instalado
+try:
+    import brotlicffi
+
+    ACCEPT_ENCODING = "gzip, deflate, br"
+
+except ImportError:
+    try:
+        import brotli
+
+        ACCEPT_ENCODING = "gzip, deflate, br"
+
+    except ImportError:
+        ACCEPT_ENCODING = "gzip, deflate"
+
+RETRY_STATUS_CODES = (429, 500, 502, 503, 504)
+
+# Falhas de rede que valem uma nova tentativa, incluindo o servidor fechando
+# a conexão no meio do corpo (comum quando ele está limitando as requisições)
+RETRY_EXCEPTIONS = (
+    requests.ConnectionError,
+    requests.Timeout,
+    requests.exceptions.ChunkedEncodingError
+)
+
+class RequestError(Exception):
+    def __init__(self, url: str, status_code: int) -> None:
+        self.url = url
+        self.status_code = status_code
+
+        super().__init__(f"Ocorreu um erro ao fazer a requisição\n> URL: {url}\n> STATUS_CODE: {status_code}")
+
+class HttpTransport:
+    def __init__(
+        self,
+        pool_connections: int = 10,
+        pool_maxsize: int = 10,
+        timeout: Union[float, tuple] = (5, 30),
+        max_retries: int = 3,
+        backoff_factor: float = 0.5,
+        backoff_max: float = 30,
+        retry_after_max: float = 300,
+        max_timings: int = 1000,
+        cache: Union[DiskCache, None] = None,
+        archive: Union[ResponseArchive, None] = None,
+        archive_mode: str = "record",
+        url_rewrites: Union[dict, None] = None,
+        scheduler: Union[PolitenessScheduler, None] = None
+    ) -> None:
+        if archive_mode not in ("record", "replay"):
+            raise ValueError(f"Modo de arquivo desconhecido: {archive_mode}\n> MODOS: record, replay")
+
+        self.cache = cache
+        self.archive = archive
+        self.archive_mode = archive_mode
+        self.url_rewrites = url_rewrites or {}
+        self.scheduler = scheduler
+        self.timeout = timeout
+        self.max_retries = max_retries
+        self.backoff_factor = backoff_factor
+        self.backoff_max = backoff_max
+        self.retry_after_max = retry_after_max
+
+        adapter = HTTPAdapter(pool_connections=pool_connections, pool_maxsize=pool_maxsize)
+
+        self.session = requests.Session()
+        self.session.mount("http://", adapter)
+        self.session.mount("https://", adapter)
+        self.session.headers["Accept-Encoding"] = ACCEPT_ENCODING
+
+        self.timings = deque(maxlen=max_timings)
+        self.__timings_lock = threading.Lock()
+
+    def get_backoff_time(self, attempt: int) -> float:
+        # Backoff exponencial com "full jitter" para que vários workers não
+        # repitam a requisição todos no mesmo instante
+        backoff_time = min(self.backoff_max, self.backoff_factor * (2 ** attempt))
+        return random.uniform(0, backoff_time)
+
+    def __record_timing(self, url: str, status_code: Union[int, None], elapsed: float, attempt: int) -> None:
+        timing = {
+            "url": url,
+            "status_code": status_code,
+            "elapsed": elapsed,
+            "attempt": attempt
+        }
+
+        with self.__timings_lock:
+            self.timings.append(timing)
+
+    def __rewrite_url(self, url: str) -> str:
+        # Permite apontar as urls do deetlist para outro host, como um servidor local de testes
+        for prefix, target in self.url_rewrites.items():
+            if url.startswith(prefix):
+                return target + url[len(prefix):]
+
+        return url
+
+    def __replay(self, url: str) -> requests.Response:
+        entry = self.archive.load(url)
+
+        if entry is None:
+            raise ArchiveMissError(url)
+
+        response = requests.Response()
+        response.url = url
+        response.status_code = entry["status_code"]
+        response.headers.update(entry["headers"])
+        response._content = entry["content"]
+        response._content_consumed = True
+        response.encoding = requests.utils.get_encoding_from_headers(response.headers)
+
+        self.__record_timing(url, response.status_code, 0.0, 0)
+
+        return response
+
+    def request(self, url: str, headers: Union[dict, None] = None, stream: bool = False) -> requests.Response:
+        if self.archive is not None and self.archive_mode == "replay":
+            return self.__replay(url)
+
+        response = self.__send(self.__rewrite_url(url), headers, stream)
+
+        if self.archive is not None and response.status_code == 200:
+            if stream:
+                self.__tee_to_archive(url, response)
+
+            else:
+                self.archive.save(url, response.status_code, response.headers, response.content)
+
+        return response
+
+    def __tee_to_archive(self, url: str, response: requests.Response) -> None:
+        # Com stream o corpo ainda não chegou: os pedaços vão sendo copiados
+        # enquanto quem chamou os consome, e a resposta só é gravada se for lida
+        # até o fim (um corpo pela metade não serve para o replay)
+        iter_content = response.iter_content
+
+        def iter_archived_content(chunk_size: Union[int, None] = 1, decode_unicode: bool = False) -> Iterator:
+            def iter_chunks() -> Iterator[bytes]:
+                chunks = []
+
+                for chunk in iter_content(chunk_size):
+                    chunks.append(chunk)
+                    yield chunk
+
+                self.archive.save(url, response.status_code, response.headers, b"".join(chunks))
+
+            if decode_unicode:
+                return requests.utils.stream_decode_response_unicode(iter_chunks(), response)
+
+            return iter_chunks()
+
+        # response.content e iter_lines também passam pelo iter_content
+        response.iter_content = iter_archived_content
+
+    def __send(self, url: str, headers: Union[dict, None] = None, stream: bool = False) -> requests.Response:
+        limiter = self.scheduler.get_limiter(url) if self.scheduler is not None else None
+        attempt = 0
+
+        while True:
+            if limiter is not None:
+                limiter.acquire()
+
+            response = None
+            retry_after = None
+            started_at = time.perf_counter()
+
+            try:
+                response = self.session.get(url, headers=headers, timeout=self.timeout, stream=stream)
+
+            except RETRY_EXCEPTIONS:
+                self.__record_timing(url, None, time.perf_counter() - started_at, attempt)
+                metrics.increment("http_errors")
+
+                if attempt >= self.max_retries:
+                    raise
+
+            else:
+                elapsed = time.perf_counter() - started_at
+                self.__record_timing(url, response.status_code, elapsed, attempt)
+
+                if metrics.enabled:
+                    # response.elapsed vai até o fim dos cabeçalhos; o resto é a transferência do corpo
+                    metrics.increment("http_requests", status=response.status_code)
+                    metrics.observe("http_headers", response.elapsed.total_seconds())
+                    metrics.observe("http_request", elapsed)
+
+                    if not stream:
+                        metrics.increment("http_bytes", len(response.content))
+
+                if response.status_code in RETRY_STATUS_CODES:
+                    retry_after = parse_retry_after(response.headers.get("Retry-After"))
+
+                    if retry_after is not None:
+                        retry_after = min(self.retry_after_max, retry_after)
+
+            finally:
+                # A vaga sempre volta ao limitador, mesmo com exceções que não são
+                # repetidas; sem resposta, a requisição conta como erro do host
+                if limiter is not None:
+                    limiter.release(
+                        response.status_code if response is not None else None,
+                        time.perf_counter() - started_at,
+                        retry_after
+                    )
+
+            if response is None:
+                metrics.increment("http_retries", reason="connection")
+                time.sleep(self.get_backoff_time(attempt))
+                attempt += 1
+                continue
+
+            if response.status_code in RETRY_STATUS_CODES and attempt < self.max_retries:
+                response.close()
+                metrics.increment("http_retries", reason=response.status_code)
+
+                # O servidor sabe melhor que o backoff quando volta a aceitar requisições
+                if retry_after is not None:
+                    time.sleep(max(retry_after, self.get_backoff_time(attempt)))
+
+                else:
+                    time.sleep(self.get_backoff_time(attempt))
+
+                attempt += 1
+                continue
+
+            return response
+
+    def get(self, url: str, headers: Union[dict, None] = None) -> requests.Response:
+        response = self.request(url, headers)
+
+        if response.status_code != 200:
+            raise RequestError(url, response.status_code)
+
+        return response
+
+    def get_text(self, url: str) -> str:
+        if self.cache is None:
+            return self.get(url).text
+
+        entry = self.cache.get(url)
+
+        if entry is not None and self.cache.is_fresh(url, entry):
+            metrics.increment("cache", result="hit")
+            return entry["content"].decode(entry["encoding"] or "utf-8", errors="replace")
+
+        headers = {}
+
+        if entry is not None:
+            if entry["etag"]:
+                headers["If-None-Match"] = entry["etag"]
+
+            if entry["last_modified"]:
+                headers["If-Modified-Since"] = entry["last_modified"]
+
+        response = self.request(url, headers)
+
+        if response.status_code == 304 and entry is not None:
+            self.cache.revalidate(url, entry)
+            metrics.increment("cache", result="revalidated")
+            return entry["content"].decode(entry["encoding"] or "utf-8", errors="replace")
+
+        if response.status_code != 200:
+            raise RequestError(url, response.status_code)
+
+        metrics.increment("cache", result="miss")
+
+        encoding = response.encoding or response.apparent_encoding
+
+        self.cache.set(
+            url,
+            response.content,
+            encoding,
+            response.headers.get("ETag"),
+            response.headers.get("Last-Modified")
+        )
+
+        return response.content.decode(encoding or "utf-8", errors="replace")
+
+    def iter_text(self, url: str, chunk_size: int = 64 * 1024) -> Iterator[str]:
+        # Com cache o texto sai de uma vez pelo get_text, que cuida da revalidação;
+        # sem cache o corpo é decodificado e entregue enquanto ainda está chegando
+        if self.cache is not None:
+            yield self.get_text(url)
+            return
+
+        response = self.request(url, stream=True)
+
+        try:
+            if response.status_code != 200:
+                raise RequestError(url, response.status_code)
+
+            decoder = codecs.getincrementaldecoder(response.encoding or "utf-8")(errors="replace")
+
+            for chunk in response.iter_content(chunk_size):
+                metrics.increment("http_bytes", len(chunk))
+
+                text = decoder.decode(chunk)
+
+                if text:
+                    yield text
+
+            text = decoder.decode(b"", final=True)
+
+            if text:
+                yield text
+
+        finally:
+            response.close()
+
+    def get_timings(self) -> list[dict]:
+        with self.__timings_lock:
+            return list(self.timings)
+
+_default_transport = None
+_default_transport_lock = threading.Lock()
+
+def get_default_transport() -> HttpTransport:
+    global _default_transport
+
+    with _default_transport_lock:
+        if _default_transport is None:
+            _default_transport = HttpTransport()
+
+        return _default_transport
+
+def set_default_transport(transport: HttpTransport) -> None:
+    global _default_transport
+
+    with _default_transport_lock:
+        _default_transport = transport
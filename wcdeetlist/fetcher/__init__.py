@@ -1 +1,11 @@
-from .game_localization import GameLocalization
\ No newline at end of file
+from .._lazy import lazy_module
+
+# GameLocalization depende de pydantic e pyfilter, que só são importados no primeiro acesso
+_LAZY_ATTRIBUTES = {
+    "GameLocalization": ".game_localization",
+    "LocalizationStore": ".localization_store"
+}
+
+__all__ = list(_LAZY_ATTRIBUTES)
+
+__getattr__, __dir__ = lazy_module(__name__, _LAZY_ATTRIBUTES)
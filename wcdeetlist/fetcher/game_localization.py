@@ -1,23 +1,40 @@
 from pydantic import validate_arguments
 from pyfilter import FromList
-import requests
+from typing import Any, Union
+import logging
+import time
+import os
 
-from ..config import DC_LOCALIZATION_ENDPOINT
+from ..config import (
+    DC_LOCALIZATION_ENDPOINT,
+    DEFAULT_CACHE_DIRECTORY,
+    LOCALIZATION_CACHE_TTL
+)
+from ..crawler.transport import HttpTransport, RequestError, get_default_transport
+from ..metrics import metrics
+from .localization_store import LocalizationStore, iter_json_array
+
+logger = logging.getLogger(__name__)
 
 class GameLocalization:
     @validate_arguments
     def __init__(
         self,
-        language:str
+        language:str,
+        transport: Any = None,
+        cache_directory: Union[str, None] = None
     ) -> None:
         self.__language = language
+        self.__transport: HttpTransport = transport or get_default_transport()
+        self.__cache_directory = cache_directory or DEFAULT_CACHE_DIRECTORY
 
     def get(self) -> list[dict] | None:
-        print("> [localization-fetcher] Coletando dados de localização para tradução de textos e nomes...")
+        logger.info("Coletando dados de localização para tradução de textos e nomes (%s)...", self.__language)
 
-        response = requests.get(DC_LOCALIZATION_ENDPOINT.format(self.__language))
+        with metrics.time("localization_fetch", language=self.__language):
+            response = self.__transport.request(DC_LOCALIZATION_ENDPOINT.format(self.__language))
 
-        print("> [localization-fetcher] Coleta concluída | Analizando resposta...")
+        logger.info("Coleta concluída | Analizando resposta...")
 
         if response.status_code == 200:
             return response.json()
@@ -30,3 +47,46 @@ class GameLocalization:
         localization_dict = FromList(localization).join_keys_of_child_dicts_in_a_new_dict()
 
         return localization_dict
+
+    def get_store(self, max_age: int = LOCALIZATION_CACHE_TTL) -> LocalizationStore:
+        os.makedirs(self.__cache_directory, exist_ok=True)
+
+        store = LocalizationStore(os.path.join(self.__cache_directory, f"localization_{self.__language}.sqlite3"))
+
+        stored_at = store.get_meta("stored_at")
+
+        if stored_at is not None and time.time() - float(stored_at) < max_age:
+            return store
+
+        headers = {}
+
+        if stored_at is not None:
+            etag = store.get_meta("etag")
+            last_modified = store.get_meta("last_modified")
+
+            if etag:
+                headers["If-None-Match"] = etag
+
+            if last_modified:
+                headers["If-Modified-Since"] = last_modified
+
+        url = DC_LOCALIZATION_ENDPOINT.format(self.__language)
+        response = self.__transport.request(url, headers, stream=True)
+
+        with response:
+            if response.status_code == 304 and stored_at is not None:
+                store.set_meta({ "stored_at": str(time.time()) })
+                return store
+
+            if response.status_code != 200:
+                raise RequestError(url, response.status_code)
+
+            localization = iter_json_array(response.iter_content(chunk_size=1024 * 1024))
+
+            store.replace_all(localization, {
+                "stored_at": str(time.time()),
+                "etag": response.headers.get("ETag"),
+                "last_modified": response.headers.get("Last-Modified")
+            })
+
+        return store
@@ -0,0 +1,178 @@
+from typing import Any, Iterable, Iterator, Union
+import threading
+import sqlite3
+import codecs
+import json
+import re
+
+WHITESPACE_PATTERN = re.compile(r"[ \t\n\r]*")
+
+def iter_json_array(chunks: Iterable[bytes], chunk_encoding: str = "utf-8") -> Iterator[Any]:
+    # Decodifica um array json item por item conforme os pedaços chegam, sem
+    # precisar do corpo inteiro da resposta em memória. O buffer é percorrido
+    # por índice e só é cortado uma vez por pedaço
+    decoder = json.JSONDecoder()
+    text_decoder = codecs.getincrementaldecoder(chunk_encoding)()
+
+    chunks = iter(chunks)
+
+    buffer = ""
+    index = 0
+    state = "start"
+    is_final = False
+
+    while not is_final:
+        chunk = next(chunks, None)
+
+        if chunk is None:
+            is_final = True
+            text = text_decoder.decode(b"", final=True)
+
+        else:
+            text = text_decoder.decode(chunk)
+
+        buffer = buffer[index:] + text
+        index = 0
+
+        while True:
+            index = WHITESPACE_PATTERN.match(buffer, index).end()
+
+            if index == len(buffer):
+                break
+
+            if state == "start":
+                if buffer[index] != "[":
+                    raise ValueError("O json de localização deveria começar com uma lista")
+
+                index += 1
+                state = "items"
+                continue
+
+            if state == "end":
+                raise ValueError("Conteúdo inesperado depois do fim da lista de localização")
+
+            if buffer[index] == ",":
+                index += 1
+                continue
+
+            if buffer[index] == "]":
+                index += 1
+                state = "end"
+                continue
+
+            try:
+                item, end = decoder.raw_decode(buffer, index)
+
+            except json.JSONDecodeError as error:
+                if is_final:
+                    raise ValueError("Item inválido no fim do json de localização") from error
+
+                # O item ainda não chegou inteiro, espera o próximo pedaço
+                break
+
+            # Um número no fim do pedaço ainda pode continuar no próximo
+            if end == len(buffer) and not is_final:
+                break
+
+            yield item
+
+            index = end
+
+    if state != "end":
+        raise ValueError("O json de localização terminou antes do fim da lista")
+
+class LocalizationStore:
+    def __init__(self, path: str) -> None:
+        self.path = path
+
+        # Cada thread usa sua própria conexão; o modo WAL deixa vários processos
+        # lerem o mesmo arquivo enquanto um deles grava uma nova versão
+        self.__local = threading.local()
+
+        connection = self.__get_connection()
+
+        with connection:
+            connection.execute("CREATE TABLE IF NOT EXISTS strings (key TEXT PRIMARY KEY, value TEXT NOT NULL)")
+            connection.execute("CREATE TABLE IF NOT EXISTS meta (name TEXT PRIMARY KEY, value TEXT)")
+            connection.execute("CREATE INDEX IF NOT EXISTS strings_value ON strings (value)")
+
+    def __get_connection(self) -> sqlite3.Connection:
+        connection = getattr(self.__local, "connection", None)
+
+        if connection is None:
+            connection = sqlite3.connect(self.path, timeout=30)
+            connection.execute("PRAGMA journal_mode=WAL")
+            connection.execute("PRAGMA synchronous=NORMAL")
+
+            self.__local.connection = connection
+
+        return connection
+
+    def get(self, key: str, default: Union[str, None] = None) -> Union[str, None]:
+        row = self.__get_connection().execute("SELECT value FROM strings WHERE key = ?", (key,)).fetchone()
+        return row[0] if row is not None else default
+
+    def get_key(self, value: str) -> Union[str, None]:
+        row = self.__get_connection().execute("SELECT key FROM strings WHERE value = ? ORDER BY key LIMIT 1", (value,)).fetchone()
+        return row[0] if row is not None else None
+
+    def __getitem__(self, key: str) -> str:
+        value = self.get(key)
+
+        if value is None:
+            raise KeyError(key)
+
+        return value
+
+    def __contains__(self, key: str) -> bool:
+        return self.get(key) is not None
+
+    def __len__(self) -> int:
+        return self.__get_connection().execute("SELECT COUNT(*) FROM strings").fetchone()[0]
+
+    def get_meta(self, name: str) -> Union[str, None]:
+        row = self.__get_connection().execute("SELECT value FROM meta WHERE name = ?", (name,)).fetchone()
+        return row[0] if row is not None else None
+
+    def set_meta(self, meta: dict) -> None:
+        connection = self.__get_connection()
+
+        with connection:
+            connection.executemany("INSERT OR REPLACE INTO meta (name, value) VALUES (?, ?)", meta.items())
+
+    def replace_all(self, localization: Iterable[dict], meta: dict, batch_size: int = 5000) -> int:
+        connection = self.__get_connection()
+
+        count = 0
+        batch = []
+
+        # Tudo numa única transação: quem estiver lendo vê a versão antiga
+        # até o commit, e nunca uma tabela pela metade
+        with connection:
+            connection.execute("DELETE FROM strings")
+
+            for strings in localization:
+                for key, value in strings.items():
+                    if not isinstance(value, str):
+                        value = json.dumps(value, ensure_ascii=False)
+
+                    batch.append((key, value))
+
+                    if len(batch) >= batch_size:
+                        connection.executemany("INSERT OR REPLACE INTO strings (key, value) VALUES (?, ?)", batch)
+                        count += len(batch)
+                        batch.clear()
+
+            connection.executemany("INSERT OR REPLACE INTO strings (key, value) VALUES (?, ?)", batch)
+            count += len(batch)
+
+            connection.executemany("INSERT OR REPLACE INTO meta (name, value) VALUES (?, ?)", meta.items())
+
+        return count
+
+    def close(self) -> None:
+        connection = getattr(self.__local, "connection", None)
+
+        if connection is not None:
+            connection.close()
+            self.__local.connection = None
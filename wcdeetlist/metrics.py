@@ -0,0 +1,199 @@
+from contextlib import contextmanager, nullcontext
+from typing import Callable, Iterator, Union
+import itertools
+import functools
+import threading
+import logging
+import json
+import types
+import time
+
+logger = logging.getLogger(__name__)
+
+_disabled_timer = nullcontext()
+
+def _get_key(name: str, labels: dict) -> tuple:
+    # Os valores viram texto para que status (int) e motivos (str) do mesmo
+    # rótulo possam ser ordenados juntos na exportação
+    return (name, tuple(sorted((key, str(value)) for key, value in labels.items())))
+
+def _escape_label_value(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("\"", "\\\"").replace("\n", "\\n")
+
+def _format_labels(labels: tuple) -> str:
+    if not labels:
+        return ""
+
+    return "{" + ",".join(f'{key}="{_escape_label_value(value)}"' for key, value in labels) + "}"
+
+class Metrics:
+    def __init__(self, enabled: bool = False) -> None:
+        # Com a coleta desligada, increment e time retornam antes de tocar no lock
+        self.enabled = enabled
+
+        self.__counters = {}
+        self.__timers = {}
+        self.__listeners = []
+        self.__lock = threading.Lock()
+
+    def add_listener(self, listener: Callable[[str, dict, float], None]) -> None:
+        # O listener recebe (nome, labels, segundos) a cada medição de tempo
+        self.__listeners.append(listener)
+
+    def remove_listener(self, listener: Callable[[str, dict, float], None]) -> None:
+        self.__listeners.remove(listener)
+
+    def increment(self, name: str, value: float = 1, **labels) -> None:
+        if not self.enabled:
+            return
+
+        key = _get_key(name, labels)
+
+        with self.__lock:
+            self.__counters[key] = self.__counters.get(key, 0) + value
+
+    def observe(self, name: str, seconds: float, **labels) -> None:
+        if not self.enabled:
+            return
+
+        key = _get_key(name, labels)
+
+        with self.__lock:
+            timer = self.__timers.get(key)
+
+            if timer is None:
+                timer = self.__timers[key] = [0, 0.0, 0.0]
+
+            timer[0] += 1
+            timer[1] += seconds
+            timer[2] = max(timer[2], seconds)
+
+        for listener in self.__listeners:
+            listener(name, labels, seconds)
+
+    @contextmanager
+    def __time(self, name: str, labels: dict) -> Iterator[None]:
+        started_at = time.perf_counter()
+
+        try:
+            yield
+
+        finally:
+            self.observe(name, time.perf_counter() - started_at, **labels)
+
+    def time(self, name: str, **labels):
+        if not self.enabled:
+            return _disabled_timer
+
+        return self.__time(name, labels)
+
+    def reset(self) -> None:
+        with self.__lock:
+            self.__counters.clear()
+            self.__timers.clear()
+
+    def get_records(self) -> list[dict]:
+        with self.__lock:
+            counters = list(self.__counters.items())
+            timers = [ (key, list(timer)) for key, timer in self.__timers.items() ]
+
+        records = []
+
+        for (name, labels), value in counters:
+            records.append({ "type": "counter", "name": name, "labels": dict(labels), "value": value })
+
+        for (name, labels), (count, total, maximum) in timers:
+            records.append({
+                "type": "timer",
+                "name": name,
+                "labels": dict(labels),
+                "count": count,
+                "sum": total,
+                "max": maximum
+            })
+
+        return records
+
+    def to_prometheus(self, prefix: str = "wcdeetlist") -> str:
+        with self.__lock:
+            counters = sorted(self.__counters.items(), key=lambda item: item[0])
+            timers = sorted(((key, list(timer)) for key, timer in self.__timers.items()), key=lambda item: item[0])
+
+        lines = []
+
+        # As chaves estão ordenadas pelo nome, então cada família sai de um grupo
+        # contíguo, como o formato de exposição exige
+        for name, group in itertools.groupby(counters, key=lambda item: item[0][0]):
+            metric_name = f"{prefix}_{name}_total"
+            lines.append(f"# TYPE {metric_name} counter")
+
+            for (_, labels), value in group:
+                lines.append(f"{metric_name}{_format_labels(labels)} {value}")
+
+        for name, group in itertools.groupby(timers, key=lambda item: item[0][0]):
+            metric_name = f"{prefix}_{name}_seconds"
+            group = list(group)
+
+            # O resumo (_count/_sum) e o máximo (gauge) são famílias diferentes e
+            # não podem ter as amostras intercaladas
+            lines.append(f"# TYPE {metric_name} summary")
+
+            for (_, labels), (count, total, _) in group:
+                lines.append(f"{metric_name}_count{_format_labels(labels)} {count}")
+                lines.append(f"{metric_name}_sum{_format_labels(labels)} {total:.6f}")
+
+            lines.append(f"# TYPE {metric_name}_max gauge")
+
+            for (_, labels), (_, _, maximum) in group:
+                lines.append(f"{metric_name}_max{_format_labels(labels)} {maximum:.6f}")
+
+        return "\n".join(lines) + "\n"
+
+    def log_records(self, log: Union[logging.Logger, None] = None, level: int = logging.INFO) -> None:
+        # Uma linha JSON por métrica, pronta para ser ingerida como log estruturado
+        log = log or logger
+
+        for record in self.get_records():
+            log.log(level, json.dumps(record, ensure_ascii=False))
+
+metrics = Metrics()
+
+def enable_metrics() -> Metrics:
+    metrics.enabled = True
+    return metrics
+
+def disable_metrics() -> None:
+    metrics.enabled = False
+
+def get_metrics() -> Metrics:
+    return metrics
+
+def timed(name: str, **labels) -> Callable:
+    def decorator(function: Callable) -> Callable:
+        @functools.wraps(function)
+        def wrapper(*args, **kwargs):
+            if not metrics.enabled:
+                return function(*args, **kwargs)
+
+            started_at = time.perf_counter()
+
+            try:
+                return function(*args, **kwargs)
+
+            finally:
+                metrics.observe(name, time.perf_counter() - started_at, **labels)
+
+        return wrapper
+
+    return decorator
+
+def instrument_getters(parser: str) -> Callable:
+    # Mede cada método público "get_*" da classe, rotulado com o parser e o método
+    def decorator(cls: type) -> type:
+        for attribute, value in list(vars(cls).items()):
+            if attribute.startswith("get_") and isinstance(value, types.FunctionType):
+                setattr(cls, attribute, timed("parser", parser=parser, method=attribute)(value))
+
+        return cls
+
+    return decorator
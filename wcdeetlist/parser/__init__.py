@@ -1,2 +1,27 @@
-from .islands.heroic_race import HeroicRaceParser
-from .items import DragonPageParser, AllDragonsParser, NewDragonsParser
\ No newline at end of file
+from .._lazy import lazy_module
+
+# Os nomes públicos só importam o submódulo (e bs4/soupsieve junto) no primeiro acesso
+_LAZY_ATTRIBUTES = {
+    "HeroicRaceParser": ".islands.heroic_race",
+    "DragonPageParser": ".items",
+    "AllDragonsParser": ".items",
+    "NewDragonsParser": ".items",
+    "AllDragonsFeedParser": ".items",
+    "NewDragonsFeedParser": ".items",
+    "HeroicDragonsParser": ".items",
+    "get_default_backend": ".backend",
+    "set_default_backend": ".backend",
+    "Attack": ".records",
+    "Dragon": ".records",
+    "NewDragon": ".records",
+    "Mission": ".records",
+    "Node": ".records",
+    "Lap": ".records",
+    "HeroicRace": ".records",
+    "dump_records": ".records",
+    "load_records": ".records"
+}
+
+__all__ = list(_LAZY_ATTRIBUTES)
+
+__getattr__, __dir__ = lazy_module(__name__, _LAZY_ATTRIBUTES)
@@ -0,0 +1,33 @@
+from typing import Union
+from bs4 import BeautifulSoup, SoupStrainer
+
+from ..metrics import metrics
+
+# Nomes aceitos pelo BeautifulSoup como construtor da árvore. "lxml" e
+# "html5lib" dependem dos pacotes de mesmo nome estarem instalados
+HTML_PARSER_BACKENDS = ("html.parser", "lxml", "html5lib")
+
+_default_backend = "html.parser"
+
+def get_default_backend() -> str:
+    return _default_backend
+
+def set_default_backend(backend: str) -> None:
+    global _default_backend
+
+    if backend not in HTML_PARSER_BACKENDS:
+        raise ValueError(f"Backend de parse desconhecido: {backend}\n> BACKENDS: {', '.join(HTML_PARSER_BACKENDS)}")
+
+    _default_backend = backend
+
+def make_soup(
+    html: Union[str, bytes],
+    backend: Union[str, None] = None,
+    parse_only: Union[SoupStrainer, None] = None
+) -> BeautifulSoup:
+    # Com parse_only só as subárvores aceitas pelo SoupStrainer entram na árvore;
+    # o html5lib não suporta e sempre monta o documento inteiro
+    backend = backend or _default_backend
+
+    with metrics.time("soup_build", backend=backend):
+        return BeautifulSoup(html, backend, parse_only=parse_only)
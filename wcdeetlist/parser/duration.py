@@ -0,0 +1,68 @@
+from functools import lru_cache
+import re
+
+from ..config import (
+    SECONDS_PER_DAY,
+    SECONDS_PER_HOUR,
+    SECONDS_PER_MINUTE
+)
+
+DURATION_UNITS = {
+    "d": SECONDS_PER_DAY,
+    "day": SECONDS_PER_DAY,
+    "days": SECONDS_PER_DAY,
+    "h": SECONDS_PER_HOUR,
+    "hr": SECONDS_PER_HOUR,
+    "hrs": SECONDS_PER_HOUR,
+    "hour": SECONDS_PER_HOUR,
+    "hours": SECONDS_PER_HOUR,
+    "m": SECONDS_PER_MINUTE,
+    "min": SECONDS_PER_MINUTE,
+    "mins": SECONDS_PER_MINUTE,
+    "minute": SECONDS_PER_MINUTE,
+    "minutes": SECONDS_PER_MINUTE,
+    "s": 1,
+    "sec": 1,
+    "secs": 1,
+    "second": 1,
+    "seconds": 1
+}
+
+ZERO_DURATIONS = ("instant", "no minimum")
+
+DURATION_PATTERN = re.compile(r"(?:\s*\d+\s*[a-z]+\s*,?)+")
+DURATION_PART_PATTERN = re.compile(r"(\d+)\s*([a-z]+)")
+PARENTHESIS_PATTERN = re.compile(r"\(([^)]*)\)")
+
+# Converte durações do deetlist ("2hr 30min", "1 day 4 hrs", "12 Hours", "Instant"...)
+# em segundos; as mesmas strings se repetem muito entre páginas, daí o cache
+@lru_cache(maxsize=4096)
+def parse_duration(raw_duration: str) -> int:
+    duration = raw_duration.strip().lower()
+
+    if duration in ZERO_DURATIONS:
+        return 0
+
+    if not DURATION_PATTERN.fullmatch(duration):
+        raise ValueError(f"Valor de duração inesperado: {raw_duration}")
+
+    seconds = 0
+
+    for amount, unit in DURATION_PART_PATTERN.findall(duration):
+        if unit not in DURATION_UNITS:
+            raise ValueError(f"Unidade de duração inesperada: {unit} em {raw_duration}")
+
+        seconds += int(amount) * DURATION_UNITS[unit]
+
+    return seconds
+
+# Durações com rótulo, como "Breed Time: 2 days (48 Hours)", usam o valor entre
+# parênteses quando existir e, senão, o que vem depois dos dois pontos
+@lru_cache(maxsize=4096)
+def parse_labeled_duration(raw_duration: str) -> int:
+    parenthesis_match = PARENTHESIS_PATTERN.search(raw_duration)
+
+    if parenthesis_match is not None:
+        return parse_duration(parenthesis_match.group(1))
+
+    return parse_duration(raw_duration.split(":")[-1])
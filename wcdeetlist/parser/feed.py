@@ -0,0 +1,26 @@
+from html.parser import HTMLParser
+from typing import Iterable, Iterator
+
+class FeedParser(HTMLParser):
+    # Base dos parsers incrementais: recebem o HTML em pedaços (feed) e vão
+    # liberando os itens completos sem montar a árvore do documento
+    def __init__(self) -> None:
+        super().__init__(convert_charrefs=True)
+        self.results = []
+
+    def drain(self) -> list:
+        results = self.results
+        self.results = []
+
+        return results
+
+    def iter_feed(self, chunks: Iterable[str]) -> Iterator:
+        for chunk in chunks:
+            self.feed(chunk)
+            yield from self.drain()
+
+        self.close()
+        yield from self.drain()
+
+    def get_all(self, html: str) -> list:
+        return list(self.iter_feed([ html ]))
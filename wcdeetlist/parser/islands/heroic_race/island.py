@@ -1,12 +1,31 @@
-from typing import List, Union
-from bs4 import BeautifulSoup
+from typing import Iterator, List, Union
 
-from .lap import LapParser
+from .mission import MissionParser
+from ...backend import make_soup
+from ...records import HeroicRace, Lap, Mission, Node
+from ....metrics import instrument_getters
 from ....config import SECONDS_PER_DAY
 
+def parse_lap_and_node_numbers(text: str) -> tuple[int, int]:
+    # Os cabeçalhos têm o formato "Lap 1 - Node 3"
+    lap_text, node_text = text.split("-")[:2]
+    return int(lap_text.replace("Lap", "")), int(node_text.replace("Node", ""))
+
+def summarize_missions(missions: List[dict], **fields) -> dict:
+    # Missões sem tempo de pool conhecido (None) não entram na soma
+    return {
+        **fields,
+        "missions": len(missions),
+        "goal_items": sum(mission["goal_items"] for mission in missions),
+        "pool_size": sum(mission["pool_size"] for mission in missions),
+        "total_pool_time": sum(mission["pool_time"]["total"] or 0 for mission in missions)
+    }
+
+@instrument_getters("heroic_race")
 class HeroicRaceParser:
-    def __init__(self, html: Union[str, bytes]) -> None:
-        self.__island_soup = BeautifulSoup(html, "html.parser")
+    def __init__(self, html: Union[str, bytes], backend: Union[str, None] = None) -> None:
+        self.__island_soup = make_soup(html, backend)
+        self.__laps = None
 
     def get_island_duration(self) -> int:
         island_duration_txt = self.__island_soup.select_one("div.dur_text").text
@@ -23,20 +42,111 @@ class HeroicRaceParser:
 
         return dragon_page_urls
 
+    def __walk(self) -> Iterator[tuple[str, Union[int, dict]]]:
+        # Um único select devolve voltas, nós e missões na ordem do documento,
+        # então cada um pertence à última volta/nó visto antes dele
+        for soup in self.__island_soup.select("div.hl, div.nn, div.mm"):
+            classes = soup.get("class", [])
+
+            if "mm" in classes:
+                yield "mission", MissionParser(soup).get_all()
+
+            elif "nn" in classes:
+                yield "node", parse_lap_and_node_numbers(soup.select_one("div.nnh").text)[1]
+
+            elif "hl" in classes:
+                yield "lap", parse_lap_and_node_numbers(soup.select_one("div.nnh").text)[0]
+
+    def iter_missions(self) -> Iterator[dict]:
+        lap_number = None
+        node_number = None
+
+        for kind, value in self.__walk():
+            if kind == "lap":
+                lap_number = value
+
+            elif kind == "node":
+                node_number = value
+
+            else:
+                yield {
+                    "lap": lap_number,
+                    "node": node_number,
+                    "type": value["type"],
+                    "name": value["name"],
+                    "goal_items": value["goal_items"],
+                    "pool_size": value["pool_size"],
+                    "pool_time_per_item": value["pool_time"]["per_item"],
+                    "pool_time_total": value["pool_time"]["total"],
+                    "item_drop_chance": value["item_drop_chance"]
+                }
+
     def get_laps(self) -> List[dict]:
-        laps_soup = self.__island_soup.select("div.hl")
-        
-        laps = [ LapParser(lap_soup).get_all() for lap_soup in laps_soup ]
+        if self.__laps is not None:
+            return self.__laps
+
+        laps = []
+
+        for kind, value in self.__walk():
+            if kind == "lap":
+                laps.append({ "number": value, "nodes": [] })
+
+            elif kind == "node":
+                laps[-1]["nodes"].append({ "number": value, "missions": [] })
+
+            else:
+                laps[-1]["nodes"][-1]["missions"].append(value)
+
+        self.__laps = laps
+
+        return laps
+
+    def get_node_summaries(self) -> List[dict]:
+        return [
+            summarize_missions(node["missions"], lap=lap["number"], number=node["number"])
+            for lap in self.get_laps()
+            for node in lap["nodes"]
+        ]
+
+    def get_lap_summaries(self) -> List[dict]:
+        return [
+            summarize_missions(
+                [ mission for node in lap["nodes"] for mission in node["missions"] ],
+                number=lap["number"],
+                nodes=len(lap["nodes"])
+            )
+            for lap in self.get_laps()
+        ]
+
+    def __get_lap_records(self) -> List[Lap]:
+        # Mesmo percurso de get_laps, mas montando os records sem a árvore de dicts
+        laps = []
+
+        for kind, value in self.__walk():
+            if kind == "lap":
+                laps.append(Lap(value, []))
+
+            elif kind == "node":
+                laps[-1].nodes.append(Node(value, []))
+
+            else:
+                laps[-1].nodes[-1].missions.append(Mission.from_dict(value))
 
         return laps
 
-    def get_all(self) -> dict:
+    def get_all(self, as_record: bool = False) -> Union[dict, HeroicRace]:
         island_duration = self.get_island_duration()
         island_dragon_page_urls = self.get_dragon_page_urls()
+
+        if as_record:
+            return HeroicRace(island_duration, island_dragon_page_urls, self.__get_lap_records())
+
         island_laps = self.get_laps()
 
-        return {
+        data = {
             "duration": island_duration,
             "dragon_page_urls": island_dragon_page_urls,
             "laps": island_laps
-        }
\ No newline at end of file
+        }
+
+        return data
\ No newline at end of file
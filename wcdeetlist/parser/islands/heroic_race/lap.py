@@ -2,7 +2,9 @@ from typing import List
 from bs4 import BeautifulSoup
 
 from .node import NodeParser
+from ....metrics import instrument_getters
 
+@instrument_getters("heroic_race_lap")
 class LapParser:
     def __init__(self, lap_soup: BeautifulSoup) -> None:
         self.lap_soup = lap_soup
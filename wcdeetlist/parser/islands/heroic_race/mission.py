@@ -1,13 +1,8 @@
 from bs4 import BeautifulSoup
 from typing import Union, List
-from datetime import datetime
 
-from ....config import (
-    MINUTES_PER_HOUR,
-    SECONDS_PER_DAY,
-    SECONDS_PER_HOUR,
-    SECONDS_PER_MINUTE
-)
+from ...duration import parse_duration
+from ....metrics import instrument_getters
 
 MISSON_TYPES = {
     "Collect Food": "food",
@@ -19,36 +14,14 @@ MISSON_TYPES = {
     "Collect Gold": "gold",
 }
 
-def pool_time_to_seconds(pool_time: str) -> int:
-        pool_time = pool_time.lower()
+def pool_time_to_seconds(pool_time: str) -> Union[int, None]:
+    try:
+        return parse_duration(pool_time)
 
-        if pool_time == "instant" or pool_time == "no minimum":
-            return 0
-        
-        if "minutes" in pool_time:
-            if "60" in pool_time:
-                return 60 * SECONDS_PER_MINUTE
-                
-            minutes = datetime.strptime(pool_time, "%M minutes").minute
-            return minutes * SECONDS_PER_MINUTE
-
-        elif "hours" in pool_time:
-            hours = datetime.strptime(pool_time, "%H hours").hour
-            return hours * SECONDS_PER_HOUR
-
-        elif "hr" in pool_time and "min" in pool_time:
-            hours_and_minutes = datetime.strptime(pool_time, "%Hhr %Mmin")
-            hours = hours_and_minutes.hour
-            minutes = hours_and_minutes.minute
-
-            return (hours * SECONDS_PER_HOUR) + (minutes * SECONDS_PER_MINUTE)
-
-        elif "day" in pool_time:
-            days_and_hours = datetime.strptime(pool_time, "%d day %H hrs")
-            days = days_and_hours.day
-            hours = days_and_hours.hour
-            return (days * SECONDS_PER_DAY) + (hours * MINUTES_PER_HOUR)
+    except ValueError:
+        return None
 
+@instrument_getters("heroic_race_mission")
 class MissionParser:
     def __init__(
         self,
@@ -90,8 +63,8 @@ class MissionParser:
         return total_pool_time_seconds
 
     def get_all(self) -> dict:
-        mission_type = self.get_type()
         mission_name = self.get_name()
+        mission_type = MISSON_TYPES[mission_name]
         goal_items = self.get_goal_items()
         pool_size = self.get_pool_size()
         pool_time = self.get_pool_time()
@@ -2,7 +2,9 @@ from typing import List
 from bs4 import BeautifulSoup
 
 from .mission import MissionParser
+from ....metrics import instrument_getters
 
+@instrument_getters("heroic_race_node")
 class NodeParser:
     def __init__(self, node_soup: BeautifulSoup) -> None:
         self.node_soup = node_soup
@@ -1 +1,8 @@
-from .dragon import DragonPageParser, AllDragonsParser, NewDragonsParser
\ No newline at end of file
+from .dragon import (
+    DragonPageParser,
+    AllDragonsParser,
+    AllDragonsFeedParser,
+    NewDragonsParser,
+    NewDragonsFeedParser,
+    HeroicDragonsParser
+)
\ No newline at end of file
@@ -1,3 +1,4 @@
 from .dragon_page import DragonPageParser
-from .all_dragons import AllDragonsParser
-from .new_dragons import NewDragonsParser
\ No newline at end of file
+from .all_dragons import AllDragonsParser, AllDragonsFeedParser
+from .new_dragons import NewDragonsParser, NewDragonsFeedParser
+from .heroic_dragons import HeroicDragonsParser
\ No newline at end of file
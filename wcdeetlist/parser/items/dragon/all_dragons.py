@@ -1,38 +1,84 @@
-from bs4 import BeautifulSoup
+from typing import Iterator, Union
+from bs4 import SoupStrainer
 
+from ...backend import make_soup
+from ...feed import FeedParser
+from ....metrics import instrument_getters
+
+# Cada dragão da lista é um <a> com um elemento ".drag" dentro, então só os
+# links precisam entrar na árvore no modo restrito
+DRAGONS_STRAINER = SoupStrainer("a")
+
+def get_page_url(href: str) -> str:
+    return href.replace("../", "https://deetlist.com/dragoncity/").replace(" ", "%20")
+
+def get_img_url(href: str) -> str:
+    return href.replace("../", "https://deetlist.com/dragoncity/img/").replace(" ", "%20").lower() + ".png"
+
+@instrument_getters("all_dragons")
 class AllDragonsParser:
-    def __init__(self, html):
-        self.__soup = BeautifulSoup(html, "html.parser")
+    def __init__(self, html, backend: Union[str, None] = None, restricted: bool = False):
+        self.__soup = make_soup(html, backend, DRAGONS_STRAINER if restricted else None)
+        self.__dragons_soup = None
+
+    def __get_dragons_soup(self) -> list:
+        if self.__dragons_soup is None:
+            self.__dragons_soup = self.__soup.select("a:has(.drag)")
+
+        return self.__dragons_soup
 
     def get_names(self) -> list[str]:
-        return [ dragon_soup.text.strip() for dragon_soup in self.__soup.select("a:has(.drag)") ]
+        return [ dragon_soup.text.strip() for dragon_soup in self.__get_dragons_soup() ]
 
     def get_page_urls(self) -> list[str]:
-        return [ 
-            dragon_soup.attrs["href"].replace("../", "https://deetlist.com/dragoncity/").replace(" ", "%20")
-            for dragon_soup in self.__soup.select("a:has(.drag)")
-        ]
+        return [ get_page_url(dragon_soup.attrs["href"]) for dragon_soup in self.__get_dragons_soup() ]
 
     def get_img_urls(self) -> list[str]:
-        return [ 
-            dragon_soup.attrs["href"].replace("../", "https://deetlist.com/dragoncity/img/").replace(" ", "%20").lower() + ".png"
-            for dragon_soup in self.__soup.select("a:has(.drag)")
-        ]
+        return [ get_img_url(dragon_soup.attrs["href"]) for dragon_soup in self.__get_dragons_soup() ]
+
+    def iter_all(self) -> Iterator[dict]:
+        for dragon_soup in self.__get_dragons_soup():
+            href = dragon_soup.attrs["href"]
+
+            yield {
+                "name": dragon_soup.text.strip(),
+                "page_url": get_page_url(href),
+                "img_url": get_img_url(href)
+            }
 
     def get_all(self) -> list[dict]:
-        dragon_infos = []
+        return list(self.iter_all())
 
-        names = self.get_names()
-        page_urls = self.get_page_urls()
-        img_urls = self.get_img_urls()
+class AllDragonsFeedParser(FeedParser):
+    def __init__(self) -> None:
+        super().__init__()
 
-        for name, page_url, img_url in zip(names, page_urls, img_urls):
-            dragon_info = {
-                "name": name,
-                "page_url": page_url,
-                "img_url": img_url
-            }
+        self.__href = None
+        self.__text_parts = []
+        self.__has_drag = False
+
+    def handle_starttag(self, tag: str, attrs: list) -> None:
+        if tag == "a":
+            self.__href = dict(attrs).get("href")
+            self.__text_parts = []
+            self.__has_drag = False
+
+        elif self.__href is not None and "drag" in (dict(attrs).get("class") or "").split():
+            self.__has_drag = True
+
+    def handle_data(self, data: str) -> None:
+        if self.__href is not None:
+            self.__text_parts.append(data)
+
+    def handle_endtag(self, tag: str) -> None:
+        if tag != "a" or self.__href is None:
+            return
+
+        if self.__has_drag:
+            self.results.append({
+                "name": "".join(self.__text_parts).strip(),
+                "page_url": get_page_url(self.__href),
+                "img_url": get_img_url(self.__href)
+            })
 
-            dragon_infos.append(dragon_info)
-        
-        return dragon_infos
\ No newline at end of file
+        self.__href = None
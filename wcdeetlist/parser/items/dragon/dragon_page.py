@@ -1,79 +1,155 @@
 from bs4 import BeautifulSoup
-from typing import List, Union
-from datetime import datetime
+from typing import Iterable, List, Union
 
+from ...backend import make_soup
+from ...duration import parse_duration, parse_labeled_duration
+from ...records import Attack, Dragon
+from ....metrics import instrument_getters
 from ....config import (
-    SECONDS_PER_DAY,
-    SECONDS_PER_HOUR,
-    SECONDS_PER_MINUTE,
     DRAGON_ELEMENTS,
     DRAGON_RARITYS
 )
 
 class TimeParser:
+    @staticmethod
     def breed_time(raw_time: str) -> int:
-        time = summon_or_breed_time.split(":")[1].split("(")[1].removesuffix(")")
-
-        if "Hours" in summon_or_breed_time:
-            hours = int(time.removesuffix(" Hours"))
-            return hours * SECONDS_PER_HOUR
-
-        elif "hr" in summon_or_breed_time and "min" in summon_or_breed_time:
-            times = datetime.strptime(time, "%Hhr %Mmin")
-            hours = times.hour
-            minutes = times.minute
+        try:
+            return parse_labeled_duration(raw_time)
 
-            return (minutes * SECONDS_PER_MINUTE) + (hours * SECONDS_PER_HOUR)
+        except ValueError as error:
+            raise Exception("Valor inesperado em TimeParser > breed_time") from error
 
-        else:
-            raise Exception("Valor inesperado em TimeParser > breed_time")
-    
+    @staticmethod
     def summon_time(raw_time: str) -> int:
         try:
-            return self.breed_time(raw_time)
+            return parse_labeled_duration(raw_time)
 
-        except:
-            raise Exception("Valor inesperado em TimeParser > summon_time")
+        except ValueError as error:
+            raise Exception("Valor inesperado em TimeParser > summon_time") from error
 
+    @staticmethod
     def hatch_time(raw_time: str) -> int:
         try:
-            return self.breed_time(raw_time)
+            return parse_labeled_duration(raw_time)
 
-        except:
-            raise Exception("Valor inesperado em TimeParser > hatch_time")
+        except ValueError as error:
+            raise Exception("Valor inesperado em TimeParser > hatch_time") from error
 
+    @staticmethod
     def attack_training_time(raw_time: str) -> int:
-        if "hours" in raw_time:
-            if raw_time == "24 hours":
-                return 24 * SECONDS_PER_HOUR
+        try:
+            return parse_duration(raw_time)
 
-            hours = datetime.strptime(raw_time, "%H hours").hour
+        except ValueError as error:
+            raise Exception("Valor inesperado em TimeParser > training_time") from error
 
-            return hours * SECONDS_PER_HOUR
-        
-        elif "days" in raw_time:
-            days = datetime.strptime(raw_time, "%d days").day
+def find_in_anchors(anchors: Iterable[BeautifulSoup], class_: str) -> List[BeautifulSoup]:
+    # Mesma saída de um select com combinador: ordem do documento e sem repetir
+    # elementos quando um bloco fica dentro de outro
+    found = {}
 
-            return days * SECONDS_PER_DAY
+    for anchor_soup in anchors:
+        for soup in anchor_soup.find_all(class_=class_):
+            found.setdefault(id(soup), soup)
 
-        else:
-            raise Exception("Valor inesperado em TimeParser > training_time")
+    return list(found.values())
 
+@instrument_getters("dragon_page")
 class DragonPageParser:
-    def __init__(self, page_html: str | bytes) -> None:
-        self.__page_soup = BeautifulSoup(page_html, "html.parser")
+    def __init__(self, page_html: str | bytes, backend: Union[str, None] = None) -> None:
+        self.__page_soup = make_soup(page_html, backend)
+        self.__anchors = None
+
+    def __get_anchors(self) -> dict:
+        # Percorre o documento uma única vez e guarda os elementos de que os
+        # getters partem, em vez de cada getter varrer a página com um seletor
+        if self.__anchors is not None:
+            return self.__anchors
+
+        anchors = {
+            "ids": {},
+            "name": None,
+            "rarity": None,
+            "image": None,
+            "basic_attacks": [],     # p.brtext + div.b_split
+            "trainable_attacks": [], # div.b_split + div.b_split
+            "strengths": [],         # .spc2 + .b_split
+            "weaknesses": []         # .b_split + .b_split
+        }
+
+        for soup in self.__page_soup.find_all(True):
+            classes = soup.attrs.get("class") or ()
+
+            if "id" in soup.attrs:
+                anchors["ids"].setdefault(soup.attrs["id"], soup)
+
+            if soup.name == "h1":
+                anchors["name"] = anchors["name"] or soup
+
+            elif soup.name == "div" and "img_rar" in classes:
+                anchors["rarity"] = anchors["rarity"] or soup
+
+            elif soup.name == "img" and "drg_img" in classes:
+                anchors["image"] = anchors["image"] or soup
+
+            if "b_split" not in classes:
+                continue
+
+            previous_soup = soup.find_previous_sibling(True)
+
+            if previous_soup is None:
+                continue
+
+            previous_classes = previous_soup.attrs.get("class") or ()
+
+            if "b_split" in previous_classes:
+                anchors["weaknesses"].append(soup)
+
+                if soup.name == "div" and previous_soup.name == "div":
+                    anchors["trainable_attacks"].append(soup)
+
+            if "spc2" in previous_classes:
+                anchors["strengths"].append(soup)
+
+            if soup.name == "div" and previous_soup.name == "p" and "brtext" in previous_classes:
+                anchors["basic_attacks"].append(soup)
+
+        self.__anchors = anchors
+
+        return anchors
+
+    def __get_id_soup(self, id: str, required: bool = True) -> Union[BeautifulSoup, None]:
+        id_soup = self.__get_anchors()["ids"].get(id)
+
+        if id_soup is None and required:
+            raise Exception(f"Valor inesperado em DragonPageParser > elemento #{id} não encontrado na página")
+
+        return id_soup
+
+    def __get_attack_soups(self, anchor: str) -> List[BeautifulSoup]:
+        return [
+            attack_soup
+            for attack_soup in find_in_anchors(self.__get_anchors()[anchor], "att_hold")
+            if attack_soup.name == "div"
+        ]
 
     def get_name(self) -> str:
-        name = self.__page_soup.select_one("h1").text
+        name = self.__get_anchors()["name"].text
         return name
 
     def get_rarity(self) -> str:
-        rarity_img = self.__page_soup.select_one("div.img_rar")
+        rarity_img = self.__get_anchors()["rarity"]
         rarity = rarity_img.attrs["class"][0].split("_")[2].upper()
         return rarity
 
     def get_elements(self) -> List[str]:
-        elements_soup = self.__page_soup.select("#typ_hull .typ_i")
+        elements_hull = self.__get_id_soup("typ_hull", required=False)
+
+        # Páginas sem o bloco de elementos (dragões ainda sem dados completos) não têm elementos
+        if elements_hull is None:
+            return []
+
+        elements_soup = elements_hull.select(".typ_i")
 
         elements = []
 
@@ -84,25 +160,28 @@ class DragonPageParser:
         return elements
 
     def get_image_url(self) -> str:
-        image_url = self.__page_soup.select_one("img.drg_img").attrs["src"].replace("../", "https://deetlist.com/dragoncity/")
+        image_url = self.__get_anchors()["image"].attrs["src"].replace("../", "https://deetlist.com/dragoncity/")
         return image_url
 
     def get_description(self) -> str:
-        bio_soup = self.__page_soup.select_one("div#self_bio")
+        bio_soup = self.__get_id_soup("self_bio")
 
         description = bio_soup.text.split("\n")[2].replace("Description:", "").strip()
 
         return description
 
     def get_basic_attacks(self) -> List[dict]:
-        basic_attacks_soup = self.__page_soup.select("p.brtext+ div.b_split div.att_hold")
+        basic_attacks_soup = self.__get_attack_soups("basic_attacks")
 
         basic_attacks = []
 
         for basic_attack_soup in basic_attacks_soup:
-            name = basic_attack_soup.text.split("\n")[2].strip()
-            element = basic_attack_soup.text.split("\n")[3].split("|")[1].strip()
-            damege = basic_attack_soup.text.split("\n")[3].split("|")[0].removeprefix("Damage:").strip()
+            attack_lines = basic_attack_soup.text.split("\n")
+            attack_info = attack_lines[3].split("|")
+
+            name = attack_lines[2].strip()
+            element = attack_info[1].strip()
+            damege = attack_info[0].removeprefix("Damage:").strip()
 
             if damege.isnumeric():
                 damege = int(damege)
@@ -119,15 +198,18 @@ class DragonPageParser:
         return basic_attacks
 
     def get_trainable_attacks(self) -> List[dict]:
-        trainable_attacks_soup = self.__page_soup.select("div.b_split+ div.b_split div.att_hold")
+        trainable_attacks_soup = self.__get_attack_soups("trainable_attacks")
 
         trainable_attacks = []
 
         for trainable_attack_soup in trainable_attacks_soup:
-            name = trainable_attack_soup.text.split("\n")[2].strip()
-            element = trainable_attack_soup.text.split("\n")[3].split("|")[1].strip()
-            damege = trainable_attack_soup.text.split("\n")[3].split("|")[0].replace("Damage:", "").strip()
-            training_time = TimeParser.attack_training_time(trainable_attack_soup.text.split("\n")[3].split("|")[2].strip())
+            attack_lines = trainable_attack_soup.text.split("\n")
+            attack_info = attack_lines[3].split("|")
+
+            name = attack_lines[2].strip()
+            element = attack_info[1].strip()
+            damege = attack_info[0].replace("Damage:", "").strip()
+            training_time = TimeParser.attack_training_time(attack_info[2].strip())
 
             if damege.isnumeric():
                 damege = int(damege)
@@ -145,7 +227,7 @@ class DragonPageParser:
         return trainable_attacks
 
     def get_strengths(self) -> List[str]:
-        strengths_soup = self.__page_soup.select(".spc2+ .b_split .typ_i")
+        strengths_soup = find_in_anchors(self.__get_anchors()["strengths"], "typ_i")
 
         strengths = [ strength.attrs["class"][1].removeprefix("tb_") for strength in strengths_soup ]
 
@@ -156,7 +238,7 @@ class DragonPageParser:
         return strengths
 
     def get_weaknesses(self) -> List[str]:
-        weaknesses_soup = self.__page_soup.select(".b_split+ .b_split .typ_i")
+        weaknesses_soup = find_in_anchors(self.__get_anchors()["weaknesses"], "typ_i")
 
         weaknesses = [ weakness.attrs["class"][1].removeprefix("tb_") for weakness in weaknesses_soup ]
 
@@ -167,25 +249,25 @@ class DragonPageParser:
         return weaknesses
 
     def get_book_id(self) -> int | None:
-        id = self.__page_soup.select_one("#did .dt").text
+        id = self.__get_id_soup("did").select_one(".dt").text
         
         if id != "":
             return int(id)
 
     def get_category(self) -> int:
-        return int(self.__page_soup.select_one("#dc .dt").text)
+        return int(self.__get_id_soup("dc").select_one(".dt").text)
 
     def get_is_breedable(self) -> bool:
-        return self.__page_soup.select_one("#br .dt").text == "Yes"
+        return self.__get_id_soup("br").select_one(".dt").text == "Yes"
 
     def get_summmon_breed_time(self) -> int:
-        return TimeParser().breed_time(self.__page_soup.select_one("#bt").text)
+        return TimeParser().breed_time(self.__get_id_soup("bt").text)
 
     def get_buy_price(self) -> dict:####
-        price, type_ = self.__page_soup.select_one("#bp .dt").text.split(" ")
+        price, type_ = self.__get_id_soup("bp").select_one(".dt").text.split(" ")
 
         price = int(price)
-        type_ = type.lower()
+        type_ = type_.lower()
 
         return {
             "type": type_,
@@ -193,19 +275,19 @@ class DragonPageParser:
         }
 
     def get_hatch_time(self) -> int:
-        return TimeParser().hatch_time(self.__page_soup.select_one("#ht .dt").text)
+        return TimeParser().hatch_time(self.__get_id_soup("ht").select_one(".dt").text)
 
     def get_xp_on_hatch(self) -> int:
-        return int(self.__page_soup.select_one("#hx .dt").text)
+        return int(self.__get_id_soup("hx").select_one(".dt").text)
 
     def get_release_date(self) -> int:
         return
 
-    def get_sell_price(self) -> int:####
-        price, type_ = self.__page_soup.select_one("#sp .dt").text.split(" ")
+    def get_sell_price(self) -> dict:####
+        price, type_ = self.__get_id_soup("sp").select_one(".dt").text.split(" ")
 
         price = int(price)
-        type_ = type.lower()
+        type_ = type_.lower()
         
         return {
             "type": type_,
@@ -215,8 +297,25 @@ class DragonPageParser:
     def get_starting_income_of_gold(self) -> int:####
         return
 
-    def get_all(self) -> dict:###
-        return {
+    def get_all(self, as_record: bool = False) -> Union[dict, Dragon]:###
+        if as_record:
+            # O record é montado direto dos getters, sem passar pelo dict
+            return Dragon(
+                self.get_name(),
+                self.get_rarity(),
+                self.get_elements(),
+                self.get_image_url(),
+                self.get_description(),
+                [ Attack.from_dict(attack) for attack in self.get_basic_attacks() ],
+                [ Attack.from_dict(attack) for attack in self.get_trainable_attacks() ],
+                self.get_strengths(),
+                self.get_weaknesses(),
+                self.get_book_id(),
+                self.get_category(),
+                self.get_is_breedable()
+            )
+
+        data = {
             "name": self.get_name(),
             "rarity": self.get_rarity(),
             "elements": self.get_elements(),
@@ -232,3 +331,5 @@ class DragonPageParser:
             "category": self.get_category(),
             "is_breedable": self.get_is_breedable(),
         }
+
+        return data
@@ -0,0 +1,147 @@
+from typing import Iterator, List, Union
+from urllib.parse import urljoin
+from bs4 import BeautifulSoup
+
+from ...backend import make_soup
+from ....metrics import instrument_getters
+from ....config import DEETLIST_URLS, DRAGON_ELEMENTS
+
+# Cabeçalhos do relatório (normalizados em minúsculas) e o campo equivalente
+# de DragonPageParser.get_all; colunas desconhecidas são ignoradas
+REPORT_COLUMNS = {
+    "dragon": "name",
+    "name": "name",
+    "element": "elements",
+    "elements": "elements",
+    "type": "elements",
+    "strong": "strengths",
+    "strong against": "strengths",
+    "strengths": "strengths",
+    "weak": "weaknesses",
+    "weak against": "weaknesses",
+    "weaknesses": "weaknesses",
+    "id": "book_id",
+    "book id": "book_id",
+    "book": "book_id",
+    "category": "category",
+    "cat": "category",
+    "breedable": "is_breedable",
+    "description": "description"
+}
+
+def get_page_url(href: str) -> str:
+    # O relatório fica dois níveis abaixo de /dragoncity/, então os links
+    # relativos ("../../dragon/X") são resolvidos a partir da url dele
+    return urljoin(DEETLIST_URLS["DRAGONS"]["HEROIC"], href).replace(" ", "%20")
+
+def parse_elements(cell_soup: BeautifulSoup) -> List[str]:
+    # Os elementos aparecem como ícones (".typ_i tb_<abreviação>", como na
+    # página do dragão), como imagens ou como texto
+    abbreviations = [ element_soup.attrs["class"][1].split("_")[1] for element_soup in cell_soup.select(".typ_i") ]
+
+    if not abbreviations:
+        abbreviations = [
+            img_soup.attrs.get("alt") or img_soup.attrs["src"].rsplit("/", 1)[-1].split(".")[0]
+            for img_soup in cell_soup.select("img")
+        ]
+
+    if not abbreviations:
+        abbreviations = cell_soup.text.replace(",", " ").split()
+
+    return [ DRAGON_ELEMENTS.get(abbreviation.lower(), abbreviation.lower()) for abbreviation in abbreviations ]
+
+@instrument_getters("heroic_dragons")
+class HeroicDragonsParser:
+    def __init__(self, html: Union[str, bytes], backend: Union[str, None] = None) -> None:
+        self.__soup = make_soup(html, backend)
+        self.__columns = None
+
+    def __get_header_row(self) -> Union[BeautifulSoup, None]:
+        # O cabeçalho é a primeira linha com <th> ou, sem elas, a primeira linha da tabela
+        header_cell = self.__soup.select_one("table th")
+
+        if header_cell is not None:
+            return header_cell.find_parent("tr")
+
+        return self.__soup.select_one("table tr")
+
+    def get_columns(self) -> List[Union[str, None]]:
+        # Um campo por coluna da tabela, None para as colunas sem equivalente
+        if self.__columns is None:
+            header_row = self.__get_header_row()
+            header_cells = header_row.find_all(["th", "td"], recursive=False) if header_row is not None else []
+
+            self.__columns = [
+                REPORT_COLUMNS.get(" ".join(cell_soup.text.lower().replace(":", "").split()))
+                for cell_soup in header_cells
+            ]
+
+        return self.__columns
+
+    def get_fields(self) -> List[str]:
+        fields = { field for field in self.get_columns() if field is not None }
+        fields.add("rarity")
+
+        return sorted(fields)
+
+    def __parse_row(self, row_soup: BeautifulSoup, cells_soup: list) -> Union[dict, None]:
+        dragon = { "rarity": "H" }
+
+        for field, cell_soup in zip(self.get_columns(), cells_soup):
+            if field is None:
+                continue
+
+            text = cell_soup.text.strip()
+
+            if field == "name":
+                dragon["name"] = text
+
+                link_soup = cell_soup.select_one("a[href]")
+
+                if link_soup is not None:
+                    dragon["page_url"] = get_page_url(link_soup.attrs["href"])
+
+            elif field in ("elements", "strengths", "weaknesses"):
+                dragon[field] = parse_elements(cell_soup)
+
+            elif field == "book_id":
+                dragon["book_id"] = int(text) if text.isdigit() else None
+
+            elif field == "category":
+                dragon["category"] = int(text) if text.isdigit() else None
+
+            elif field == "is_breedable":
+                dragon["is_breedable"] = text == "Yes"
+
+            else:
+                dragon[field] = text
+
+        if "name" not in dragon:
+            return None
+
+        img_soup = row_soup.select_one("img[src*='dragons/']")
+
+        if img_soup is not None:
+            dragon["image_url"] = get_page_url(img_soup.attrs["src"])
+
+        return dragon
+
+    def iter_all(self) -> Iterator[dict]:
+        header_row = self.__get_header_row()
+
+        for row_soup in self.__soup.select("table tr"):
+            if row_soup is header_row:
+                continue
+
+            cells_soup = row_soup.find_all("td", recursive=False)
+
+            if len(cells_soup) < len(self.get_columns()):
+                continue
+
+            dragon = self.__parse_row(row_soup, cells_soup)
+
+            if dragon is not None:
+                yield dragon
+
+    def get_all(self) -> List[dict]:
+        return list(self.iter_all())
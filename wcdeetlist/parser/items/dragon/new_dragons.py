@@ -1,11 +1,40 @@
-from bs4 import BeautifulSoup
+from typing import Iterator, Union
 from datetime import datetime
+from bs4 import SoupStrainer
+import re
 
+from ...backend import make_soup
+from ...feed import FeedParser
+from ...records import NewDragon
+from ....metrics import instrument_getters
 from ....config import SECONDS_PER_DAY
 
+NEW_DRAGON_FIELDS = ("rn", "img_rar", "rt", "newi")
+
+# No modo restrito só os elementos com alguma das classes dos campos entram na árvore.
+# A regex casa a classe dentro do atributo inteiro ("img_rp_l img_rar"), que é como
+# o SoupStrainer o recebe durante o parse
+NEW_DRAGONS_STRAINER = SoupStrainer(class_=re.compile(rf"(^|\s)({'|'.join(NEW_DRAGON_FIELDS)})(\s|$)"))
+
+def get_img_url(src: str) -> str:
+    return src.replace("../", "https://deetlist.com/dragoncity/").replace(" ", "%20")
+
+def get_page_url(img_url: str) -> str:
+    return img_url.replace("img/", "").replace("%20", "_").removesuffix(".png")
+
+def get_rarity(rarity_classes: list[str]) -> str:
+    return rarity_classes[0].removeprefix("img_rp_").upper()
+
+@instrument_getters("new_dragons")
 class NewDragonsParser:
-    def __init__(self, html: str):
-        self.__page_soup = BeautifulSoup(html, "html.parser")
+    def __init__(self, html: str, backend: Union[str, None] = None, restricted: bool = False):
+        self.__page_soup = make_soup(html, backend, NEW_DRAGONS_STRAINER if restricted else None)
+
+    def __get_img_url(self, img_soup) -> str:
+        return get_img_url(img_soup.attrs["src"])
+
+    def __get_page_url(self, img_url: str) -> str:
+        return get_page_url(img_url)
 
     def get_names(self) -> list[str]:
         return [ name.text for name in self.__page_soup.select(".rn") ]
@@ -14,45 +43,99 @@ class NewDragonsParser:
         return [ int(time.text) for time in self.__page_soup.select(".rt") ]
 
     def get_raritys(self) -> list[str]:
-        return [ rarity.attrs["class"][0].removeprefix("img_rp_").upper() for rarity in  self.__page_soup.select(".img_rar") ]
+        return [ get_rarity(rarity.attrs["class"]) for rarity in  self.__page_soup.select(".img_rar") ]
 
     def get_img_urls(self) -> list[str]:
-        imgs = self.__page_soup.select(".newi")
+        return [ self.__get_img_url(img) for img in self.__page_soup.select(".newi") ]
 
-        img_urls = []
+    def get_page_urls(self) -> list[str]:
+        return [ self.__get_page_url(img_url) for img_url in self.get_img_urls() ]
 
-        for img in imgs:
-            img_url = img.attrs["src"].replace("../", "https://deetlist.com/dragoncity/").replace(" ", "%20")
+    def iter_all(self, as_record: bool = False) -> Iterator[Union[dict, NewDragon]]:
+        # Um único seletor percorre o documento uma vez e separa os campos pela
+        # classe, mantendo a mesma ordem que os seletores individuais teriam
+        fields_soup = { class_name: [] for class_name in NEW_DRAGON_FIELDS }
 
-            img_urls.append(img_url)
+        for field_soup in self.__page_soup.select(".rn, .rt, .img_rar, .newi"):
+            for class_name in set(field_soup.attrs["class"]):
+                if class_name in fields_soup:
+                    fields_soup[class_name].append(field_soup)
 
-        return img_urls
+        for name, rarity, released_in, img in zip(*fields_soup.values()):
+            img_url = self.__get_img_url(img)
+            values = (name.text, get_rarity(rarity.attrs["class"]), int(released_in.text), img_url, self.__get_page_url(img_url))
 
-    def get_page_urls(self) -> list[str]:
-        img_urls = self.get_img_urls()
+            yield NewDragon(*values) if as_record else dict(zip(NewDragon.__slots__, values))
+
+    def get_all(self, as_record: bool = False):
+        return list(self.iter_all(as_record))
+
+class NewDragonsFeedParser(FeedParser):
+    def __init__(self, as_record: bool = False) -> None:
+        super().__init__()
+
+        self.as_record = as_record
+        self.fields = { class_name: [] for class_name in NEW_DRAGON_FIELDS }
+
+        # Campos de texto (.rn, .rt) abertos: [classe, tag, profundidade, pedaços de texto]
+        self.__open_fields = []
+
+    def handle_starttag(self, tag: str, attrs: list) -> None:
+        for open_field in self.__open_fields:
+            if open_field[1] == tag:
+                open_field[2] += 1
+
+        attrs = dict(attrs)
+        classes = (attrs.get("class") or "").split()
+
+        for class_name in dict.fromkeys(classes):
+            if class_name in ("rn", "rt"):
+                self.__open_fields.append([ class_name, tag, 1, [] ])
+
+            elif class_name == "img_rar":
+                self.fields["img_rar"].append(classes)
+
+            elif class_name == "newi":
+                self.fields["newi"].append(attrs["src"])
+
+        self.__emit_ready()
+
+    def handle_startendtag(self, tag: str, attrs: list) -> None:
+        # Tags auto-fechadas (<img ... />) não abrem campos de texto
+        open_fields = self.__open_fields
+        self.__open_fields = []
+        self.handle_starttag(tag, attrs)
+        self.__open_fields = open_fields
+
+    def handle_data(self, data: str) -> None:
+        for open_field in self.__open_fields:
+            open_field[3].append(data)
+
+    def handle_endtag(self, tag: str) -> None:
+        for open_field in list(self.__open_fields):
+            if open_field[1] != tag:
+                continue
+
+            open_field[2] -= 1
 
-        page_urls = [ img_url.replace("img/", "").replace("%20", "_").removesuffix(".png") for img_url in img_urls ]
+            if open_field[2] == 0:
+                self.__open_fields.remove(open_field)
+                self.fields[open_field[0]].append("".join(open_field[3]))
 
-        return page_urls
+        self.__emit_ready()
 
-    def get_all(self):
-        names = self.get_names()
-        raritys = self.get_raritys()
-        relanses_in = self.get_releases_in()
-        img_urls = self.get_img_urls()
-        page_urls = self.get_page_urls()
+    def __emit_ready(self) -> None:
+        # Um dragão sai assim que os quatro campos dele já foram lidos
+        ready = min(len(values) for values in self.fields.values())
 
-        dragons = []
+        if ready == 0:
+            return
 
-        for name,  rarity, released_in, img_url, page_url in zip(names, raritys, relanses_in, img_urls, page_urls):
-            dragon_info = {
-                "name": name,
-                "rarity": rarity,
-                "relased_in": released_in,
-                "img_url": img_url,
-                "page_url": page_url,
-            }
+        for name, rarity_classes, released_in, src in zip(*self.fields.values()):
+            img_url = get_img_url(src)
+            values = (name, get_rarity(rarity_classes), int(released_in), img_url, get_page_url(img_url))
 
-            dragons.append(dragon_info)
+            self.results.append(NewDragon(*values) if self.as_record else dict(zip(NewDragon.__slots__, values)))
 
-        return dragons    
\ No newline at end of file
+        for values in self.fields.values():
+            del values[:ready]
@@ -0,0 +1,325 @@
+from typing import Iterable, List, Type, Union
+import operator
+import json
+import abc
+import sys
+
+try:
+    import msgspec
+
+except ImportError:
+    msgspec = None
+
+def intern_text(text: Union[str, None]) -> Union[str, None]:
+    # Elementos, raridades e tipos de missão se repetem em todo o catálogo, então
+    # todas as instâncias passam a apontar para a mesma string
+    return sys.intern(text) if isinstance(text, str) else text
+
+class Record(abc.ABC):
+    __slots__ = ()
+
+    # Campos que guardam listas de outros records (campo -> classe do record)
+    nested_records = {}
+
+    def __init_subclass__(cls, **kwargs) -> None:
+        super().__init_subclass__(**kwargs)
+
+        cls._get_values = operator.attrgetter(*cls.__slots__)
+        cls._nested_fields = tuple(
+            (cls.__slots__.index(field), record_class)
+            for field, record_class in cls.nested_records.items()
+        )
+
+    @abc.abstractmethod
+    def to_dict(self) -> dict:
+        ...
+
+    @classmethod
+    @abc.abstractmethod
+    def from_dict(cls, data: dict) -> "Record":
+        ...
+
+    def to_values(self) -> list:
+        # Os campos na ordem de __slots__, sem as chaves: é o formato compacto de
+        # dump_records. As listas não são copiadas, então o resultado é só para serializar
+        values = list(self._get_values(self))
+
+        for index, _ in self._nested_fields:
+            values[index] = [ record.to_values() for record in values[index] ]
+
+        return values
+
+    @classmethod
+    def from_values(cls, values: Iterable) -> "Record":
+        values = list(values)
+
+        for index, record_class in cls._nested_fields:
+            values[index] = [ record_class.from_values(record_values) for record_values in values[index] ]
+
+        return cls(*values)
+
+    def to_json(self) -> str:
+        return json.dumps(self.to_dict(), ensure_ascii=False)
+
+    @classmethod
+    def from_json(cls, raw_json: Union[str, bytes]) -> "Record":
+        return cls.from_dict(json.loads(raw_json))
+
+    def __eq__(self, other: object) -> bool:
+        if type(other) is not type(self):
+            return NotImplemented
+
+        return self.to_dict() == other.to_dict()
+
+    def __repr__(self) -> str:
+        fields = ", ".join(f"{name}={getattr(self, name)!r}" for name in self.__slots__)
+        return f"{type(self).__name__}({fields})"
+
+class Attack(Record):
+    __slots__ = ("name", "element", "damege", "training_time")
+
+    def __init__(self, name: str, element: str, damege: Union[int, None], training_time: Union[int, None] = None) -> None:
+        self.name = name
+        self.element = intern_text(element)
+        self.damege = damege
+        self.training_time = training_time
+
+    def to_dict(self) -> dict:
+        attack = {
+            "name": self.name,
+            "element": self.element,
+            "damege": self.damege
+        }
+
+        if self.training_time is not None:
+            attack["training_time"] = self.training_time
+
+        return attack
+
+    @classmethod
+    def from_dict(cls, data: dict) -> "Attack":
+        return cls(data["name"], data["element"], data["damege"], data.get("training_time"))
+
+class Dragon(Record):
+    __slots__ = (
+        "name",
+        "rarity",
+        "elements",
+        "image_url",
+        "description",
+        "basic_attacks",
+        "trainable_attacks",
+        "strengths",
+        "weaknesses",
+        "book_id",
+        "category",
+        "is_breedable"
+    )
+
+    nested_records = { "basic_attacks": Attack, "trainable_attacks": Attack }
+
+    def __init__(
+        self,
+        name: str,
+        rarity: str,
+        elements: List[str],
+        image_url: str,
+        description: str,
+        basic_attacks: List[Attack],
+        trainable_attacks: List[Attack],
+        strengths: List[str],
+        weaknesses: List[str],
+        book_id: Union[int, None],
+        category: int,
+        is_breedable: bool
+    ) -> None:
+        self.name = name
+        self.rarity = intern_text(rarity)
+        self.elements = [ intern_text(element) for element in elements ]
+        self.image_url = image_url
+        self.description = description
+        self.basic_attacks = basic_attacks
+        self.trainable_attacks = trainable_attacks
+        self.strengths = [ intern_text(element) for element in strengths ]
+        self.weaknesses = [ intern_text(element) for element in weaknesses ]
+        self.book_id = book_id
+        self.category = category
+        self.is_breedable = is_breedable
+
+    def to_dict(self) -> dict:
+        return {
+            "name": self.name,
+            "rarity": self.rarity,
+            "elements": list(self.elements),
+            "image_url": self.image_url,
+            "description": self.description,
+            "attacks": {
+                "basic": [ attack.to_dict() for attack in self.basic_attacks ],
+                "trainable": [ attack.to_dict() for attack in self.trainable_attacks ],
+            },
+            "strengths": list(self.strengths),
+            "weaknesses": list(self.weaknesses),
+            "book_id": self.book_id,
+            "category": self.category,
+            "is_breedable": self.is_breedable,
+        }
+
+    @classmethod
+    def from_dict(cls, data: dict) -> "Dragon":
+        return cls(
+            data["name"],
+            data["rarity"],
+            data["elements"],
+            data["image_url"],
+            data["description"],
+            [ Attack.from_dict(attack) for attack in data["attacks"]["basic"] ],
+            [ Attack.from_dict(attack) for attack in data["attacks"]["trainable"] ],
+            data["strengths"],
+            data["weaknesses"],
+            data["book_id"],
+            data["category"],
+            data["is_breedable"]
+        )
+
+class NewDragon(Record):
+    __slots__ = ("name", "rarity", "relased_in", "img_url", "page_url")
+
+    def __init__(self, name: str, rarity: str, relased_in: int, img_url: str, page_url: str) -> None:
+        self.name = name
+        self.rarity = intern_text(rarity)
+        self.relased_in = relased_in
+        self.img_url = img_url
+        self.page_url = page_url
+
+    def to_dict(self) -> dict:
+        return {
+            "name": self.name,
+            "rarity": self.rarity,
+            "relased_in": self.relased_in,
+            "img_url": self.img_url,
+            "page_url": self.page_url,
+        }
+
+    @classmethod
+    def from_dict(cls, data: dict) -> "NewDragon":
+        return cls(data["name"], data["rarity"], data["relased_in"], data["img_url"], data["page_url"])
+
+class Mission(Record):
+    __slots__ = ("type", "name", "goal_items", "pool_size", "pool_time_per_item", "pool_time_total", "item_drop_chance")
+
+    def __init__(
+        self,
+        type: str,
+        name: str,
+        goal_items: int,
+        pool_size: int,
+        pool_time_per_item: Union[int, None],
+        pool_time_total: Union[int, None],
+        item_drop_chance: str
+    ) -> None:
+        self.type = intern_text(type)
+        self.name = intern_text(name)
+        self.goal_items = goal_items
+        self.pool_size = pool_size
+        self.pool_time_per_item = pool_time_per_item
+        self.pool_time_total = pool_time_total
+        self.item_drop_chance = intern_text(item_drop_chance)
+
+    def to_dict(self) -> dict:
+        return {
+            "type": self.type,
+            "name": self.name,
+            "goal_items": self.goal_items,
+            "pool_size": self.pool_size,
+            "pool_time": {
+                "per_item": self.pool_time_per_item,
+                "total": self.pool_time_total
+            },
+            "item_drop_chance": self.item_drop_chance
+        }
+
+    @classmethod
+    def from_dict(cls, data: dict) -> "Mission":
+        return cls(
+            data["type"],
+            data["name"],
+            data["goal_items"],
+            data["pool_size"],
+            data["pool_time"]["per_item"],
+            data["pool_time"]["total"],
+            data["item_drop_chance"]
+        )
+
+class Node(Record):
+    __slots__ = ("number", "missions")
+
+    nested_records = { "missions": Mission }
+
+    def __init__(self, number: int, missions: List[Mission]) -> None:
+        self.number = number
+        self.missions = missions
+
+    def to_dict(self) -> dict:
+        return {
+            "number": self.number,
+            "missions": [ mission.to_dict() for mission in self.missions ]
+        }
+
+    @classmethod
+    def from_dict(cls, data: dict) -> "Node":
+        return cls(data["number"], [ Mission.from_dict(mission) for mission in data["missions"] ])
+
+class Lap(Record):
+    __slots__ = ("number", "nodes")
+
+    nested_records = { "nodes": Node }
+
+    def __init__(self, number: int, nodes: List[Node]) -> None:
+        self.number = number
+        self.nodes = nodes
+
+    def to_dict(self) -> dict:
+        return {
+            "number": self.number,
+            "nodes": [ node.to_dict() for node in self.nodes ]
+        }
+
+    @classmethod
+    def from_dict(cls, data: dict) -> "Lap":
+        return cls(data["number"], [ Node.from_dict(node) for node in data["nodes"] ])
+
+class HeroicRace(Record):
+    __slots__ = ("duration", "dragon_page_urls", "laps")
+
+    nested_records = { "laps": Lap }
+
+    def __init__(self, duration: int, dragon_page_urls: List[str], laps: List[Lap]) -> None:
+        self.duration = duration
+        self.dragon_page_urls = dragon_page_urls
+        self.laps = laps
+
+    def to_dict(self) -> dict:
+        return {
+            "duration": self.duration,
+            "dragon_page_urls": list(self.dragon_page_urls),
+            "laps": [ lap.to_dict() for lap in self.laps ]
+        }
+
+    @classmethod
+    def from_dict(cls, data: dict) -> "HeroicRace":
+        return cls(data["duration"], data["dragon_page_urls"], [ Lap.from_dict(lap) for lap in data["laps"] ])
+
+def dump_records(records: Iterable[Record]) -> bytes:
+    # Uma lista JSON com os valores de cada record (to_values), sem montar dicts;
+    # com o msgspec instalado a codificação fica com ele
+    values = [ record.to_values() for record in records ]
+
+    if msgspec is not None:
+        return msgspec.json.encode(values)
+
+    return json.dumps(values, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+
+def load_records(record_class: Type[Record], raw_json: Union[str, bytes]) -> List[Record]:
+    values = msgspec.json.decode(raw_json) if msgspec is not None else json.loads(raw_json)
+
+    return [ record_class.from_values(record_values) for record_values in values ]
@@ -0,0 +1 @@
+from .catalog import CatalogStore
\ No newline at end of file
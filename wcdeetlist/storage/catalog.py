@@ -0,0 +1,359 @@
+from typing import Iterable, Iterator, Union
+import sqlite3
+import time
+
+CATALOG_SCHEMA = """
+CREATE TABLE IF NOT EXISTS dragons (
+    id INTEGER PRIMARY KEY,
+    name TEXT NOT NULL UNIQUE,
+    rarity TEXT,
+    image_url TEXT,
+    description TEXT,
+    book_id INTEGER,
+    category INTEGER,
+    is_breedable INTEGER
+);
+CREATE INDEX IF NOT EXISTS dragons_rarity ON dragons (rarity);
+CREATE INDEX IF NOT EXISTS dragons_book_id ON dragons (book_id);
+CREATE INDEX IF NOT EXISTS dragons_category ON dragons (category);
+
+CREATE TABLE IF NOT EXISTS dragon_elements (
+    dragon_id INTEGER NOT NULL REFERENCES dragons (id) ON DELETE CASCADE,
+    kind TEXT NOT NULL,
+    position INTEGER NOT NULL,
+    element TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS dragon_elements_element ON dragon_elements (kind, element);
+CREATE INDEX IF NOT EXISTS dragon_elements_dragon ON dragon_elements (dragon_id);
+
+CREATE TABLE IF NOT EXISTS attacks (
+    dragon_id INTEGER NOT NULL REFERENCES dragons (id) ON DELETE CASCADE,
+    attack_type TEXT NOT NULL,
+    position INTEGER NOT NULL,
+    name TEXT NOT NULL,
+    element TEXT,
+    damege INTEGER,
+    training_time INTEGER
+);
+CREATE INDEX IF NOT EXISTS attacks_element ON attacks (element);
+CREATE INDEX IF NOT EXISTS attacks_dragon ON attacks (dragon_id);
+
+CREATE TABLE IF NOT EXISTS heroic_races (
+    id INTEGER PRIMARY KEY,
+    duration INTEGER,
+    stored_at REAL NOT NULL
+);
+
+CREATE TABLE IF NOT EXISTS heroic_race_dragons (
+    race_id INTEGER NOT NULL REFERENCES heroic_races (id) ON DELETE CASCADE,
+    position INTEGER NOT NULL,
+    page_url TEXT NOT NULL
+);
+
+CREATE TABLE IF NOT EXISTS heroic_race_laps (
+    id INTEGER PRIMARY KEY,
+    race_id INTEGER NOT NULL REFERENCES heroic_races (id) ON DELETE CASCADE,
+    number INTEGER NOT NULL
+);
+CREATE INDEX IF NOT EXISTS heroic_race_laps_race ON heroic_race_laps (race_id);
+
+CREATE TABLE IF NOT EXISTS heroic_race_nodes (
+    id INTEGER PRIMARY KEY,
+    lap_id INTEGER NOT NULL REFERENCES heroic_race_laps (id) ON DELETE CASCADE,
+    number INTEGER NOT NULL
+);
+CREATE INDEX IF NOT EXISTS heroic_race_nodes_lap ON heroic_race_nodes (lap_id);
+
+CREATE TABLE IF NOT EXISTS heroic_race_missions (
+    node_id INTEGER NOT NULL REFERENCES heroic_race_nodes (id) ON DELETE CASCADE,
+    position INTEGER NOT NULL,
+    type TEXT,
+    name TEXT,
+    goal_items INTEGER,
+    pool_size INTEGER,
+    pool_time_per_item INTEGER,
+    pool_time_total INTEGER,
+    item_drop_chance TEXT
+);
+CREATE INDEX IF NOT EXISTS heroic_race_missions_node ON heroic_race_missions (node_id);
+CREATE INDEX IF NOT EXISTS heroic_race_missions_type ON heroic_race_missions (type);
+"""
+
+DRAGON_ELEMENT_KINDS = ("elements", "strengths", "weaknesses")
+
+class CatalogStore:
+    def __init__(self, path: str) -> None:
+        self.path = path
+
+        self.connection = sqlite3.connect(path, timeout=30)
+        self.connection.row_factory = sqlite3.Row
+        self.connection.execute("PRAGMA journal_mode=WAL")
+        self.connection.execute("PRAGMA foreign_keys=ON")
+        self.connection.executescript(CATALOG_SCHEMA)
+
+    def __upsert_dragon(self, dragon: dict) -> None:
+        dragon_id = self.connection.execute(
+            """
+            INSERT INTO dragons (name, rarity, image_url, description, book_id, category, is_breedable)
+            VALUES (?, ?, ?, ?, ?, ?, ?)
+            ON CONFLICT (name) DO UPDATE SET
+                rarity = excluded.rarity,
+                image_url = excluded.image_url,
+                description = excluded.description,
+                book_id = excluded.book_id,
+                category = excluded.category,
+                is_breedable = excluded.is_breedable
+            RETURNING id
+            """,
+            (
+                dragon["name"],
+                dragon["rarity"],
+                dragon["image_url"],
+                dragon["description"],
+                dragon["book_id"],
+                dragon["category"],
+                dragon["is_breedable"]
+            )
+        ).fetchone()[0]
+
+        self.connection.execute("DELETE FROM dragon_elements WHERE dragon_id = ?", (dragon_id,))
+        self.connection.execute("DELETE FROM attacks WHERE dragon_id = ?", (dragon_id,))
+
+        self.connection.executemany(
+            "INSERT INTO dragon_elements (dragon_id, kind, position, element) VALUES (?, ?, ?, ?)",
+            [
+                (dragon_id, kind, position, element)
+                for kind in DRAGON_ELEMENT_KINDS
+                for position, element in enumerate(dragon[kind])
+            ]
+        )
+
+        self.connection.executemany(
+            "INSERT INTO attacks (dragon_id, attack_type, position, name, element, damege, training_time) VALUES (?, ?, ?, ?, ?, ?, ?)",
+            [
+                (dragon_id, attack_type, position, attack["name"], attack["element"], attack["damege"], attack.get("training_time"))
+                for attack_type, attacks in dragon["attacks"].items()
+                for position, attack in enumerate(attacks)
+            ]
+        )
+
+    def upsert_dragons(self, dragons: Iterable[dict]) -> int:
+        count = 0
+
+        # Uma única transação para o lote inteiro: muito mais rápido que um commit por dragão
+        with self.connection:
+            for dragon in dragons:
+                self.__upsert_dragon(dragon)
+                count += 1
+
+        return count
+
+    def insert_heroic_race(self, heroic_race: dict) -> int:
+        with self.connection:
+            race_id = self.connection.execute(
+                "INSERT INTO heroic_races (duration, stored_at) VALUES (?, ?)",
+                (heroic_race["duration"], time.time())
+            ).lastrowid
+
+            self.connection.executemany(
+                "INSERT INTO heroic_race_dragons (race_id, position, page_url) VALUES (?, ?, ?)",
+                [ (race_id, position, page_url) for position, page_url in enumerate(heroic_race.get("dragon_page_urls", [])) ]
+            )
+
+            for lap in heroic_race["laps"]:
+                lap_id = self.connection.execute(
+                    "INSERT INTO heroic_race_laps (race_id, number) VALUES (?, ?)",
+                    (race_id, lap["number"])
+                ).lastrowid
+
+                for node in lap["nodes"]:
+                    node_id = self.connection.execute(
+                        "INSERT INTO heroic_race_nodes (lap_id, number) VALUES (?, ?)",
+                        (lap_id, node["number"])
+                    ).lastrowid
+
+                    self.connection.executemany(
+                        """
+                        INSERT INTO heroic_race_missions (
+                            node_id, position, type, name, goal_items, pool_size,
+                            pool_time_per_item, pool_time_total, item_drop_chance
+                        ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
+                        """,
+                        [
+                            (
+                                node_id,
+                                position,
+                                mission["type"],
+                                mission["name"],
+                                mission["goal_items"],
+                                mission["pool_size"],
+                                mission["pool_time"]["per_item"],
+                                mission["pool_time"]["total"],
+                                mission["item_drop_chance"]
+                            )
+                            for position, mission in enumerate(node["missions"])
+                        ]
+                    )
+
+        return race_id
+
+    def __build_dragon(self, dragon_row: sqlite3.Row) -> dict:
+        dragon_id = dragon_row["id"]
+
+        dragon_elements = { kind: [] for kind in DRAGON_ELEMENT_KINDS }
+
+        for row in self.connection.execute(
+            "SELECT kind, element FROM dragon_elements WHERE dragon_id = ? ORDER BY kind, position",
+            (dragon_id,)
+        ):
+            dragon_elements[row["kind"]].append(row["element"])
+
+        attacks = { "basic": [], "trainable": [] }
+
+        for row in self.connection.execute(
+            "SELECT attack_type, name, element, damege, training_time FROM attacks WHERE dragon_id = ? ORDER BY attack_type, position",
+            (dragon_id,)
+        ):
+            attack = {
+                "name": row["name"],
+                "element": row["element"],
+                "damege": row["damege"]
+            }
+
+            if row["training_time"] is not None:
+                attack["training_time"] = row["training_time"]
+
+            attacks.setdefault(row["attack_type"], []).append(attack)
+
+        return {
+            "name": dragon_row["name"],
+            "rarity": dragon_row["rarity"],
+            "elements": dragon_elements["elements"],
+            "image_url": dragon_row["image_url"],
+            "description": dragon_row["description"],
+            "attacks": attacks,
+            "strengths": dragon_elements["strengths"],
+            "weaknesses": dragon_elements["weaknesses"],
+            "book_id": dragon_row["book_id"],
+            "category": dragon_row["category"],
+            "is_breedable": bool(dragon_row["is_breedable"]),
+        }
+
+    def get_dragon(self, name: str) -> Union[dict, None]:
+        dragon_row = self.connection.execute("SELECT * FROM dragons WHERE name = ?", (name,)).fetchone()
+        return self.__build_dragon(dragon_row) if dragon_row is not None else None
+
+    def get_dragon_by_book_id(self, book_id: int) -> Union[dict, None]:
+        dragon_row = self.connection.execute("SELECT * FROM dragons WHERE book_id = ?", (book_id,)).fetchone()
+        return self.__build_dragon(dragon_row) if dragon_row is not None else None
+
+    def iter_dragons(
+        self,
+        rarity: Union[str, None] = None,
+        element: Union[str, None] = None,
+        strength: Union[str, None] = None,
+        weakness: Union[str, None] = None,
+        category: Union[int, None] = None,
+        limit: Union[int, None] = None
+    ) -> Iterator[dict]:
+        conditions = []
+        parameters = []
+
+        if rarity is not None:
+            conditions.append("rarity = ?")
+            parameters.append(rarity)
+
+        if category is not None:
+            conditions.append("category = ?")
+            parameters.append(category)
+
+        for kind, value in (("elements", element), ("strengths", strength), ("weaknesses", weakness)):
+            if value is not None:
+                conditions.append("id IN (SELECT dragon_id FROM dragon_elements WHERE kind = ? AND element = ?)")
+                parameters.extend((kind, value))
+
+        query = "SELECT * FROM dragons"
+
+        if conditions:
+            query += " WHERE " + " AND ".join(conditions)
+
+        query += " ORDER BY id"
+
+        if limit is not None:
+            query += " LIMIT ?"
+            parameters.append(limit)
+
+        # As linhas são lidas sob demanda, então o catálogo nunca fica inteiro em memória
+        for dragon_row in self.connection.execute(query, parameters):
+            yield self.__build_dragon(dragon_row)
+
+    def find_attacks(self, element: Union[str, None] = None, attack_type: Union[str, None] = None) -> list[dict]:
+        conditions = []
+        parameters = []
+
+        if element is not None:
+            conditions.append("attacks.element = ?")
+            parameters.append(element)
+
+        if attack_type is not None:
+            conditions.append("attacks.attack_type = ?")
+            parameters.append(attack_type)
+
+        query = """
+            SELECT dragons.name AS dragon_name, attacks.attack_type, attacks.name, attacks.element, attacks.damege, attacks.training_time
+            FROM attacks JOIN dragons ON dragons.id = attacks.dragon_id
+        """
+
+        if conditions:
+            query += " WHERE " + " AND ".join(conditions)
+
+        return [ dict(row) for row in self.connection.execute(query, parameters) ]
+
+    def get_heroic_race(self, race_id: Union[int, None] = None) -> Union[dict, None]:
+        if race_id is None:
+            race_row = self.connection.execute("SELECT * FROM heroic_races ORDER BY id DESC LIMIT 1").fetchone()
+
+        else:
+            race_row = self.connection.execute("SELECT * FROM heroic_races WHERE id = ?", (race_id,)).fetchone()
+
+        if race_row is None:
+            return None
+
+        dragon_page_urls = [
+            row["page_url"]
+            for row in self.connection.execute("SELECT page_url FROM heroic_race_dragons WHERE race_id = ? ORDER BY position", (race_row["id"],))
+        ]
+
+        laps = []
+
+        for lap_row in self.connection.execute("SELECT * FROM heroic_race_laps WHERE race_id = ? ORDER BY id", (race_row["id"],)).fetchall():
+            nodes = []
+
+            for node_row in self.connection.execute("SELECT * FROM heroic_race_nodes WHERE lap_id = ? ORDER BY id", (lap_row["id"],)).fetchall():
+                missions = [
+                    {
+                        "type": row["type"],
+                        "name": row["name"],
+                        "goal_items": row["goal_items"],
+                        "pool_size": row["pool_size"],
+                        "pool_time": {
+                            "per_item": row["pool_time_per_item"],
+                            "total": row["pool_time_total"]
+                        },
+                        "item_drop_chance": row["item_drop_chance"]
+                    }
+                    for row in self.connection.execute("SELECT * FROM heroic_race_missions WHERE node_id = ? ORDER BY position", (node_row["id"],))
+                ]
+
+                nodes.append({ "number": node_row["number"], "missions": missions })
+
+            laps.append({ "number": lap_row["number"], "nodes": nodes })
+
+        return {
+            "duration": race_row["duration"],
+            "dragon_page_urls": dragon_page_urls,
+            "laps": laps
+        }
+
+    def close(self) -> None:
+        self.connection.close()
@@ -1,6 +1,27 @@
-from .core import (
-    get_dragon_full_data,
-    get_all_dragons_full_data,
-    get_heroic_race_data,
-    get_heroic_race_full_data,
-)
\ No newline at end of file
+from .._lazy import lazy_module
+
+# tools.core puxa crawler e parser inteiros, então cada nome só é resolvido quando usado
+_LAZY_ATTRIBUTES = {
+    "normalize_page_url": ".core",
+    "DRAGON_FIELDS": ".core",
+    "dragon_page_memo": ".core",
+    "get_dragon_full_data": ".core",
+    "iter_dragons_full_data": ".core",
+    "get_dragons_full_data": ".core",
+    "get_all_dragons_page_urls": ".core",
+    "iter_all_dragons_full_data": ".core",
+    "get_all_dragons_full_data": ".core",
+    "get_heroic_race_data": ".core",
+    "get_heroic_dragons_report": ".core",
+    "get_heroic_race_full_data": ".core",
+    "load_snapshot": ".incremental",
+    "save_snapshot": ".incremental",
+    "get_catalog_changes": ".incremental",
+    "refresh_all_dragons_full_data": ".incremental",
+    "DragonPagePipeline": ".pipeline",
+    "export_all_dragons_ndjson": ".export"
+}
+
+__all__ = list(_LAZY_ATTRIBUTES)
+
+__getattr__, __dir__ = lazy_module(__name__, _LAZY_ATTRIBUTES)
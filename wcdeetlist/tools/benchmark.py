@@ -0,0 +1,642 @@
+from typing import Callable, Iterable, Iterator, Union
+from datetime import datetime
+import tracemalloc
+import random
+import subprocess
+import tempfile
+import json
+import gc
+import sys
+import time
+import os
+
+from ..config import SECONDS_PER_DAY, SECONDS_PER_HOUR, SECONDS_PER_MINUTE
+from ..crawler import (
+    AllDragonsCrawler,
+    NewDragonsCrawler,
+    HeroicRaceCrawler,
+    DragonPageCrawler
+)
+from ..parser import (
+    AllDragonsParser,
+    AllDragonsFeedParser,
+    NewDragonsParser,
+    NewDragonsFeedParser,
+    HeroicRaceParser,
+    DragonPageParser
+)
+from ..parser import records
+from ..parser.duration import parse_duration, parse_labeled_duration
+from ..fetcher.localization_store import LocalizationStore
+from ..storage import CatalogStore
+from .heroic_simulation import HeroicRaceModel
+from .matchup import ELEMENT_NAMES, ElementIndex
+
+MANIFEST_FILE_NAME = "manifest.json"
+
+# Orçamentos em milissegundos do tempo cumulativo de import (-X importtime)
+IMPORT_TIME_BUDGETS_MS = {
+    "wcdeetlist": 15,
+    "wcdeetlist.config": 5,
+    "wcdeetlist.metrics": 15
+}
+
+# Formatos de duração vistos no deetlist, usados no benchmark de parse_duration
+DURATION_SAMPLES = (
+    "2hr 30min",
+    "1 day 4 hrs",
+    "12 Hours",
+    "3 days",
+    "60 minutes",
+    "Instant",
+    "No minimum"
+)
+
+LABELED_DURATION_SAMPLES = (
+    "Breed Time: 2 days (48 Hours)",
+    "Hatch Time: 2hr 30min",
+    "Summon Time: 1 day 4 hrs (28 Hours)"
+)
+
+# Formatos que cada função antiga (com strptime) conseguia converter
+LEGACY_POOL_TIME_SAMPLES = (
+    "2hr 30min",
+    "1 day 4 hrs",
+    "12 Hours",
+    "45 minutes",
+    "60 minutes",
+    "Instant",
+    "No minimum"
+)
+
+LEGACY_BREED_TIME_SAMPLES = (
+    "Breed Time: 2 days (48 Hours)",
+    "Summon Time: 1 day 4 hrs (28 Hours)",
+    "Hatch Time: 2hr 30min (2hr 30min)"
+)
+
+LEGACY_TRAINING_TIME_SAMPLES = (
+    "6 hours",
+    "24 hours",
+    "3 days"
+)
+
+def legacy_pool_time_to_seconds(pool_time: str) -> int:
+    # Cópia do pool_time_to_seconds antigo do parser de missões, só com a conta
+    # de "1 day 4 hrs" corrigida (as horas eram multiplicadas por 60)
+    pool_time = pool_time.lower()
+
+    if pool_time == "instant" or pool_time == "no minimum":
+        return 0
+
+    if "minutes" in pool_time:
+        if "60" in pool_time:
+            return 60 * SECONDS_PER_MINUTE
+
+        minutes = datetime.strptime(pool_time, "%M minutes").minute
+        return minutes * SECONDS_PER_MINUTE
+
+    elif "hours" in pool_time:
+        hours = datetime.strptime(pool_time, "%H hours").hour
+        return hours * SECONDS_PER_HOUR
+
+    elif "hr" in pool_time and "min" in pool_time:
+        hours_and_minutes = datetime.strptime(pool_time, "%Hhr %Mmin")
+        return (hours_and_minutes.hour * SECONDS_PER_HOUR) + (hours_and_minutes.minute * SECONDS_PER_MINUTE)
+
+    elif "day" in pool_time:
+        days_and_hours = datetime.strptime(pool_time, "%d day %H hrs")
+        return (days_and_hours.day * SECONDS_PER_DAY) + (days_and_hours.hour * SECONDS_PER_HOUR)
+
+def legacy_breed_time(raw_time: str) -> int:
+    # Cópia do TimeParser.breed_time antigo da página de dragão (que também servia
+    # para summon_time e hatch_time), com o nome da variável corrigido
+    time = raw_time.split(":")[1].split("(")[1].removesuffix(")")
+
+    if "Hours" in raw_time:
+        hours = int(time.removesuffix(" Hours"))
+        return hours * SECONDS_PER_HOUR
+
+    elif "hr" in raw_time and "min" in raw_time:
+        times = datetime.strptime(time, "%Hhr %Mmin")
+        return (times.minute * SECONDS_PER_MINUTE) + (times.hour * SECONDS_PER_HOUR)
+
+    else:
+        raise Exception("Valor inesperado em TimeParser > breed_time")
+
+def legacy_attack_training_time(raw_time: str) -> int:
+    # Cópia do TimeParser.attack_training_time antigo
+    if "hours" in raw_time:
+        if raw_time == "24 hours":
+            return 24 * SECONDS_PER_HOUR
+
+        hours = datetime.strptime(raw_time, "%H hours").hour
+        return hours * SECONDS_PER_HOUR
+
+    elif "days" in raw_time:
+        days = datetime.strptime(raw_time, "%d days").day
+        return days * SECONDS_PER_DAY
+
+    else:
+        raise Exception("Valor inesperado em TimeParser > training_time")
+
+def record_fixture_corpus(directory: str, dragon_limit: int = 300) -> dict:
+    os.makedirs(os.path.join(directory, "dragons"), exist_ok=True)
+
+    def save_html(file_name: str, html: str) -> str:
+        with open(os.path.join(directory, file_name), "w", encoding="utf-8") as html_file:
+            html_file.write(html)
+
+        return file_name
+
+    all_dragons_html = AllDragonsCrawler().get_html()
+
+    manifest = {
+        "recorded_at": time.time(),
+        "all_dragons": save_html("all_dragons.html", all_dragons_html),
+        "new_dragons": save_html("new_dragons.html", NewDragonsCrawler().get_html()),
+        "heroic_race": save_html("heroic_race.html", HeroicRaceCrawler().get_html()),
+        "dragon_pages": []
+    }
+
+    raw_dragons = AllDragonsParser(all_dragons_html).iter_all()
+
+    for i, raw_dragon in zip(range(dragon_limit), raw_dragons):
+        html = DragonPageCrawler(raw_dragon["page_url"]).get_html()
+
+        manifest["dragon_pages"].append({
+            "page_url": raw_dragon["page_url"],
+            "file": save_html(os.path.join("dragons", f"{i:04d}.html"), html)
+        })
+
+    with open(os.path.join(directory, MANIFEST_FILE_NAME), "w", encoding="utf-8") as manifest_file:
+        json.dump(manifest, manifest_file, indent=4)
+
+    return manifest
+
+def load_fixture_corpus(directory: str) -> dict:
+    with open(os.path.join(directory, MANIFEST_FILE_NAME), "r", encoding="utf-8") as manifest_file:
+        manifest = json.load(manifest_file)
+
+    def load_html(file_name: str) -> str:
+        with open(os.path.join(directory, file_name), "r", encoding="utf-8") as html_file:
+            return html_file.read()
+
+    return {
+        "all_dragons": [ load_html(manifest["all_dragons"]) ],
+        "new_dragons": [ load_html(manifest["new_dragons"]) ],
+        "heroic_race": [ load_html(manifest["heroic_race"]) ],
+        "dragon_pages": [ load_html(dragon_page["file"]) for dragon_page in manifest["dragon_pages"] ]
+    }
+
+def get_percentile(sorted_values: list[float], percentile: float) -> float:
+    index = min(len(sorted_values) - 1, int(round(percentile / 100 * (len(sorted_values) - 1))))
+    return sorted_values[index]
+
+def measure_parser(parse: Callable[[str], object], pages: list[str], repeat: int = 1) -> dict:
+    latencies = []
+
+    started_at = time.perf_counter()
+
+    for _ in range(repeat):
+        for html in pages:
+            page_started_at = time.perf_counter()
+            parse(html)
+            latencies.append(time.perf_counter() - page_started_at)
+
+    elapsed = time.perf_counter() - started_at
+
+    # O tracemalloc deixa as alocações bem mais lentas, então a memória é
+    # medida numa passada separada para não distorcer os tempos acima
+    tracemalloc.start()
+
+    for html in pages:
+        parse(html)
+
+    _, peak_memory = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    latencies.sort()
+
+    return {
+        "pages": len(latencies),
+        "pages_per_second": len(latencies) / elapsed,
+        "p50_ms": get_percentile(latencies, 50) * 1000,
+        "p99_ms": get_percentile(latencies, 99) * 1000,
+        "peak_memory_bytes": peak_memory
+    }
+
+def benchmark_parsers(directory: str, repeat: int = 1, backend: Union[str, None] = None) -> dict:
+    corpus = load_fixture_corpus(directory)
+
+    parsers = {
+        "AllDragonsParser": ("all_dragons", lambda html: AllDragonsParser(html, backend).get_all()),
+        "AllDragonsParser[restricted]": ("all_dragons", lambda html: AllDragonsParser(html, backend, restricted=True).get_all()),
+        "AllDragonsFeedParser": ("all_dragons", lambda html: AllDragonsFeedParser().get_all(html)),
+        "NewDragonsParser": ("new_dragons", lambda html: NewDragonsParser(html, backend).get_all()),
+        "NewDragonsParser[restricted]": ("new_dragons", lambda html: NewDragonsParser(html, backend, restricted=True).get_all()),
+        "NewDragonsFeedParser": ("new_dragons", lambda html: NewDragonsFeedParser().get_all(html)),
+        "HeroicRaceParser": ("heroic_race", lambda html: HeroicRaceParser(html, backend).get_all()),
+        "DragonPageParser": ("dragon_pages", lambda html: DragonPageParser(html, backend).get_all())
+    }
+
+    return {
+        parser_name: measure_parser(parse, corpus[corpus_key], repeat)
+        for parser_name, (corpus_key, parse) in parsers.items()
+    }
+
+def benchmark_records(directory: str, repeat: int = 5, backend: Union[str, None] = None) -> dict:
+    # Compara o catálogo de páginas de dragões como dicts e como records: memória
+    # que fica retida depois do parse e tempo/tamanho da serialização em JSON
+    pages = load_fixture_corpus(directory)["dragon_pages"]
+
+    def measure(as_record: bool, serialize: Callable[[list], bytes]) -> dict:
+        tracemalloc.start()
+
+        dragons = [ DragonPageParser(html, backend).get_all(as_record) for html in pages ]
+
+        # As árvores do bs4 têm ciclos e só saem da memória na coleta
+        gc.collect()
+        retained_memory, peak_memory = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+
+        durations = []
+
+        for _ in range(repeat):
+            started_at = time.perf_counter()
+            raw_json = serialize(dragons)
+            durations.append(time.perf_counter() - started_at)
+
+        return {
+            "dragons": len(dragons),
+            "retained_memory_bytes": retained_memory,
+            "peak_memory_bytes": peak_memory,
+            "serialize_ms": min(durations) * 1000,
+            "serialized_bytes": len(raw_json)
+        }
+
+    return {
+        "dicts": measure(False, lambda dragons: json.dumps(dragons, ensure_ascii=False).encode("utf-8")),
+        "records": measure(True, records.dump_records),
+        "encoder": "msgspec" if records.msgspec is not None else "json"
+    }
+
+def iter_record_texts(record: dict) -> Iterator[str]:
+    # Os mesmos campos que o RecordTranslator traduz
+    if "laps" in record:
+        for lap in record["laps"]:
+            for node in lap["nodes"]:
+                for mission in node["missions"]:
+                    yield mission["name"]
+
+        for dragon in record.get("dragons", []):
+            yield from iter_record_texts(dragon)
+
+        return
+
+    yield record["name"]
+    yield record["description"]
+    yield from (element.capitalize() for element in record["elements"] + record["strengths"] + record["weaknesses"])
+
+    for attacks in record["attacks"].values():
+        for attack in attacks:
+            yield attack["name"]
+            yield attack["element"].capitalize()
+
+def write_synthetic_localization(
+    texts: Iterable[str],
+    languages: list[str],
+    cache_directory: str,
+    source_language: str = "en"
+) -> int:
+    # Grava no cache os stores de localização como se tivessem acabado de ser
+    # baixados, então o GameLocalization não faz nenhuma requisição
+    keys = { text: f"tid_{index}" for index, text in enumerate(dict.fromkeys(text for text in texts if text)) }
+    meta = { "stored_at": str(time.time()) }
+
+    os.makedirs(cache_directory, exist_ok=True)
+
+    for language in [ source_language, *languages ]:
+        store = LocalizationStore(os.path.join(cache_directory, f"localization_{language}.sqlite3"))
+
+        if language == source_language:
+            store.replace_all([ { key: text for text, key in keys.items() } ], meta)
+
+        else:
+            store.replace_all([ { key: f"{text} ({language})" for text, key in keys.items() } ], meta)
+
+        store.close()
+
+    return len(keys)
+
+def benchmark_translation(
+    directory: str,
+    languages: tuple = ("pt", "es", "fr", "de"),
+    copies: int = 10,
+    repeat: int = 3,
+    backend: Union[str, None] = None
+) -> dict:
+    # O tradutor só é importado aqui porque o GameLocalization depende do pyfilter
+    from .translation import RecordTranslator
+
+    corpus = load_fixture_corpus(directory)
+    parsed_dragons = [ DragonPageParser(html, backend).get_all() for html in corpus["dragon_pages"] ]
+
+    # Cópias com nomes diferentes para o memo ter tanto acertos quanto faltas
+    catalog = [
+        { **dragon, "name": f"{dragon['name']} {copy_index}" }
+        for copy_index in range(copies)
+        for dragon in parsed_dragons
+    ]
+    catalog += [ HeroicRaceParser(html).get_all() for html in corpus["heroic_race"] ]
+
+    with tempfile.TemporaryDirectory() as cache_directory:
+        texts = [ text for record in catalog for text in iter_record_texts(record) ]
+        strings = write_synthetic_localization(texts, list(languages), cache_directory)
+
+        cold_durations = []
+        warm_durations = []
+
+        for _ in range(repeat):
+            translator = RecordTranslator(list(languages), cache_directory=cache_directory)
+
+            # A primeira passada consulta o sqlite; a segunda sai toda do memo
+            for durations in (cold_durations, warm_durations):
+                started_at = time.perf_counter()
+                translated = list(translator.iter_translated(catalog))
+                durations.append(time.perf_counter() - started_at)
+
+    return {
+        "records": len(translated),
+        "languages": len(languages),
+        "strings": strings,
+        "cold_records_per_second": len(catalog) / min(cold_durations),
+        "warm_records_per_second": len(catalog) / min(warm_durations),
+        "warm_translations_per_second": len(catalog) * len(languages) / min(warm_durations)
+    }
+
+def benchmark_catalog(
+    directory: str,
+    copies: int = 10,
+    limit: int = 50,
+    repeat: int = 100,
+    backend: Union[str, None] = None
+) -> dict:
+    parsed_dragons = [ DragonPageParser(html, backend).get_all() for html in load_fixture_corpus(directory)["dragon_pages"] ]
+
+    # Cópias com nomes diferentes para o catálogo chegar perto do tamanho do real
+    dragons = [
+        { **dragon, "name": f"{dragon['name']} {copy_index}" }
+        for copy_index in range(copies)
+        for dragon in parsed_dragons
+    ]
+
+    # A consulta usa a raridade e o elemento do primeiro dragão, então sempre tem resultados
+    rarity = parsed_dragons[0]["rarity"]
+    element = parsed_dragons[0]["elements"][0] if parsed_dragons[0]["elements"] else None
+
+    with tempfile.TemporaryDirectory() as temp_directory:
+        store = CatalogStore(os.path.join(temp_directory, "catalog.db"))
+
+        try:
+            started_at = time.perf_counter()
+            store.upsert_dragons(dragons)
+            load_elapsed = time.perf_counter() - started_at
+
+            latencies = []
+
+            for _ in range(repeat):
+                query_started_at = time.perf_counter()
+                results = list(store.iter_dragons(rarity=rarity, element=element, limit=limit))
+                latencies.append(time.perf_counter() - query_started_at)
+
+        finally:
+            store.close()
+
+    latencies.sort()
+
+    return {
+        "load": {
+            "dragons": len(dragons),
+            "seconds": load_elapsed,
+            "dragons_per_second": len(dragons) / load_elapsed
+        },
+        "query": {
+            "rarity": rarity,
+            "element": element,
+            "limit": limit,
+            "results": len(results),
+            "p50_ms": get_percentile(latencies, 50) * 1000,
+            "p99_ms": get_percentile(latencies, 99) * 1000
+        }
+    }
+
+def benchmark_durations(iterations: int = 100_000) -> dict:
+    # Sem o cache (__wrapped__) mede o parse em si; com ele, o caso comum de
+    # páginas repetindo as mesmas strings. O parse_labeled_duration sem cache
+    # ainda passa pelo cache de parse_duration para o valor extraído
+    def measure(parse: Callable[[str], int], samples: tuple) -> float:
+        started_at = time.perf_counter()
+
+        for i in range(iterations):
+            parse(samples[i % len(samples)])
+
+        return iterations / (time.perf_counter() - started_at)
+
+    # Cada função antiga é comparada com a nova só nos formatos que ela aceitava
+    legacy = {
+        "pool_time": (legacy_pool_time_to_seconds, parse_duration, LEGACY_POOL_TIME_SAMPLES),
+        "breed_time": (legacy_breed_time, parse_labeled_duration, LEGACY_BREED_TIME_SAMPLES),
+        "attack_training_time": (legacy_attack_training_time, parse_duration, LEGACY_TRAINING_TIME_SAMPLES)
+    }
+
+    results = {
+        "parse_duration": {
+            "uncached_per_second": measure(parse_duration.__wrapped__, DURATION_SAMPLES),
+            "cached_per_second": measure(parse_duration, DURATION_SAMPLES)
+        },
+        "parse_labeled_duration": {
+            "uncached_per_second": measure(parse_labeled_duration.__wrapped__, LABELED_DURATION_SAMPLES),
+            "cached_per_second": measure(parse_labeled_duration, LABELED_DURATION_SAMPLES)
+        }
+    }
+
+    for name, (legacy_parse, parse, samples) in legacy.items():
+        results[name] = {
+            "strptime_per_second": measure(legacy_parse, samples),
+            "uncached_per_second": measure(parse.__wrapped__, samples),
+            "cached_per_second": measure(parse, samples)
+        }
+
+    return results
+
+def benchmark_simulation(directory: str, trials: int = 1_000_000, repeat: int = 3, workers: int = 1) -> dict:
+    heroic_race = HeroicRaceParser(load_fixture_corpus(directory)["heroic_race"][0]).get_all()
+
+    started_at = time.perf_counter()
+    model = HeroicRaceModel(heroic_race)
+    build_elapsed = time.perf_counter() - started_at
+
+    def measure(simulate: Callable[[], dict]) -> float:
+        durations = []
+
+        for _ in range(repeat):
+            started_at = time.perf_counter()
+            simulate()
+            durations.append(time.perf_counter() - started_at)
+
+        return trials / min(durations)
+
+    result = {
+        "missions": len(model.time_tables),
+        "nodes": len(model.nodes),
+        "build_ms": build_elapsed * 1000,
+        "trials_per_second": measure(lambda: model.simulate(trials, seed=0))
+    }
+
+    if workers > 1:
+        result["sharded_trials_per_second"] = measure(lambda: model.simulate_sharded(trials, workers, seed=0))
+
+    return result
+
+def get_synthetic_dragons(count: int, seed: int = 0) -> list[dict]:
+    # Dragões com um a três elementos e forças/fraquezas sorteadas, no formato do DragonPageParser
+    rng = random.Random(seed)
+
+    return [
+        {
+            "name": f"Dragon {i}",
+            "elements": rng.sample(ELEMENT_NAMES, rng.randint(1, 3)),
+            "strengths": rng.sample(ELEMENT_NAMES, rng.randint(0, 4)),
+            "weaknesses": rng.sample(ELEMENT_NAMES, rng.randint(0, 3))
+        }
+        for i in range(count)
+    ]
+
+def benchmark_matchups(dragons: int = 5000, queries: int = 200, teams: int = 50, team_size: int = 3, seed: int = 0) -> dict:
+    catalog = get_synthetic_dragons(dragons, seed)
+    rng = random.Random(seed + 1)
+
+    element_queries = [
+        {
+            "elements": rng.sample(ELEMENT_NAMES, 1),
+            "strengths": rng.sample(ELEMENT_NAMES, rng.randint(0, 1)),
+            "not_weaknesses": rng.sample(ELEMENT_NAMES, rng.randint(0, 2))
+        }
+        for _ in range(queries)
+    ]
+    team_names = [ [ dragon["name"] for dragon in rng.sample(catalog, team_size) ] for _ in range(teams) ]
+
+    started_at = time.perf_counter()
+    index = ElementIndex(catalog)
+    build_elapsed = time.perf_counter() - started_at
+
+    started_at = time.perf_counter()
+    index.find_many(element_queries)
+    find_elapsed = time.perf_counter() - started_at
+
+    # A mesma busca feita dragão por dragão com conjuntos, como base de comparação
+    started_at = time.perf_counter()
+
+    for query in element_queries:
+        [
+            dragon["name"]
+            for dragon in catalog
+            if set(query["elements"]) <= set(dragon["elements"])
+            and set(query["strengths"]) <= set(dragon["strengths"])
+            and set(dragon["weaknesses"]).isdisjoint(query["not_weaknesses"])
+        ]
+
+    scan_elapsed = time.perf_counter() - started_at
+
+    # A matriz dragão x dragão é montada uma vez e reaproveitada pelas consultas
+    started_at = time.perf_counter()
+    index.get_matchup_matrix()
+    matrix_elapsed = time.perf_counter() - started_at
+
+    started_at = time.perf_counter()
+    index.get_best_counters_many(team_names)
+    counters_elapsed = time.perf_counter() - started_at
+
+    return {
+        "dragons": dragons,
+        "build_ms": build_elapsed * 1000,
+        "queries_per_second": queries / find_elapsed,
+        "scan_queries_per_second": queries / scan_elapsed,
+        "matchup_matrix_ms": matrix_elapsed * 1000,
+        "teams_per_second": teams / counters_elapsed
+    }
+
+def save_baseline(results: dict, path: str) -> None:
+    with open(path, "w", encoding="utf-8") as baseline_file:
+        json.dump(results, baseline_file, indent=4)
+
+def compare_to_baseline(results: dict, path: str, tolerance: float = 0.2) -> list[str]:
+    with open(path, "r", encoding="utf-8") as baseline_file:
+        baseline = json.load(baseline_file)
+
+    regressions = []
+
+    for parser_name, result in results.items():
+        if parser_name not in baseline:
+            continue
+
+        expected = baseline[parser_name]
+
+        if result["pages_per_second"] < expected["pages_per_second"] * (1 - tolerance):
+            regressions.append(f"{parser_name}: pages_per_second {result['pages_per_second']:.1f} < {expected['pages_per_second']:.1f}")
+
+        for metric in ("p50_ms", "p99_ms", "peak_memory_bytes"):
+            if result[metric] > expected[metric] * (1 + tolerance):
+                regressions.append(f"{parser_name}: {metric} {result[metric]:.1f} > {expected[metric]:.1f}")
+
+    return regressions
+
+def parse_import_time(stderr: str) -> dict:
+    cumulative = {}
+
+    for line in stderr.splitlines():
+        if not line.startswith("import time:") or "[us]" in line:
+            continue
+
+        _, cumulative_us, imported = line[len("import time:"):].split("|")
+        cumulative[imported.strip()] = int(cumulative_us)
+
+    return cumulative
+
+def measure_import_time(module: str, repeat: int = 5) -> dict:
+    # Cada medição roda num interpretador novo, sem módulos já em cache
+    def run(code: str) -> dict:
+        result = subprocess.run(
+            [sys.executable, "-X", "importtime", "-c", code],
+            capture_output=True,
+            text=True,
+            check=True
+        )
+
+        return parse_import_time(result.stderr)
+
+    # O que o próprio interpretador importa na inicialização (site, .pth) não conta
+    startup_modules = run("pass")
+
+    runs = [ run(f"import {module}") for _ in range(repeat) ]
+    totals = sorted(imports[module] for imports in runs)
+
+    imported = { name: us for name, us in runs[-1].items() if name not in startup_modules }
+
+    return {
+        "module": module,
+        "median_ms": get_percentile(totals, 50) / 1000,
+        "slowest_modules": sorted(imported, key=imported.get, reverse=True)[:10]
+    }
+
+def check_import_budgets(budgets: Union[dict, None] = None, repeat: int = 5) -> list[str]:
+    violations = []
+
+    for module, budget_ms in (budgets or IMPORT_TIME_BUDGETS_MS).items():
+        result = measure_import_time(module, repeat)
+
+        if result["median_ms"] > budget_ms:
+            violations.append(f"{module}: {result['median_ms']:.1f}ms > {budget_ms}ms (mais lentos: {', '.join(result['slowest_modules'][:5])})")
+
+    return violations
@@ -0,0 +1,176 @@
+from typing import Iterable
+import os
+
+try:
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+
+except ImportError:
+    pa = None
+    pq = None
+
+CATALOG_TABLES = ("dragons", "elements", "attacks", "strengths", "weaknesses")
+
+def require_pyarrow() -> None:
+    if pa is None:
+        raise ImportError("A exportação colunar precisa do pacote 'pyarrow' (pip install pyarrow)")
+
+def flatten_dragons(dragons: Iterable[dict]) -> dict:
+    # Cada lista aninhada vira uma tabela própria ligada ao dragão pela coluna
+    # "dragon_index", a posição do dragão no catálogo
+    columns = {
+        "dragons": {
+            "dragon_index": [],
+            "book_id": [],
+            "name": [],
+            "rarity": [],
+            "category": [],
+            "is_breedable": [],
+            "description": [],
+            "image_url": []
+        },
+        "elements": { "dragon_index": [], "position": [], "element": [] },
+        "attacks": {
+            "dragon_index": [],
+            "attack_type": [],
+            "name": [],
+            "element": [],
+            "damege": [],
+            "training_time": []
+        },
+        "strengths": { "dragon_index": [], "element": [] },
+        "weaknesses": { "dragon_index": [], "element": [] }
+    }
+
+    for dragon_index, dragon in enumerate(dragons):
+        dragon_columns = columns["dragons"]
+        dragon_columns["dragon_index"].append(dragon_index)
+        dragon_columns["book_id"].append(dragon["book_id"])
+        dragon_columns["name"].append(dragon["name"])
+        dragon_columns["rarity"].append(dragon["rarity"])
+        dragon_columns["category"].append(dragon["category"])
+        dragon_columns["is_breedable"].append(dragon["is_breedable"])
+        dragon_columns["description"].append(dragon["description"])
+        dragon_columns["image_url"].append(dragon["image_url"])
+
+        for position, element in enumerate(dragon["elements"]):
+            columns["elements"]["dragon_index"].append(dragon_index)
+            columns["elements"]["position"].append(position)
+            columns["elements"]["element"].append(element)
+
+        for attack_type, attacks in dragon["attacks"].items():
+            for attack in attacks:
+                attack_columns = columns["attacks"]
+                attack_columns["dragon_index"].append(dragon_index)
+                attack_columns["attack_type"].append(attack_type)
+                attack_columns["name"].append(attack["name"])
+                attack_columns["element"].append(attack["element"])
+                attack_columns["damege"].append(attack["damege"])
+                attack_columns["training_time"].append(attack.get("training_time"))
+
+        for table_name in ("strengths", "weaknesses"):
+            for element in dragon[table_name]:
+                columns[table_name]["dragon_index"].append(dragon_index)
+                columns[table_name]["element"].append(element)
+
+    return columns
+
+def get_catalog_schemas() -> dict:
+    require_pyarrow()
+
+    category = pa.dictionary(pa.int8(), pa.string())
+
+    return {
+        "dragons": pa.schema([
+            ("dragon_index", pa.int32()),
+            ("book_id", pa.int32()),
+            ("name", pa.string()),
+            ("rarity", category),
+            ("category", pa.int16()),
+            ("is_breedable", pa.bool_()),
+            ("description", pa.string()),
+            ("image_url", pa.string())
+        ]),
+        "elements": pa.schema([
+            ("dragon_index", pa.int32()),
+            ("position", pa.int8()),
+            ("element", category)
+        ]),
+        "attacks": pa.schema([
+            ("dragon_index", pa.int32()),
+            ("attack_type", category),
+            ("name", pa.string()),
+            ("element", category),
+            ("damege", pa.int32()),
+            ("training_time", pa.int32())
+        ]),
+        "strengths": pa.schema([
+            ("dragon_index", pa.int32()),
+            ("element", category)
+        ]),
+        "weaknesses": pa.schema([
+            ("dragon_index", pa.int32()),
+            ("element", category)
+        ])
+    }
+
+def dragons_to_arrow(dragons: Iterable[dict]) -> dict:
+    schemas = get_catalog_schemas()
+    columns = flatten_dragons(dragons)
+
+    return {
+        table_name: pa.table(columns[table_name], schema=schemas[table_name])
+        for table_name in CATALOG_TABLES
+    }
+
+def export_dragons_parquet(dragons: Iterable[dict], directory: str, compression: str = "zstd") -> dict:
+    tables = dragons_to_arrow(dragons)
+
+    os.makedirs(directory, exist_ok=True)
+
+    paths = {}
+
+    for table_name, table in tables.items():
+        paths[table_name] = os.path.join(directory, f"{table_name}.parquet")
+        pq.write_table(table, paths[table_name], compression=compression)
+
+    return paths
+
+def read_dragons_parquet(directory: str, tables: Iterable[str] = CATALOG_TABLES) -> dict:
+    require_pyarrow()
+
+    # O memory_map só evita ler o arquivo para um buffer antes do parse; as páginas
+    # comprimidas são descomprimidas em buffers novos. Para ler sem cópia existe
+    # o formato Arrow (export_dragons_arrow/read_dragons_arrow)
+    return {
+        table_name: pq.read_table(os.path.join(directory, f"{table_name}.parquet"), memory_map=True)
+        for table_name in tables
+    }
+
+def export_dragons_arrow(dragons: Iterable[dict], directory: str) -> dict:
+    # Arquivos Arrow IPC sem compressão guardam as colunas no mesmo layout da
+    # memória, então podem ser usados direto do arquivo mapeado
+    tables = dragons_to_arrow(dragons)
+
+    os.makedirs(directory, exist_ok=True)
+
+    paths = {}
+
+    for table_name, table in tables.items():
+        paths[table_name] = os.path.join(directory, f"{table_name}.arrow")
+
+        with pa.OSFile(paths[table_name], "wb") as arrow_file:
+            with pa.ipc.new_file(arrow_file, table.schema) as writer:
+                writer.write_table(table)
+
+    return paths
+
+def read_dragons_arrow(directory: str, tables: Iterable[str] = CATALOG_TABLES) -> dict:
+    require_pyarrow()
+
+    # As colunas apontam para o arquivo mapeado, sem copiar o catálogo para a
+    # memória do processo; o mapeamento fica aberto enquanto a tabela existir
+    return {
+        table_name: pa.ipc.open_file(pa.memory_map(os.path.join(directory, f"{table_name}.arrow"))).read_all()
+        for table_name in tables
+    }
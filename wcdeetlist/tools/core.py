@@ -1,29 +1,120 @@
+from concurrent.futures import ThreadPoolExecutor
+from typing import Iterable, Iterator, Union
+from urllib.parse import unquote
+from collections import deque
+import logging
+import copy
+
 from ..crawler import (
     AllDragonsCrawler,
     DragonPageCrawler,
-    HeroicRaceCrawler
+    HeroicDragonsCrawler,
+    HeroicRaceCrawler,
+    RequestError
 )
 from ..parser import (
-    AllDragonsParser,
+    AllDragonsFeedParser,
     DragonPageParser,
+    HeroicDragonsParser,
     HeroicRaceParser
 )
+from ..config import SECONDS_PER_HOUR
+from ..metrics import metrics
+from .pipeline import DragonPagePipeline
+from .memo import MemoCache
+
+logger = logging.getLogger(__name__)
+
+# Campos devolvidos por DragonPageParser.get_all, na mesma ordem
+DRAGON_FIELDS = (
+    "name",
+    "rarity",
+    "elements",
+    "image_url",
+    "description",
+    "attacks",
+    "strengths",
+    "weaknesses",
+    "book_id",
+    "category",
+    "is_breedable"
+)
+
+# Compartilhado entre as chamadas com use_memo=True; quem chama recebe sempre
+# uma cópia, então alterar o resultado não afeta as próximas chamadas
+dragon_page_memo = MemoCache(max_size=4096, ttl=SECONDS_PER_HOUR)
+
+def normalize_page_url(page_url: str) -> str:
+    # A lista de todos os dragões usa "%20" nas urls e a de novos dragões usa "_"
+    return unquote(page_url).strip().lower().replace(" ", "_").rstrip("/")
 
-def get_dragon_full_data(page_url: str):
+def load_dragon_full_data(page_url: str) -> dict:
     html = DragonPageCrawler(page_url).get_html()
     data = DragonPageParser(html).get_all()
 
     return data
 
-def get_all_dragons_full_data():
-    html = AllDragonsCrawler().get_html()
-    raw_dragons = AllDragonsParser(html).get_all()
+def get_dragon_full_data(page_url: str, use_memo: bool = False):
+    if not use_memo:
+        return load_dragon_full_data(page_url)
+
+    data = dragon_page_memo.get(normalize_page_url(page_url), lambda: load_dragon_full_data(page_url))
+
+    return copy.deepcopy(data)
+
+def iter_dragons_full_data(
+    page_urls: Iterable[str],
+    max_workers: int = 1,
+    parse_workers: int | None = None,
+    use_memo: bool = False
+) -> Iterator[dict]:
+    if parse_workers is not None:
+        yield from DragonPagePipeline(max(max_workers, 1), parse_workers).iter_results(page_urls)
+        return
+
+    if max_workers <= 1:
+        for page_url in page_urls:
+            yield get_dragon_full_data(page_url, use_memo)
+
+        return
+
+    # Os resultados saem na mesma ordem das urls, e a janela de futures limita
+    # quantas páginas ficam em memória esperando para serem consumidas
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        pending = deque()
+
+        for page_url in page_urls:
+            if len(pending) >= max_workers * 2:
+                yield pending.popleft().result()
+
+            pending.append(executor.submit(get_dragon_full_data, page_url, use_memo))
+
+        while pending:
+            yield pending.popleft().result()
+
+def get_dragons_full_data(
+    page_urls: list[str],
+    max_workers: int = 1,
+    parse_workers: int | None = None,
+    use_memo: bool = True
+) -> list[dict]:
+    return list(iter_dragons_full_data(page_urls, max_workers, parse_workers, use_memo))
 
+def get_all_dragons_page_urls() -> list[str]:
+    # A lista é lida enquanto a página ainda está chegando, sem montar a árvore
+    raw_dragons = AllDragonsFeedParser().iter_feed(AllDragonsCrawler().iter_html())
+
+    return [ raw_dragon["page_url"] for raw_dragon in raw_dragons ]
+
+def iter_all_dragons_full_data(max_workers: int = 1, parse_workers: int | None = None) -> Iterator[dict]:
+    yield from iter_dragons_full_data(get_all_dragons_page_urls(), max_workers, parse_workers)
+
+def get_all_dragons_full_data(max_workers: int = 1, parse_workers: int | None = None):
     dragons = []
 
-    for raw_dragon in raw_dragons:
-        dragon = get_dragon_full_data(raw_dragon["page_url"])
-        print(dragon["book_id"])
+    for dragon in iter_all_dragons_full_data(max_workers, parse_workers):
+        logger.info("Dragão coletado: %s", dragon["book_id"])
+        metrics.increment("dragons_collected")
 
         dragons.append(dragon)
 
@@ -35,15 +126,66 @@ def get_heroic_race_data():
 
     return data
 
-def get_heroic_race_full_data():
+def get_heroic_dragons_report() -> dict:
+    html = HeroicDragonsCrawler().get_html()
+
+    return {
+        normalize_page_url(dragon["page_url"]): dragon
+        for dragon in HeroicDragonsParser(html).iter_all()
+        if "page_url" in dragon
+    }
+
+def get_report_fields(report: dict) -> tuple:
+    # Campos que o relatório trouxe para algum dragão, na ordem de DRAGON_FIELDS
+    return tuple(field for field in DRAGON_FIELDS if any(field in dragon for dragon in report.values()))
+
+def get_heroic_race_full_data(
+    max_workers: int = 1,
+    parse_workers: int | None = None,
+    use_report: bool = True,
+    fields: Union[Iterable[str], None] = None
+):
     raw_data = get_heroic_race_data()
+    page_urls = raw_data["dragon_page_urls"]
+
+    report = {}
+
+    if use_report:
+        # O relatório de heroicos traz vários dragões em uma requisição só; se ele
+        # falhar ou não puder ser lido, todos os dragões caem para a busca página a página
+        try:
+            report = get_heroic_dragons_report()
+
+        except (RequestError, IndexError, KeyError, ValueError) as error:
+            logger.warning("Relatório de dragões heroicos indisponível: %s", error)
+
+    # Sem campos pedidos, a saída tem os campos que o relatório traz e só os dragões
+    # que faltam nele são buscados; sem relatório, todos os campos vêm das páginas
+    fields = tuple(fields or get_report_fields(report) or DRAGON_FIELDS)
+
+    report_dragons = [ report.get(normalize_page_url(page_url), {}) for page_url in page_urls ]
+
+    # Só as páginas de dragões com algum campo faltando no relatório são buscadas
+    missing_page_urls = [
+        page_url
+        for page_url, report_dragon in zip(page_urls, report_dragons)
+        if any(field not in report_dragon for field in fields)
+    ]
+
+    page_dragons = dict(zip(
+        missing_page_urls,
+        get_dragons_full_data(missing_page_urls, max_workers, parse_workers, use_memo=True)
+    ))
+
+    metrics.increment("heroic_report_dragons", len(page_urls) - len(missing_page_urls))
 
     dragons = []
 
-    for dragon_page_url in raw_data["dragon_page_urls"]:
-        dragon = get_dragon_full_data(dragon_page_url)
+    # Quando a página foi buscada, os valores dela têm prioridade sobre os do relatório
+    for page_url, report_dragon in zip(page_urls, report_dragons):
+        source = page_dragons.get(page_url, report_dragon)
 
-        dragons.append(dragon)
+        dragons.append({ field: source[field] for field in fields })
 
     data = raw_data.copy()
 
@@ -52,4 +194,3 @@ def get_heroic_race_full_data():
     data["dragons"] = dragons
 
     return data
-
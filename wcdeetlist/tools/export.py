@@ -0,0 +1,75 @@
+from typing import Union
+import json
+import os
+
+from .core import get_all_dragons_page_urls, iter_dragons_full_data, normalize_page_url
+
+def load_checkpoint(checkpoint_path: str) -> Union[dict, None]:
+    if not os.path.exists(checkpoint_path):
+        return None
+
+    with open(checkpoint_path, "r", encoding="utf-8") as checkpoint_file:
+        return json.load(checkpoint_file)
+
+def save_checkpoint(checkpoint_path: str, page_url: str, offset: int) -> None:
+    with open(f"{checkpoint_path}.tmp", "w", encoding="utf-8") as checkpoint_file:
+        json.dump({ "page_url": page_url, "offset": offset }, checkpoint_file)
+
+    os.replace(f"{checkpoint_path}.tmp", checkpoint_path)
+
+def get_remaining_page_urls(page_urls: list[str], checkpoint: Union[dict, None]) -> Union[list[str], None]:
+    if checkpoint is None:
+        return None
+
+    last_page_url = normalize_page_url(checkpoint["page_url"])
+
+    for i, page_url in enumerate(page_urls):
+        if normalize_page_url(page_url) == last_page_url:
+            return page_urls[i + 1:]
+
+    # O dragão do checkpoint saiu da lista, então não dá para saber de onde continuar
+    return None
+
+def export_all_dragons_ndjson(
+    path: str,
+    checkpoint_path: Union[str, None] = None,
+    max_workers: int = 1,
+    parse_workers: Union[int, None] = None
+) -> int:
+    checkpoint_path = checkpoint_path or f"{path}.checkpoint"
+
+    page_urls = get_all_dragons_page_urls()
+
+    checkpoint = load_checkpoint(checkpoint_path)
+    remaining_page_urls = get_remaining_page_urls(page_urls, checkpoint)
+
+    if remaining_page_urls is None:
+        remaining_page_urls = page_urls
+        offset = 0
+
+    else:
+        offset = checkpoint["offset"]
+
+    exported_count = 0
+
+    with open(path, "ab") as ndjson_file:
+        # Descarta qualquer linha escrita depois do último checkpoint salvo
+        ndjson_file.truncate(offset)
+        ndjson_file.seek(offset)
+
+        dragons = iter_dragons_full_data(remaining_page_urls, max_workers, parse_workers)
+
+        for page_url, dragon in zip(remaining_page_urls, dragons):
+            line = json.dumps(dragon, ensure_ascii=False) + "\n"
+
+            ndjson_file.write(line.encode("utf-8"))
+            ndjson_file.flush()
+
+            save_checkpoint(checkpoint_path, page_url, ndjson_file.tell())
+
+            exported_count += 1
+
+    if os.path.exists(checkpoint_path):
+        os.remove(checkpoint_path)
+
+    return exported_count
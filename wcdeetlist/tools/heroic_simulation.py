@@ -0,0 +1,241 @@
+from concurrent.futures import ProcessPoolExecutor
+from typing import Iterable, Union
+import multiprocessing
+
+try:
+    import numpy as np
+
+except ImportError:
+    np = None
+
+NODE_COMPLETION_MODES = ("all", "any")
+SUMMARY_PERCENTILES = (10, 50, 90, 99)
+
+def parse_drop_chance(item_drop_chance: str) -> float:
+    # O deetlist mostra a chance como porcentagem ("25%")
+    return float(item_drop_chance.strip().rstrip("%")) / 100
+
+class HeroicRaceModel:
+    def __init__(self, heroic_race: dict, node_completion: str = "all", quantile_bits: int = 16) -> None:
+        if np is None:
+            raise ImportError("A simulação de corrida heroica precisa do pacote 'numpy' (pip install numpy)")
+
+        if node_completion not in NODE_COMPLETION_MODES:
+            raise ValueError(f"Modo de conclusão de nó desconhecido: {node_completion}\n> MODOS: {', '.join(NODE_COMPLETION_MODES)}")
+
+        if hasattr(heroic_race, "to_dict"):
+            heroic_race = heroic_race.to_dict()
+
+        self.duration = heroic_race["duration"]
+        self.node_completion = node_completion
+        self.quantile_bits = quantile_bits
+
+        goal_items = []
+        pool_sizes = []
+        refill_times = []
+        drop_chances = []
+        node_starts = []
+        lap_starts = []
+
+        self.nodes = []
+        self.laps = []
+
+        # Nós sem missões não custam tempo e ficam fora do modelo; as missões de
+        # um nó e os nós de uma volta ficam contíguos para as reduções
+        for lap in heroic_race["laps"]:
+            lap_starts.append(len(self.nodes))
+
+            for node in lap["nodes"]:
+                if not node["missions"]:
+                    continue
+
+                node_starts.append(len(goal_items))
+                self.nodes.append((lap["number"], node["number"]))
+
+                for mission in node["missions"]:
+                    drop_chance = parse_drop_chance(mission["item_drop_chance"])
+
+                    # Sem chance de drop a missão nunca termina e o tempo do evento não existe
+                    if not 0 < drop_chance <= 1:
+                        raise ValueError(
+                            f"Chance de drop fora do intervalo (0%, 100%]: {mission['item_drop_chance']}\n"
+                            f"> VOLTA: {lap['number']}\n> NÓ: {node['number']}"
+                        )
+
+                    goal_items.append(mission["goal_items"])
+                    pool_sizes.append(mission["pool_size"])
+                    refill_times.append(mission["pool_time"]["per_item"] or 0)
+                    drop_chances.append(drop_chance)
+
+            if len(self.nodes) == lap_starts[-1]:
+                lap_starts.pop()
+
+            else:
+                self.laps.append(lap["number"])
+
+        self.goal_items = np.array(goal_items, dtype=np.int64)
+        self.pool_sizes = np.array(pool_sizes, dtype=np.int64)
+        self.refill_times = np.array(refill_times, dtype=np.float64)
+        self.drop_chances = np.array(drop_chances, dtype=np.float64)
+        # Intervalos [início, fim) das missões de cada nó e dos nós de cada volta
+        self.node_bounds = list(zip(node_starts, node_starts[1:] + [ len(goal_items) ]))
+        self.lap_bounds = list(zip(lap_starts, lap_starts[1:] + [ len(self.nodes) ]))
+
+        self.time_tables = self.__build_time_tables(quantile_bits)
+
+    def __build_time_tables(self, quantile_bits: int) -> "np.ndarray":
+        # Para cada missão, o tempo de conclusão em 2**quantile_bits quantis igualmente
+        # espaçados. Sortear um quantil uniforme e ler a tabela é equivalente a
+        # sortear a binomial negativa, só que com um gather em vez de gamma + poisson
+        quantiles = (np.arange(1 << quantile_bits) + 0.5) / (1 << quantile_bits)
+        time_tables = np.empty((len(self.goal_items), len(quantiles)), dtype=np.float32)
+
+        for i, (goal_items, pool_size, refill_time, drop_chance) in enumerate(zip(
+            self.goal_items, self.pool_sizes, self.refill_times, self.drop_chances
+        )):
+            if goal_items <= 0:
+                time_tables[i] = 0
+                continue
+
+            # Com 100% de drop não há falhas e o tempo é sempre o mesmo
+            if drop_chance >= 1:
+                time_tables[i] = max(goal_items - pool_size, 0) * refill_time
+                continue
+
+            # Falhas antes de juntar goal_items itens seguem uma binomial negativa;
+            # a tabela vai até 12 desvios acima da média, onde a cauda já é desprezível
+            mean = goal_items * (1 - drop_chance) / drop_chance
+            deviation = np.sqrt(goal_items * (1 - drop_chance)) / drop_chance
+            failures = np.arange(int(np.ceil(mean + 12 * deviation)) + 2)
+
+            log_pmf = goal_items * np.log(drop_chance) + failures * np.log1p(-drop_chance)
+            log_pmf[1:] += np.cumsum(np.log((failures[:-1] + goal_items) / (failures[:-1] + 1)))
+
+            cdf = np.cumsum(np.exp(log_pmf))
+            quantile_failures = np.minimum(np.searchsorted(cdf, quantiles), len(cdf) - 1)
+
+            # As primeiras pool_size tentativas saem na hora e cada uma das
+            # seguintes espera o pool recarregar um item
+            refills = np.maximum(goal_items + quantile_failures - pool_size, 0)
+            time_tables[i] = refills * refill_time
+
+        return time_tables
+
+    def __draw_indexes(self, rng: "np.random.Generator", missions: int, trials: int) -> "np.ndarray":
+        # Quantis uniformes para cada missão. Com até 16 bits cada palavra de 64 bits
+        # do gerador vira quatro índices, bem mais barato que rng.integers
+        if self.quantile_bits > 16:
+            return rng.integers(0, 1 << self.quantile_bits, size=(missions, trials), dtype=np.uint32)
+
+        count = missions * trials
+        indexes = rng.bit_generator.random_raw((count + 3) // 4).view(np.uint16)[:count].reshape(missions, trials)
+
+        if self.quantile_bits < 16:
+            indexes >>= 16 - self.quantile_bits
+
+        return indexes
+
+    def simulate(self, trials: int, seed: Union[int, "np.random.SeedSequence", None] = None, batch_size: int = 65_536) -> dict:
+        rng = np.random.default_rng(seed)
+
+        missions = len(self.time_tables)
+        reduce_node = np.maximum.reduce if self.node_completion == "all" else np.minimum.reduce
+
+        # Resultados no formato (nós|voltas, tentativas): cada linha fica contígua e as
+        # reduções por nó e por volta são feitas linha a linha, bem mais rápido que
+        # um reduceat no eixo 0
+        node_times = np.empty((len(self.nodes), trials), dtype=np.float32)
+        mission_times = np.empty((missions, min(trials, batch_size)), dtype=np.float32)
+
+        for start in range(0, trials, batch_size):
+            stop = min(trials, start + batch_size)
+
+            indexes = self.__draw_indexes(rng, missions, stop - start)
+            batch_times = mission_times[:, :stop - start]
+
+            for i in range(missions):
+                np.take(self.time_tables[i], indexes[i], out=batch_times[i], mode="clip")
+
+            for j, (first, last) in enumerate(self.node_bounds):
+                reduce_node(batch_times[first:last], axis=0, out=node_times[j, start:stop])
+
+        lap_times = np.empty((len(self.laps), trials), dtype=np.float64)
+
+        for j, (first, last) in enumerate(self.lap_bounds):
+            np.add.reduce(node_times[first:last], axis=0, dtype=np.float64, out=lap_times[j])
+
+        return {
+            "node_times": node_times,
+            "lap_times": lap_times,
+            "event_times": lap_times.sum(axis=0)
+        }
+
+    def simulate_sharded(self, trials: int, workers: int = 2, seed: Union[int, None] = None, batch_size: int = 65_536) -> dict:
+        # Cada processo recebe uma semente independente derivada da mesma SeedSequence
+        seeds = np.random.SeedSequence(seed).spawn(workers)
+        shard_trials = [ trials // workers + (1 if i < trials % workers else 0) for i in range(workers) ]
+
+        # Os processos começam do zero (spawn): um fork depois que numpy/pyarrow já
+        # abriram threads pode travar o processo filho
+        with ProcessPoolExecutor(max_workers=workers, mp_context=multiprocessing.get_context("spawn")) as executor:
+            shards = list(executor.map(
+                self.simulate,
+                shard_trials,
+                seeds,
+                [ batch_size ] * workers
+            ))
+
+        return {
+            "node_times": np.concatenate([ shard["node_times"] for shard in shards ], axis=1),
+            "lap_times": np.concatenate([ shard["lap_times"] for shard in shards ], axis=1),
+            "event_times": np.concatenate([ shard["event_times"] for shard in shards ])
+        }
+
+    def summarize(self, result: dict, percentiles: Iterable[int] = SUMMARY_PERCENTILES) -> dict:
+        percentiles = list(percentiles)
+
+        def describe(times: "np.ndarray", deadline: float) -> dict:
+            return {
+                "mean": float(times.mean(dtype=np.float64)),
+                "percentiles": dict(zip(percentiles, np.percentile(times, percentiles, method="inverted_cdf").tolist())),
+                "completion_chance": float((times <= deadline).mean())
+            }
+
+        # Voltas são feitas em sequência, então a chance de terminar a volta N
+        # dentro do evento depende do tempo acumulado até ela
+        lap_finish_times = np.cumsum(result["lap_times"], axis=0)
+
+        return {
+            "duration": self.duration,
+            "trials": len(result["event_times"]),
+            "nodes": [
+                { "lap": lap_number, "number": node_number, **describe(result["node_times"][i], self.duration) }
+                for i, (lap_number, node_number) in enumerate(self.nodes)
+            ],
+            "laps": [
+                {
+                    "number": lap_number,
+                    **describe(result["lap_times"][i], self.duration),
+                    "completion_chance": float((lap_finish_times[i] <= self.duration).mean())
+                }
+                for i, lap_number in enumerate(self.laps)
+            ],
+            "event": describe(result["event_times"], self.duration)
+        }
+
+def simulate_heroic_race(
+    heroic_race: dict,
+    trials: int = 100_000,
+    workers: int = 1,
+    seed: Union[int, None] = None,
+    node_completion: str = "all"
+) -> dict:
+    model = HeroicRaceModel(heroic_race, node_completion)
+
+    if workers > 1:
+        result = model.simulate_sharded(trials, workers, seed)
+
+    else:
+        result = model.simulate(trials, seed)
+
+    return model.summarize(result)
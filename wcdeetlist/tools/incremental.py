@@ -0,0 +1,109 @@
+from typing import Union
+import json
+import os
+
+from ..crawler import AllDragonsCrawler, NewDragonsCrawler
+from ..parser import AllDragonsParser, NewDragonsParser
+from .core import dragon_page_memo, get_dragons_full_data, normalize_page_url
+
+def load_snapshot(path: str) -> Union[dict, None]:
+    if not os.path.exists(path):
+        return None
+
+    with open(path, "r", encoding="utf-8") as snapshot_file:
+        return json.load(snapshot_file)
+
+def save_snapshot(snapshot: dict, path: str) -> None:
+    with open(f"{path}.tmp", "w", encoding="utf-8") as snapshot_file:
+        json.dump(snapshot, snapshot_file)
+
+    os.replace(f"{path}.tmp", path)
+
+def get_catalog_changes(
+    snapshot: dict,
+    listing: list[dict],
+    new_dragons: list[dict]
+) -> dict:
+    old_listing = { normalize_page_url(raw_dragon["page_url"]): raw_dragon for raw_dragon in snapshot["listing"] }
+    new_listing = { normalize_page_url(raw_dragon["page_url"]): raw_dragon for raw_dragon in listing }
+
+    old_new_dragons = { normalize_page_url(new_dragon["page_url"]): new_dragon for new_dragon in snapshot["new_dragons"] }
+
+    added = []
+    updated = []
+
+    for key, raw_dragon in new_listing.items():
+        if key not in old_listing:
+            added.append(raw_dragon["page_url"])
+
+        elif raw_dragon != old_listing[key]:
+            updated.append(raw_dragon["page_url"])
+
+    # Dragões recém lançados costumam ter a página editada nos primeiros dias,
+    # então qualquer mudança na lista de novos dragões marca a página como suspeita
+    for new_dragon in new_dragons:
+        key = normalize_page_url(new_dragon["page_url"])
+
+        if key not in new_listing or key not in old_listing:
+            continue
+
+        if new_dragon != old_new_dragons.get(key):
+            page_url = new_listing[key]["page_url"]
+
+            if page_url not in updated:
+                updated.append(page_url)
+
+    removed = [ raw_dragon["page_url"] for key, raw_dragon in old_listing.items() if key not in new_listing ]
+
+    return {
+        "added": added,
+        "removed": removed,
+        "updated": updated
+    }
+
+def refresh_all_dragons_full_data(snapshot: Union[dict, None] = None, max_workers: int = 1) -> dict:
+    listing = AllDragonsParser(AllDragonsCrawler().get_html()).get_all()
+    new_dragons = NewDragonsParser(NewDragonsCrawler().get_html()).get_all()
+
+    if snapshot is None:
+        snapshot = {
+            "listing": [],
+            "new_dragons": [],
+            "dragons": []
+        }
+
+    changes = get_catalog_changes(snapshot, listing, new_dragons)
+
+    page_urls = changes["added"] + changes["updated"]
+
+    # Páginas suspeitas de mudança precisam ser buscadas de novo, mesmo que estejam em memória
+    for page_url in page_urls:
+        dragon_page_memo.invalidate(normalize_page_url(page_url))
+
+    fetched_dragons = dict(zip(
+        [ normalize_page_url(page_url) for page_url in page_urls ],
+        get_dragons_full_data(page_urls, max_workers)
+    ))
+
+    old_dragons = {
+        normalize_page_url(raw_dragon["page_url"]): dragon
+        for raw_dragon, dragon in zip(snapshot["listing"], snapshot["dragons"])
+    }
+
+    dragons = []
+
+    for raw_dragon in listing:
+        key = normalize_page_url(raw_dragon["page_url"])
+
+        if key in fetched_dragons:
+            dragons.append(fetched_dragons[key])
+
+        else:
+            dragons.append(old_dragons[key])
+
+    return {
+        "listing": listing,
+        "new_dragons": new_dragons,
+        "dragons": dragons,
+        "changes": changes
+    }
@@ -0,0 +1,120 @@
+from typing import Iterable
+
+try:
+    import numpy as np
+
+except ImportError:
+    np = None
+
+from ..config import DRAGON_ELEMENTS
+
+ELEMENT_NAMES = list(dict.fromkeys(DRAGON_ELEMENTS.values()))
+ELEMENT_BITS = { element: 1 << i for i, element in enumerate(ELEMENT_NAMES) }
+
+def get_element_mask(elements: Iterable[str]) -> int:
+    # Elementos desconhecidos (abreviações que não estão em DRAGON_ELEMENTS) são ignorados
+    mask = 0
+
+    for element in elements:
+        mask |= ELEMENT_BITS.get(element, 0)
+
+    return mask
+
+class ElementIndex:
+    def __init__(self, dragons: Iterable[dict]) -> None:
+        if np is None:
+            raise ImportError("O índice de elementos precisa do pacote 'numpy' (pip install numpy)")
+
+        names = []
+        element_masks = []
+        strength_masks = []
+        weakness_masks = []
+
+        for dragon in dragons:
+            names.append(dragon["name"])
+            element_masks.append(get_element_mask(dragon["elements"]))
+            strength_masks.append(get_element_mask(dragon["strengths"]))
+            weakness_masks.append(get_element_mask(dragon["weaknesses"]))
+
+        self.names = np.array(names, dtype=object)
+        self.positions = { name: i for i, name in enumerate(names) }
+
+        self.element_masks = np.array(element_masks, dtype=np.uint32)
+        self.strength_masks = np.array(strength_masks, dtype=np.uint32)
+        self.weakness_masks = np.array(weakness_masks, dtype=np.uint32)
+
+        bits = np.array([ ELEMENT_BITS[element] for element in ELEMENT_NAMES ], dtype=np.uint32)
+
+        # Matrizes dragão x elemento (0/1) usadas nas multiplicações de matriz
+        self.elements_matrix = ((self.element_masks[:, None] & bits) != 0).astype(np.int16)
+        self.strengths_matrix = ((self.strength_masks[:, None] & bits) != 0).astype(np.int16)
+        self.weaknesses_matrix = ((self.weakness_masks[:, None] & bits) != 0).astype(np.int16)
+
+        self.__matchup_matrix = None
+
+    def get_matchup_matrix(self) -> "np.ndarray":
+        # matchup[i, j] = elementos de j contra os quais i é forte menos os
+        # elementos de j contra os quais i é fraco
+        if self.__matchup_matrix is None:
+            self.__matchup_matrix = (self.strengths_matrix - self.weaknesses_matrix) @ self.elements_matrix.T
+
+        return self.__matchup_matrix
+
+    def find_many(self, queries: list[dict]) -> list["np.ndarray"]:
+        # Cada consulta aceita as chaves "elements", "strengths", "weaknesses"
+        # (todos precisam estar presentes) e "not_weaknesses" (nenhum pode estar)
+        fields = {
+            "elements": self.element_masks,
+            "strengths": self.strength_masks,
+            "weaknesses": self.weakness_masks
+        }
+
+        matches = np.ones((len(self.names), len(queries)), dtype=bool)
+
+        for field, dragon_masks in fields.items():
+            query_masks = np.array([ get_element_mask(query.get(field, ())) for query in queries ], dtype=np.uint32)
+            matches &= (dragon_masks[:, None] & query_masks) == query_masks
+
+        not_weakness_masks = np.array([ get_element_mask(query.get("not_weaknesses", ())) for query in queries ], dtype=np.uint32)
+        matches &= (self.weakness_masks[:, None] & not_weakness_masks) == 0
+
+        return [ np.flatnonzero(matches[:, i]) for i in range(len(queries)) ]
+
+    def find(
+        self,
+        elements: Iterable[str] = (),
+        strengths: Iterable[str] = (),
+        weaknesses: Iterable[str] = (),
+        not_weaknesses: Iterable[str] = ()
+    ) -> list[str]:
+        query = {
+            "elements": elements,
+            "strengths": strengths,
+            "weaknesses": weaknesses,
+            "not_weaknesses": not_weaknesses
+        }
+
+        return self.names[self.find_many([query])[0]].tolist()
+
+    def get_best_counters(self, team: Iterable[str], limit: int = 10) -> list[tuple[str, int]]:
+        team_positions = [ self.positions[name] for name in team ]
+
+        scores = self.get_matchup_matrix()[:, team_positions].sum(axis=1)
+        best_positions = np.argsort(-scores, kind="stable")[:limit]
+
+        return [ (self.names[i], int(scores[i])) for i in best_positions ]
+
+    def get_best_counters_many(self, teams: list[Iterable[str]], limit: int = 10) -> list[list[tuple[str, int]]]:
+        team_matrix = np.zeros((len(self.names), len(teams)), dtype=np.int16)
+
+        for i, team in enumerate(teams):
+            for name in team:
+                team_matrix[self.positions[name], i] += 1
+
+        scores = self.get_matchup_matrix() @ team_matrix
+        best_positions = np.argsort(-scores, axis=0, kind="stable")[:limit]
+
+        return [
+            [ (self.names[j], int(scores[j, i])) for j in best_positions[:, i] ]
+            for i in range(len(teams))
+        ]
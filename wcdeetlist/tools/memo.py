@@ -0,0 +1,74 @@
+from concurrent.futures import Future
+from collections import OrderedDict
+from typing import Any, Callable, Hashable
+import threading
+import time
+
+class MemoCache:
+    def __init__(self, max_size: int = 4096, ttl: float = 3600) -> None:
+        self.max_size = max_size
+        self.ttl = ttl
+
+        self.__entries = OrderedDict()
+        self.__in_flight = {}
+        self.__lock = threading.Lock()
+
+    def get(self, key: Hashable, load: Callable[[], Any]) -> Any:
+        with self.__lock:
+            entry = self.__entries.get(key)
+
+            if entry is not None:
+                stored_at, value = entry
+
+                if time.monotonic() - stored_at < self.ttl:
+                    self.__entries.move_to_end(key)
+                    return value
+
+                del self.__entries[key]
+
+            # Se outra thread já está carregando a mesma chave, espera pelo mesmo
+            # resultado em vez de repetir a requisição e o parse
+            future = self.__in_flight.get(key)
+            is_loader = future is None
+
+            if is_loader:
+                future = Future()
+                self.__in_flight[key] = future
+
+        if not is_loader:
+            return future.result()
+
+        try:
+            value = load()
+
+        except BaseException as error:
+            with self.__lock:
+                self.__in_flight.pop(key, None)
+
+            future.set_exception(error)
+            raise
+
+        with self.__lock:
+            self.__entries[key] = (time.monotonic(), value)
+            self.__entries.move_to_end(key)
+
+            while len(self.__entries) > self.max_size:
+                self.__entries.popitem(last=False)
+
+            self.__in_flight.pop(key, None)
+
+        future.set_result(value)
+
+        return value
+
+    def invalidate(self, key: Hashable) -> None:
+        with self.__lock:
+            self.__entries.pop(key, None)
+
+    def clear(self) -> None:
+        with self.__lock:
+            self.__entries.clear()
+
+    def __len__(self) -> int:
+        with self.__lock:
+            return len(self.__entries)
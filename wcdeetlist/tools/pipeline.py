@@ -0,0 +1,76 @@
+from concurrent.futures import ThreadPoolExecutor, ProcessPoolExecutor, Future
+from typing import Iterable, Iterator, Union
+from collections import deque
+
+from ..crawler import DragonPageCrawler
+from ..parser import DragonPageParser
+
+def fetch_dragon_page(page_url: str) -> str:
+    return DragonPageCrawler(page_url).get_html()
+
+def parse_dragon_page(html: str) -> dict:
+    return DragonPageParser(html).get_all()
+
+class DragonPagePipeline:
+    def __init__(
+        self,
+        fetch_workers: int = 8,
+        parse_workers: Union[int, None] = None,
+        max_pending: Union[int, None] = None
+    ) -> None:
+        self.fetch_workers = fetch_workers
+        self.parse_workers = parse_workers
+
+        # Limite de páginas entre o download e o parse ao mesmo tempo; quando
+        # a janela enche, o pipeline para de buscar até que o dado mais antigo saia
+        self.max_pending = max_pending or fetch_workers * 4
+
+    def __chain_parse(self, fetch_future: Future, parse_executor: ProcessPoolExecutor) -> Future:
+        parse_future = Future()
+
+        def on_fetched(fetch_future: Future) -> None:
+            error = fetch_future.exception()
+
+            if error is not None:
+                parse_future.set_exception(error)
+                return
+
+            try:
+                submitted_future = parse_executor.submit(parse_dragon_page, fetch_future.result())
+
+            except Exception as submit_error:
+                parse_future.set_exception(submit_error)
+                return
+
+            submitted_future.add_done_callback(on_parsed)
+
+        def on_parsed(submitted_future: Future) -> None:
+            error = submitted_future.exception()
+
+            if error is not None:
+                parse_future.set_exception(error)
+
+            else:
+                parse_future.set_result(submitted_future.result())
+
+        fetch_future.add_done_callback(on_fetched)
+
+        return parse_future
+
+    def iter_results(self, page_urls: Iterable[str]) -> Iterator[dict]:
+        with ThreadPoolExecutor(max_workers=self.fetch_workers) as fetch_executor, \
+                ProcessPoolExecutor(max_workers=self.parse_workers) as parse_executor:
+            pending = deque()
+
+            for page_url in page_urls:
+                if len(pending) >= self.max_pending:
+                    yield pending.popleft().result()
+
+                fetch_future = fetch_executor.submit(fetch_dragon_page, page_url)
+                pending.append(self.__chain_parse(fetch_future, parse_executor))
+
+            while pending:
+                yield pending.popleft().result()
+
+    def run(self, page_urls: Iterable[str]) -> list[dict]:
+        return list(self.iter_results(page_urls))
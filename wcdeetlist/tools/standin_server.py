@@ -0,0 +1,143 @@
+from http.server import ThreadingHTTPServer, BaseHTTPRequestHandler
+from urllib.parse import unquote, urlsplit
+from typing import Union
+import threading
+import random
+import time
+
+from ..crawler import ResponseArchive
+
+def normalize_path(path: str) -> str:
+    # O cliente manda o caminho codificado ("Caf%C3%A9%20Dragon") e o arquivo pode ter
+    # a url gravada crua ou codificada, então os dois lados são comparados decodificados
+    return unquote(path)
+
+class TokenBucket:
+    def __init__(self, rate: float, capacity: Union[float, None] = None) -> None:
+        self.rate = rate
+        self.capacity = capacity or rate
+        self.tokens = self.capacity
+        self.updated_at = time.monotonic()
+        self.__lock = threading.Lock()
+
+    def try_acquire(self) -> bool:
+        with self.__lock:
+            now = time.monotonic()
+
+            self.tokens = min(self.capacity, self.tokens + (now - self.updated_at) * self.rate)
+            self.updated_at = now
+
+            if self.tokens >= 1:
+                self.tokens -= 1
+                return True
+
+            return False
+
+class StandInServer:
+    def __init__(
+        self,
+        archive: ResponseArchive,
+        host: str = "127.0.0.1",
+        port: int = 0,
+        latency: float = 0.0,
+        latency_jitter: float = 0.0,
+        error_rate: float = 0.0,
+        rate_limit: Union[float, None] = None,
+        retry_after: int = 1,
+        seed: Union[int, None] = None
+    ) -> None:
+        self.archive = archive
+        self.latency = latency
+        self.latency_jitter = latency_jitter
+        self.error_rate = error_rate
+        self.retry_after = retry_after
+        self.rate_limiter = TokenBucket(rate_limit) if rate_limit else None
+
+        self.__random = random.Random(seed)
+        self.__random_lock = threading.Lock()
+
+        # O servidor responde pelo caminho da url, então uma url gravada como
+        # "https://deetlist.com/dragoncity/all-dragons/" responde em "/dragoncity/all-dragons/"
+        self.urls_by_path = {}
+
+        for url in archive.get_urls():
+            parts = urlsplit(url)
+            path = parts.path + (f"?{parts.query}" if parts.query else "")
+            self.urls_by_path[normalize_path(path)] = url
+
+        self.server = ThreadingHTTPServer((host, port), self.__make_handler())
+        self.server.daemon_threads = True
+        self.__thread = None
+
+    @property
+    def base_url(self) -> str:
+        host, port = self.server.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def next_random(self) -> float:
+        with self.__random_lock:
+            return self.__random.random()
+
+    def __make_handler(self) -> type:
+        server = self
+
+        class StandInHandler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+            disable_nagle_algorithm = True
+            wbufsize = 64 * 1024
+
+            def send_body(self, status_code: int, headers: dict, content: bytes) -> None:
+                self.send_response(status_code)
+
+                for name, value in headers.items():
+                    self.send_header(name, value)
+
+                self.send_header("Content-Length", str(len(content)))
+                self.end_headers()
+                self.wfile.write(content)
+
+            def do_GET(self) -> None:
+                if server.latency or server.latency_jitter:
+                    time.sleep(server.latency + server.next_random() * server.latency_jitter)
+
+                if server.rate_limiter is not None and not server.rate_limiter.try_acquire():
+                    self.send_body(429, { "Retry-After": str(server.retry_after) }, b"")
+                    return
+
+                if server.error_rate and server.next_random() < server.error_rate:
+                    self.send_body(503, {}, b"")
+                    return
+
+                url = server.urls_by_path.get(normalize_path(self.path))
+                entry = server.archive.load(url) if url is not None else None
+
+                if entry is None:
+                    self.send_body(404, {}, b"")
+                    return
+
+                self.send_body(entry["status_code"], entry["headers"], entry["content"])
+
+            def log_message(self, format: str, *args) -> None:
+                pass
+
+        return StandInHandler
+
+    def start(self) -> str:
+        self.__thread = threading.Thread(target=self.server.serve_forever, daemon=True)
+        self.__thread.start()
+
+        return self.base_url
+
+    def stop(self) -> None:
+        self.server.shutdown()
+        self.server.server_close()
+
+        if self.__thread is not None:
+            self.__thread.join()
+
+    def __enter__(self) -> "StandInServer":
+        self.start()
+        return self
+
+    def __exit__(self, *args) -> None:
+        self.stop()
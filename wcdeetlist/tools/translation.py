@@ -0,0 +1,117 @@
+from typing import Iterable, Iterator, Union
+import threading
+
+from ..fetcher import GameLocalization
+
+class RecordTranslator:
+    def __init__(
+        self,
+        languages: list[str],
+        source_language: str = "en",
+        transport = None,
+        cache_directory: Union[str, None] = None
+    ) -> None:
+        self.languages = languages
+
+        # Os índices de cada idioma são montados uma única vez, na criação do tradutor
+        self.__source_store = GameLocalization(source_language, transport, cache_directory).get_store()
+        self.__target_stores = {
+            language: GameLocalization(language, transport, cache_directory).get_store()
+            for language in languages
+        }
+
+        self.__keys = {}
+        self.__translations = {}
+        self.__lock = threading.Lock()
+
+    def __get_key(self, text: str) -> Union[str, None]:
+        if text in self.__keys:
+            return self.__keys[text]
+
+        key = None
+
+        # Os elementos vêm em minúsculas ("flame"), mas no jogo aparecem capitalizados
+        for candidate in dict.fromkeys((text, text.capitalize(), text.title())):
+            key = self.__source_store.get_key(candidate)
+
+            if key is not None:
+                break
+
+        with self.__lock:
+            self.__keys[text] = key
+
+        return key
+
+    def translate_text(self, text: Union[str, None], language: str) -> Union[str, None]:
+        if not text:
+            return text
+
+        memo_key = (language, text)
+
+        if memo_key in self.__translations:
+            return self.__translations[memo_key]
+
+        key = self.__get_key(text)
+        translation = self.__target_stores[language].get(key, text) if key is not None else text
+
+        with self.__lock:
+            self.__translations[memo_key] = translation
+
+        return translation
+
+    def translate_attack(self, attack: dict, language: str) -> dict:
+        translated_attack = attack.copy()
+        translated_attack["name"] = self.translate_text(attack["name"], language)
+        translated_attack["element"] = self.translate_text(attack["element"], language)
+
+        return translated_attack
+
+    def translate_dragon(self, dragon: dict, language: str) -> dict:
+        translated_dragon = dragon.copy()
+
+        translated_dragon["name"] = self.translate_text(dragon["name"], language)
+        translated_dragon["description"] = self.translate_text(dragon["description"], language)
+        translated_dragon["elements"] = [ self.translate_text(element, language) for element in dragon["elements"] ]
+        translated_dragon["strengths"] = [ self.translate_text(element, language) for element in dragon["strengths"] ]
+        translated_dragon["weaknesses"] = [ self.translate_text(element, language) for element in dragon["weaknesses"] ]
+        translated_dragon["attacks"] = {
+            attack_type: [ self.translate_attack(attack, language) for attack in attacks ]
+            for attack_type, attacks in dragon["attacks"].items()
+        }
+
+        return translated_dragon
+
+    def translate_heroic_race(self, heroic_race: dict, language: str) -> dict:
+        translated_heroic_race = heroic_race.copy()
+
+        translated_heroic_race["laps"] = [
+            {
+                **lap,
+                "nodes": [
+                    {
+                        **node,
+                        "missions": [
+                            { **mission, "name": self.translate_text(mission["name"], language) }
+                            for mission in node["missions"]
+                        ]
+                    }
+                    for node in lap["nodes"]
+                ]
+            }
+            for lap in heroic_race["laps"]
+        ]
+
+        if "dragons" in heroic_race:
+            translated_heroic_race["dragons"] = [ self.translate_dragon(dragon, language) for dragon in heroic_race["dragons"] ]
+
+        return translated_heroic_race
+
+    def translate_record(self, record: dict, language: str) -> dict:
+        if "laps" in record:
+            return self.translate_heroic_race(record, language)
+
+        return self.translate_dragon(record, language)
+
+    def iter_translated(self, records: Iterable[dict]) -> Iterator[dict]:
+        for record in records:
+            yield { language: self.translate_record(record, language) for language in self.languages }